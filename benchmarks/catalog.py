@@ -91,6 +91,18 @@ class ReadCatalogBench(Bench):
         for _, _, _ in catalog.walk():
             pass
 
+    def peakmem_read_and_walk_items(self) -> None:
+        catalog = Catalog.from_file(self.path)
+        for _, _, items in catalog.walk():
+            for _ in items:
+                pass
+
+    def peakmem_read_and_walk_items_release(self) -> None:
+        catalog = Catalog.from_file(self.path)
+        for _, _, items in catalog.walk(release=True):
+            for _ in items:
+                pass
+
 
 class WriteCatalogBench(Bench):
     def setup(self) -> None:
@@ -104,15 +116,32 @@ class WriteCatalogBench(Bench):
         self.catalog.normalize_and_save(self.temporary_directory.name)
 
 
-def make_large_catalog() -> Catalog:
+class NormalizeHrefsBench(Bench):
+    params = [10_000, 1_000_000]
+    param_names = ["n_items"]
+    # Building a tree of a million items takes a while
+    timeout = 600
+
+    def setup(self, n_items: int) -> None:
+        self.catalog = make_large_catalog(n_collections=100, n_items=n_items // 100)
+
+    def time_normalize_hrefs(self, n_items: int) -> None:
+        """Set the HREFs of all objects of a tree read from memory."""
+        self.catalog.normalize_hrefs("/tmp/catalog")
+
+    def peakmem_normalize_hrefs(self, n_items: int) -> None:
+        self.catalog.normalize_hrefs("/tmp/catalog")
+
+
+def make_large_catalog(n_collections: int = 10, n_items: int = 100) -> Catalog:
     catalog = Catalog("an-id", "a description")
     extent = Extent(
         SpatialExtent([[-180.0, -90.0, 180.0, 90.0]]),
         TemporalExtent([[datetime(2023, 1, 1), None]]),
     )
-    for i in range(0, 10):
+    for i in range(0, n_collections):
         collection = Collection(f"collection-{i}", f"Collection {i}", extent)
-        for j in range(0, 100):
+        for j in range(0, n_items):
             item = Item(f"item-{i}-{j}", None, None, datetime.now(), {})
             collection.add_item(item)
         catalog.add_child(collection)
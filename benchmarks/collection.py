@@ -3,7 +3,7 @@ import os
 import shutil
 import tempfile
 
-from pystac import Collection, StacIO
+from pystac import Collection, RangeSummary, StacIO
 
 from ._base import Bench
 from ._util import get_data_path
@@ -42,3 +42,9 @@ class CollectionBench(Bench):
             dest_href=os.path.join(self.temp_dir, "time_collection_save.json"),
             stac_io=self.stac_io,
         )
+
+
+class RangeSummaryBench(Bench):
+    def peakmem_range_summaries(self) -> None:
+        """Keep many range summaries in memory."""
+        _ = [RangeSummary(minimum=i, maximum=i + 1) for i in range(100_000)]
@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+from pystac import Asset, Item, ItemCollection
+
+from ._base import Bench
+
+
+class GeoParquetBench(Bench):
+    params = [10_000]
+    param_names = ["n_items"]
+
+    def setup(self, n_items: int) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        items = []
+        for i in range(n_items):
+            x, y = i % 360 - 180, (i // 360) % 180 - 90
+            item = Item(
+                f"item-{i}",
+                {"type": "Point", "coordinates": [x, y]},
+                [x, y, x, y],
+                datetime(2020, 1, 1) + timedelta(minutes=i),
+                {"eo:cloud_cover": i % 100},
+            )
+            item.add_asset("data", Asset(f"https://example.com/{i}.tif"))
+            items.append(item)
+        self.item_collection = ItemCollection(items, clone_items=False)
+        self.json_path = os.path.join(self.temp_dir, "items.json")
+        self.parquet_path = os.path.join(self.temp_dir, "items.parquet")
+        self.item_collection.save_object(self.json_path)
+        self.item_collection.to_parquet(self.parquet_path)
+
+    def teardown(self, n_items: int) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def time_write_json(self, n_items: int) -> None:
+        """Write all items to one GeoJSON FeatureCollection."""
+        self.item_collection.save_object(self.json_path)
+
+    def time_write_parquet(self, n_items: int) -> None:
+        """Write all items to stac-geoparquet."""
+        self.item_collection.to_parquet(self.parquet_path)
+
+    def time_read_json(self, n_items: int) -> None:
+        """Read all items from one GeoJSON FeatureCollection."""
+        ItemCollection.from_file(self.json_path)
+
+    def time_read_parquet(self, n_items: int) -> None:
+        """Read all items from stac-geoparquet."""
+        ItemCollection.from_parquet(self.parquet_path)
+
+    def time_read_parquet_filtered(self, n_items: int) -> None:
+        """Read the items of one day from stac-geoparquet."""
+        ItemCollection.from_parquet(self.parquet_path, datetime="2020-01-02/2020-01-03")
+
+    def track_parquet_size_ratio(self, n_items: int) -> float:
+        """Size of the stac-geoparquet file relative to the GeoJSON file."""
+        return os.path.getsize(self.parquet_path) / os.path.getsize(self.json_path)
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+from pystac import Item, ItemCollection
+from pystac.index import Interval, SpatialIndex, TemporalIndex
+
+from ._base import Bench
+
+START = datetime(2020, 1, 1)
+
+
+def make_intervals(n: int) -> list[Interval | None]:
+    # Mostly instants, with one interval in ten spanning a week
+    intervals: list[Interval | None] = []
+    for i in range(n):
+        start = START + timedelta(minutes=i)
+        end = start + timedelta(days=7) if i % 10 == 0 else start
+        intervals.append((start, end))
+    return intervals
+
+
+def make_bboxes(n: int) -> list[list[float]]:
+    side = int(n**0.5) + 1
+    return [
+        [x * 0.1, y * 0.1, x * 0.1 + 0.1, y * 0.1 + 0.1]
+        for x in range(side)
+        for y in range(side)
+    ][:n]
+
+
+class TemporalIndexBench(Bench):
+    params = [10_000, 1_000_000]
+    param_names = ["n_items"]
+
+    def setup(self, n_items: int) -> None:
+        self.intervals = make_intervals(n_items)
+        self.index = TemporalIndex((iv, i) for i, iv in enumerate(self.intervals))
+
+    def time_build(self, n_items: int) -> None:
+        """Index the intervals of all items."""
+        _ = TemporalIndex((iv, i) for i, iv in enumerate(self.intervals))
+
+    def time_search(self, n_items: int) -> None:
+        """Find the items of one day."""
+        _ = self.index.search("2020-01-02T00:00:00Z/2020-01-03T00:00:00Z")
+
+
+class SpatialIndexBench(Bench):
+    params = [10_000, 1_000_000]
+    param_names = ["n_items"]
+
+    def setup(self, n_items: int) -> None:
+        self.bboxes = make_bboxes(n_items)
+        self.index = SpatialIndex((bbox, i) for i, bbox in enumerate(self.bboxes))
+
+    def time_build(self, n_items: int) -> None:
+        """Index the bounding boxes of all items."""
+        _ = SpatialIndex((bbox, i) for i, bbox in enumerate(self.bboxes))
+
+    def time_search(self, n_items: int) -> None:
+        """Find the items in a 1 degree square."""
+        _ = self.index.search([1, 1, 2, 2])
+
+
+class ItemCollectionSearchBench(Bench):
+    params = [1_000, 10_000]
+    param_names = ["n_items"]
+
+    def setup(self, n_items: int) -> None:
+        geometry = {"type": "Point", "coordinates": [0, 0]}
+        self.item_collection = ItemCollection(
+            [
+                Item(f"item-{i}", geometry, bbox, interval[0], {})
+                for i, (bbox, interval) in enumerate(
+                    zip(make_bboxes(n_items), make_intervals(n_items))
+                )
+                if interval is not None
+            ],
+            clone_items=False,
+        )
+        self.item_collection.search(bbox=[0, 0, 0, 0], datetime="2020-01-01/..")
+
+    def time_search_datetime(self, n_items: int) -> None:
+        """Find the items of one hour with a built index."""
+        _ = self.item_collection.search(
+            datetime="2020-01-01T01:00:00Z/2020-01-01T02:00:00Z"
+        )
+
+    def time_scan_datetime(self, n_items: int) -> None:
+        """Find the items of one hour by comparing every item's datetime."""
+        start, end = datetime(2020, 1, 1, 1), datetime(2020, 1, 1, 2)
+        _ = [
+            item
+            for item in self.item_collection
+            if item.datetime is not None and start <= item.datetime <= end
+        ]
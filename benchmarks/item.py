@@ -43,3 +43,33 @@ class ItemBench(Bench):
             dest_href=os.path.join(self.temp_dir, "time_item_save.json"),
             stac_io=self.stac_io,
         )
+
+
+class LargeItemBench(Bench):
+    params = [10, 100, 500]
+    param_names = ["n_assets"]
+
+    def setup(self, n_assets: int) -> None:
+        # an Item at the current STAC version, so no migration is needed
+        item = Item.from_file(get_data_path("eo/eo-sentinel2-item.json"))
+        asset = next(iter(item.assets.values()))
+        item.assets = {}
+        for i in range(n_assets):
+            item.add_asset(f"asset-{i}", asset.clone())
+        self.item_dict = item.to_dict(include_self_link=False)
+
+    def time_item_from_dict(self, n_assets: int) -> None:
+        """Deserialize a large Item, leaving the dictionary untouched."""
+        _ = Item.from_dict(self.item_dict)
+
+    def time_item_from_dict_no_preserve(self, n_assets: int) -> None:
+        """Deserialize a large Item, handing the dictionary over to it."""
+        _ = Item.from_dict(self.item_dict, preserve_dict=False)
+
+    def time_item_from_dict_lazy(self, n_assets: int) -> None:
+        """Deserialize a large Item without building its assets and links."""
+        _ = Item.from_dict(self.item_dict, lazy=True).datetime
+
+    def peakmem_items_from_dict(self, n_assets: int) -> None:
+        """Keep 100 large Items, with all of their assets and links, in memory."""
+        _ = [Item.from_dict(self.item_dict) for _ in range(100)]
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+from pystac import Catalog, Item
+from pystac.layout import LayoutTemplate, TemplateLayoutStrategy
+
+from ._base import Bench
+
+START = datetime(2020, 1, 1)
+
+
+class LayoutTemplateBench(Bench):
+    def setup(self) -> None:
+        self.items = [
+            Item(
+                f"item-{i}",
+                None,
+                None,
+                START + timedelta(hours=i),
+                {"platform": f"sat-{i % 3}", "eo:cloud_cover": i % 100},
+                collection="a-collection",
+            )
+            for i in range(10_000)
+        ]
+        self.template = LayoutTemplate("${collection}/${platform}/${year}/${month}")
+        self.strategy = TemplateLayoutStrategy(
+            item_template="${collection}/${year}/${month}/${day}/${id}"
+        )
+
+    def time_substitute(self) -> None:
+        """Template the path of 10,000 items from properties and their datetime."""
+        for item in self.items:
+            self.template.substitute(item)
+
+    def time_get_item_href(self) -> None:
+        """Lay out 10,000 items with a template strategy."""
+        for item in self.items:
+            self.strategy.get_href(item, "/tmp/catalog")
+
+
+class GenerateSubcatalogsBench(Bench):
+    params = [1_000, 10_000]
+    param_names = ["n_items"]
+    # Each run moves the items, so it needs a fresh catalog
+    number = 1
+
+    def setup(self, n_items: int) -> None:
+        self.catalog = Catalog("an-id", "a description")
+        self.catalog.add_items(
+            Item(
+                f"item-{i}",
+                None,
+                None,
+                START + timedelta(hours=i),
+                {"platform": f"sat-{i % 3}"},
+            )
+            for i in range(n_items)
+        )
+
+    def time_generate_subcatalogs(self, n_items: int) -> None:
+        """Move items into a subcatalog per platform, year and month."""
+        self.catalog.generate_subcatalogs("${platform}/${year}/${month}")
@@ -0,0 +1,54 @@
+from pystac.utils import (
+    clear_href_caches,
+    is_absolute_href,
+    make_absolute_href,
+    make_relative_href,
+)
+
+from ._base import Bench
+
+# A catalog with items in a directory each, as laid out by normalize_hrefs. With
+# 10,000 calls every HREF is seen once, with 1,000,000 each is seen 100 times.
+ROOTS = {
+    "posix": "/data/catalog",
+    "windows": "C:\\data\\catalog",
+    "url": "https://example.com/data/catalog",
+}
+N_DISTINCT = 10_000
+
+
+class HrefBench(Bench):
+    params = (list(ROOTS), [10_000, 1_000_000])
+    param_names = ["kind", "n_calls"]
+
+    def setup(self, kind: str, n_calls: int) -> None:
+        root = ROOTS[kind]
+        sep = "\\" if kind == "windows" else "/"
+        self.start_href = sep.join([root, "collection", "collection.json"])
+        self.absolute_hrefs = [
+            sep.join([root, "collection", f"item-{i}", f"item-{i}.json"])
+            for i in range(N_DISTINCT)
+        ]
+        self.relative_hrefs = [f"./item-{i}/item-{i}.json" for i in range(N_DISTINCT)]
+        self.repeats = max(n_calls // N_DISTINCT, 1)
+
+    def time_make_relative_href(self, kind: str, n_calls: int) -> None:
+        """Make item HREFs relative to their collection, each many times."""
+        clear_href_caches()
+        for _ in range(self.repeats):
+            for href in self.absolute_hrefs:
+                make_relative_href(href, self.start_href)
+
+    def time_make_absolute_href(self, kind: str, n_calls: int) -> None:
+        """Resolve relative item HREFs against their collection, each many times."""
+        clear_href_caches()
+        for _ in range(self.repeats):
+            for href in self.relative_hrefs:
+                make_absolute_href(href, self.start_href)
+
+    def time_is_absolute_href(self, kind: str, n_calls: int) -> None:
+        """Check whether item HREFs are absolute, each many times."""
+        clear_href_caches()
+        for _ in range(self.repeats):
+            for href in self.absolute_hrefs:
+                is_absolute_href(href)
@@ -0,0 +1,31 @@
+import json
+
+from pystac import STACObjectType
+from pystac.validation import JsonSchemaSTACValidator
+
+from ._base import Bench
+from ._util import get_data_path
+
+
+class ValidationBench(Bench):
+    def setup(self) -> None:
+        # An item without extensions at the current STAC version, validated against
+        # the schemas shipped with pystac
+        with open(get_data_path("examples/1.1.0/simple-item.json")) as src:
+            self.item_dict = json.load(src)
+        self.validator = JsonSchemaSTACValidator()
+        self.validate()
+
+    def validate(self) -> None:
+        self.validator.validate_core(
+            self.item_dict, STACObjectType.ITEM, self.item_dict["stac_version"]
+        )
+
+    def time_validate_item(self) -> None:
+        """Validate an item with a validator that has already validated one."""
+        self.validate()
+
+    def time_validate_100_items(self) -> None:
+        """Validate the same item 100 times, as when validating a catalog."""
+        for _ in range(100):
+            self.validate()
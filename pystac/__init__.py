@@ -14,6 +14,7 @@ __all__ = [
     "ExtensionTypeError",
     "RequiredPropertyMissing",
     "STACValidationError",
+    "STACSaveError",
     "DeprecatedWarning",
     "MediaType",
     "RelType",
@@ -58,6 +59,7 @@ from pystac.errors import (
     ExtensionTypeError,
     RequiredPropertyMissing,
     STACValidationError,
+    STACSaveError,
     DeprecatedWarning,
 )
 
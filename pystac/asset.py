@@ -4,7 +4,7 @@ import os
 import shutil
 from copy import copy, deepcopy
 from html import escape
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast
 
 from pystac import MediaType, STACError, common_metadata, utils
 from pystac.html.jinja_env import get_jinja_env
@@ -61,9 +61,17 @@ class Asset:
     """The :class:`~pystac.Item` or :class:`~pystac.Collection` that this asset belongs
     to, or ``None`` if it has no owner."""
 
-    extra_fields: dict[str, Any]
-    """Optional, additional fields for this asset. This is used by extensions as a
-    way to serialize and deserialize properties on asset object JSON."""
+    _extra_fields: dict[str, Any] | None
+
+    __slots__ = (
+        "href",
+        "title",
+        "description",
+        "media_type",
+        "roles",
+        "owner",
+        "_extra_fields",
+    )
 
     def __init__(
         self,
@@ -74,15 +82,40 @@ class Asset:
         roles: list[str] | None = None,
         extra_fields: dict[str, Any] | None = None,
     ) -> None:
-        self.href = utils.make_posix_style(href)
-        self.title = title
-        self.description = description
-        self.media_type = media_type
-        self.roles = roles
-        self.extra_fields = extra_fields or {}
+        # A new asset has no owner to mark as dirty, so __setattr__ is bypassed.
+        init = object.__setattr__
+        init(self, "href", utils.make_posix_style(href))
+        init(self, "title", title)
+        init(self, "description", description)
+        init(self, "media_type", media_type)
+        init(self, "roles", roles)
+        init(self, "_extra_fields", extra_fields or None)
 
         # The Item which owns this Asset.
-        self.owner = None
+        init(self, "owner", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "owner":
+            try:
+                owner = self.owner
+            except AttributeError:  # Not set yet, e.g. while unpickling.
+                return
+            if owner is not None:
+                _mark_dirty(owner)
+
+    @property
+    def extra_fields(self) -> dict[str, Any]:
+        """Optional, additional fields for this asset. This is used by extensions as a
+        way to serialize and deserialize properties on asset object JSON."""
+        if self._extra_fields is None:
+            # Creating the empty dict does not change the asset.
+            object.__setattr__(self, "_extra_fields", {})
+        return cast(dict[str, Any], self._extra_fields)
+
+    @extra_fields.setter
+    def extra_fields(self, v: dict[str, Any]) -> None:
+        self._extra_fields = v
 
     def set_owner(self, obj: Assets) -> None:
         """Sets the owning item of this Asset.
@@ -132,8 +165,8 @@ class Asset:
         if self.description is not None:
             d["description"] = self.description
 
-        if self.extra_fields is not None and len(self.extra_fields) > 0:
-            for k, v in self.extra_fields.items():
+        if self._extra_fields:
+            for k, v in self._extra_fields.items():
                 d[k] = v
 
         if self.roles is not None:
@@ -155,7 +188,7 @@ class Asset:
             description=self.description,
             media_type=self.media_type,
             roles=self.roles,
-            extra_fields=deepcopy(self.extra_fields),
+            extra_fields=deepcopy(self._extra_fields),
         )
 
     def has_role(self, role: str) -> bool:
@@ -232,6 +265,7 @@ class Asset:
         dst = _absolute_href(href, self.owner, "move")
         shutil.move(src, dst)
         self.href = href
+        _mark_dirty(self.owner)
         return self
 
     def copy(self, href: str) -> Asset:
@@ -251,6 +285,7 @@ class Asset:
         dst = _absolute_href(href, self.owner, "copy")
         shutil.copy2(src, dst)
         self.href = href
+        _mark_dirty(self.owner)
         return self
 
     def delete(self) -> None:
@@ -314,6 +349,7 @@ class Assets(Protocol):
         """
         asset.set_owner(self)
         self.assets[key] = asset
+        _mark_dirty(self)
 
     def delete_asset(self, key: str) -> None:
         """Deletes the asset at the given key, and removes the asset's data
@@ -332,6 +368,7 @@ class Assets(Protocol):
         asset.delete()
 
         del self.assets[key]
+        _mark_dirty(self)
 
     def make_asset_hrefs_relative(self) -> Assets:
         """Modify each asset's HREF to be relative to this object's self HREF.
@@ -347,6 +384,7 @@ class Assets(Protocol):
                         "Cannot make asset HREFs relative if no self_href is set."
                     )
                 asset.href = make_relative_href(asset.href, self_href)
+                _mark_dirty(self)
         return self
 
     def make_asset_hrefs_absolute(self) -> Assets:
@@ -367,6 +405,7 @@ class Assets(Protocol):
                         "if no self_href is set."
                     )
                 asset.href = make_absolute_href(asset.href, self_href)
+                _mark_dirty(self)
         return self
 
     def get_self_href(self) -> str | None:
@@ -391,3 +430,11 @@ def _absolute_href(href: str, owner: Assets | None, action: str = "access") -> s
                 ":func:`~pystac.Item.make_asset_hrefs_absolute`"
             )
         return utils.make_absolute_href(href, item_self)
+
+
+def _mark_dirty(owner: Any) -> None:
+    """Marks the STAC object owning assets as changed, see
+    :meth:`pystac.STACObject.is_dirty`."""
+    mark_dirty = getattr(owner, "mark_dirty", None)
+    if mark_dirty is not None:
+        mark_dirty()
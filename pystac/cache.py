@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from collections import ChainMap
+import sys
+from collections import ChainMap, OrderedDict
 from copy import copy
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
 
 import pystac
 
 if TYPE_CHECKING:
     from pystac.collection import Collection
+    from pystac.item import Item
+    from pystac.link import Link
     from pystac.stac_object import STACObject
 
 
@@ -35,6 +39,28 @@ def get_cache_key(stac_object: STACObject) -> tuple[str, bool]:
         return "/".join(ids), False
 
 
+@dataclass
+class CacheStats:
+    """Counters kept by a :class:`ResolvedObjectCache`."""
+
+    hits: int = 0
+    """Number of HREF lookups that found a cached object, including one per link
+    resolved against the cache."""
+
+    misses: int = 0
+    """Number of HREF lookups that did not find a cached object, including one per
+    link resolved against the cache."""
+
+    evictions: int = 0
+    """Number of items evicted to stay within the cache limits."""
+
+    objects: int = 0
+    """Number of evictable items currently cached."""
+
+    bytes: int = 0
+    """Approximate size in bytes of the evictable items currently cached."""
+
+
 class ResolvedObjectCache:
     """This class tracks resolved objects tied to root catalogs.
     A STAC object is 'resolved' when it is a Python Object; a link
@@ -59,6 +85,10 @@ class ResolvedObjectCache:
             their cached object.
         ids_to_collections : Map of collection IDs
             to collections.
+        max_objects : Optional maximum number of items read from an HREF to keep
+            cached. See :meth:`set_limits`.
+        max_bytes : Optional approximate maximum size in bytes of the items read
+            from an HREF to keep cached. See :meth:`set_limits`.
     """
 
     id_keys_to_objects: dict[str, STACObject]
@@ -71,19 +101,103 @@ class ResolvedObjectCache:
     ids_to_collections: dict[str, Collection]
     """Map of collection IDs to collections."""
 
+    max_objects: int | None
+    """Maximum number of items read from an HREF to keep cached, or None."""
+
+    max_bytes: int | None
+    """Approximate maximum size in bytes of the items read from an HREF to keep
+    cached, or None."""
+
+    stats: CacheStats
+    """Hit, miss and eviction counters of this cache."""
+
     _collection_cache: ResolvedObjectCollectionCache | None
+    _evictable: OrderedDict[str, _EvictableEntry]
 
     def __init__(
         self,
         id_keys_to_objects: dict[str, STACObject] | None = None,
         hrefs_to_objects: dict[str, STACObject] | None = None,
         ids_to_collections: dict[str, Collection] | None = None,
+        max_objects: int | None = None,
+        max_bytes: int | None = None,
     ):
         self.id_keys_to_objects = id_keys_to_objects or {}
         self.hrefs_to_objects = hrefs_to_objects or {}
         self.ids_to_collections = ids_to_collections or {}
+        self.max_objects = max_objects
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
 
         self._collection_cache = None
+        self._evictable = OrderedDict()
+
+    @property
+    def is_bounded(self) -> bool:
+        """Whether this cache evicts items to stay within :attr:`max_objects` or
+        :attr:`max_bytes`."""
+        return self.max_objects is not None or self.max_bytes is not None
+
+    def set_limits(
+        self, max_objects: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        """Bounds the number and approximate size of the cached items.
+
+        Only :class:`~pystac.Item` objects read through a link (for example while
+        iterating :meth:`Catalog.get_items <pystac.Catalog.get_items>`) count
+        towards the limits. Once a limit is exceeded, the least recently used of
+        those items that were not modified since they were read are evicted: they
+        are dropped from this cache and the link they were read through is set
+        back to their HREF, so they are read again on next access. Items that are
+        dirty (see :meth:`STACObject.is_dirty <pystac.STACObject.is_dirty>`) are
+        never evicted, so call :meth:`STACObject.mark_dirty
+        <pystac.STACObject.mark_dirty>` after changing the properties of an item
+        in place.
+
+        Note that an evicted item that is still referenced elsewhere (for example
+        by a ``source`` link of a label item) is no longer the same instance as
+        the one returned after reading it again.
+
+        Args:
+            max_objects : Maximum number of items read from an HREF to keep
+                cached. Defaults to None, which is unbounded.
+            max_bytes : Approximate maximum size in bytes of the items read from
+                an HREF to keep cached. Defaults to None, which is unbounded.
+        """
+        self.max_objects = max_objects
+        self.max_bytes = max_bytes
+        if not self.is_bounded:
+            self._evictable.clear()
+            self.stats.objects = 0
+            self.stats.bytes = 0
+        self._evict()
+
+    def track(self, obj: STACObject, link: Link) -> None:
+        """Registers an object that was just read through ``link`` as evictable.
+
+        Does nothing unless the cache :attr:`is_bounded`, ``obj`` is an
+        :class:`~pystac.Item` cached by HREF and ``link`` has a target HREF to
+        fall back to.
+
+        Args:
+            obj : The object read through ``link``.
+            link : The link whose target is ``obj``.
+        """
+        if not self.is_bounded or not isinstance(obj, pystac.Item):
+            return
+        key, is_href = get_cache_key(obj)
+        if not is_href or link._target_href is None:
+            return
+        if key in self._evictable:
+            if self._evictable[key].obj is obj:
+                self._evictable.move_to_end(key)
+                return
+            self._forget(key)
+        size = _measure_item(obj)
+        self._evictable[key] = _EvictableEntry(obj, link, size)
+        self.stats.objects += 1
+        self.stats.bytes += size
+        self._evict(keep_last=True)
 
     def get_or_cache(self, obj: STACObject) -> STACObject:
         """Gets the STACObject that is the cached version of the given STACObject; or,
@@ -100,6 +214,8 @@ class ResolvedObjectCache:
         key, is_href = get_cache_key(obj)
         if is_href:
             if key in self.hrefs_to_objects:
+                if key in self._evictable:
+                    self._evictable.move_to_end(key)
                 return self.hrefs_to_objects[key]
             else:
                 self.cache(obj)
@@ -137,7 +253,20 @@ class ResolvedObjectCache:
         Returns:
             STACObject or None: Returns the STACObject if cached, otherwise None.
         """
-        return self.hrefs_to_objects.get(href)
+        obj = self._peek(href)
+        if obj is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return obj
+
+    def _peek(self, href: str) -> STACObject | None:
+        """Like :meth:`get_by_href`, without counting the lookup in :attr:`stats`,
+        for the checks made on the way to resolving a link."""
+        obj = self.hrefs_to_objects.get(href)
+        if obj is not None and href in self._evictable:
+            self._evictable.move_to_end(href)
+        return obj
 
     def get_collection_by_id(self, id: str) -> Collection | None:
         """Retrieved a cached Collection by its ID.
@@ -176,12 +305,26 @@ class ResolvedObjectCache:
 
         if is_href:
             self.hrefs_to_objects.pop(key, None)
+            if key in self._evictable:
+                self._forget(key)
         else:
             self.id_keys_to_objects.pop(key, None)
 
         if obj.STAC_OBJECT_TYPE == pystac.STACObjectType.COLLECTION:
             self.id_keys_to_objects.pop(obj.id, None)
 
+    def discard(self, obj: STACObject) -> None:
+        """Removes the given object from the cache, if it is the object cached under
+        its cache key.
+
+        Args:
+            obj : The object to remove
+        """
+        key, is_href = get_cache_key(obj)
+        objects = self.hrefs_to_objects if is_href else self.id_keys_to_objects
+        if objects.get(key) is obj:
+            self.remove(obj)
+
     def __contains__(self, obj: STACObject) -> bool:
         key, is_href = get_cache_key(obj)
         return (
@@ -192,6 +335,35 @@ class ResolvedObjectCache:
         """Returns True if there is a collection with given collection ID is cached."""
         return collection_id in self.ids_to_collections
 
+    def _forget(self, key: str) -> _EvictableEntry:
+        entry = self._evictable.pop(key)
+        self.stats.objects -= 1
+        self.stats.bytes -= entry.size
+        return entry
+
+    def _is_over_limits(self) -> bool:
+        return (
+            self.max_objects is not None and self.stats.objects > self.max_objects
+        ) or (self.max_bytes is not None and self.stats.bytes > self.max_bytes)
+
+    def _evict(self, keep_last: bool = False) -> None:
+        while len(self._evictable) > int(keep_last) and self._is_over_limits():
+            key = next(iter(self._evictable))
+            entry = self._forget(key)
+            obj = cast(pystac.Item, entry.obj)
+            if (
+                self.hrefs_to_objects.get(key) is not obj
+                or obj.get_self_href() != key
+                or obj.is_dirty()
+            ):
+                # Replaced or modified since it was read; keep it resolved.
+                continue
+            del self.hrefs_to_objects[key]
+            link = entry.link
+            if link._target_object is obj and link._target_href is not None:
+                link._target_object = None
+            self.stats.evictions += 1
+
     def as_collection_cache(self) -> CollectionCache:
         if self._collection_cache is None:
             self._collection_cache = ResolvedObjectCollectionCache(self)
@@ -216,6 +388,8 @@ class ResolvedObjectCache:
             ResolvedObjectCache: The resulting merged cache.
         """
         merged = ResolvedObjectCache(
+            max_objects=first.max_objects,
+            max_bytes=first.max_bytes,
             id_keys_to_objects=dict(
                 ChainMap(
                     copy(first.id_keys_to_objects), copy(second.id_keys_to_objects)
@@ -235,9 +409,96 @@ class ResolvedObjectCache:
             merged, first._collection_cache, second._collection_cache
         )
 
+        merged.stats = copy(first.stats)
+        merged.stats.objects = 0
+        merged.stats.bytes = 0
+        if merged.is_bounded:
+            for cache in (second, first):
+                for key, entry in cache._evictable.items():
+                    if merged.hrefs_to_objects.get(key) is entry.obj:
+                        if key in merged._evictable:
+                            merged._forget(key)
+                        merged._evictable[key] = entry
+                        merged.stats.objects += 1
+                        merged.stats.bytes += entry.size
+            merged._evict()
+
         return merged
 
 
+class _EvictableEntry:
+    """An item read through a link, tracked by a bounded
+    :class:`ResolvedObjectCache`."""
+
+    __slots__ = ("obj", "link", "size")
+
+    def __init__(self, obj: STACObject, link: Link, size: int):
+        self.obj = obj
+        self.link = link
+        self.size = size
+
+
+def _measure_item(item: Item) -> int:
+    """Returns the approximate size in bytes of the content of an item.
+
+    The raw assets and links of items parsed with ``lazy=True`` are measured as
+    they are, so that measuring does not materialize them.
+    """
+    size = _measure(
+        [
+            item.id,
+            item.geometry,
+            item.bbox,
+            item.datetime,
+            item.properties,
+            item.collection_id,
+            item.stac_extensions,
+            item.extra_fields,
+        ]
+    )
+    if "_lazy_assets" in item.__dict__:
+        size += _measure(item._lazy_assets)
+    else:
+        for key, asset in item.assets.items():
+            size += _measure(
+                [
+                    key,
+                    asset.href,
+                    asset.title,
+                    asset.description,
+                    asset.media_type,
+                    asset.roles,
+                    asset.extra_fields,
+                ]
+            )
+    if "_lazy_links" in item.__dict__:
+        size += _measure(item._lazy_links[0])
+    else:
+        for link in item.links:
+            size += _measure(
+                [
+                    link.rel,
+                    link.get_target_str(),
+                    link.media_type,
+                    link.title,
+                    link.extra_fields,
+                ]
+            )
+    return size
+
+
+def _measure(value: Any) -> int:
+    """Returns the approximate size in bytes of a JSON-like value."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += sys.getsizeof(k) + _measure(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            size += _measure(v)
+    return size
+
+
 class CollectionCache:
     """Cache of collections that can be used to avoid re-reading Collection
     JSON in :func:`pystac.serialization.merge_common_properties
@@ -302,7 +563,7 @@ class ResolvedObjectCollectionCache(CollectionCache):
             return result
 
     def get_by_href(self, href: str) -> Collection | dict[str, Any] | None:
-        result = self.resolved_object_cache.get_by_href(href)
+        result = self.resolved_object_cache._peek(href)
         if result is None:
             return super().get_by_href(href)
         else:
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import warnings
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from copy import deepcopy
+from functools import partial
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
@@ -14,27 +23,43 @@ from typing import (
 
 import pystac
 import pystac.media_type
-from pystac.cache import ResolvedObjectCache
+from pystac.cache import CacheStats, ResolvedObjectCache
 from pystac.errors import STACError, STACTypeError
+from pystac.index import (
+    Interval,
+    IntervalLike,
+    bbox_intersects,
+    intervals_overlap,
+    item_intersects,
+    parse_interval,
+    query_bbox,
+)
 from pystac.layout import (
     APILayoutStrategy,
     BestPracticesLayoutStrategy,
     HrefLayoutStrategy,
     LayoutTemplate,
 )
-from pystac.link import Link
+from pystac.link import Link, _caching_hrefs
+from pystac.manifest import (
+    MANIFEST_FILE_NAME,
+    CatalogManifest,
+    ManifestEntry,
+    get_manifest_href,
+)
 from pystac.serialization import (
     identify_stac_object,
     identify_stac_object_type,
     migrate_to_latest,
 )
-from pystac.stac_object import STACObject, STACObjectType
+from pystac.stac_object import STACObject, STACObjectType, _prefetch_executor
 from pystac.utils import (
     HREF,
     StringEnum,
     _is_url,
     is_absolute_href,
     make_absolute_href,
+    make_posix_style,
     make_relative_href,
 )
 
@@ -47,6 +72,17 @@ if TYPE_CHECKING:
 #: Generalized version of :class:`Catalog`
 C = TypeVar("C", bound="Catalog")
 
+# Number of items sent at once to a process pool computing HREFs in normalize_hrefs
+_NORMALIZE_CHUNK_SIZE = 1024
+
+
+def _get_item_href(
+    strategy: HrefLayoutStrategy, d: dict[str, Any], parent_dir: str, is_root: bool
+) -> str:
+    """Returns the HREF given by ``strategy`` to the item with dictionary ``d``."""
+    item = pystac.Item.from_dict(d, migrate=False, preserve_dict=False)
+    return strategy.get_href(item, parent_dir, is_root)
+
 
 class CatalogType(StringEnum):
     SELF_CONTAINED = "SELF_CONTAINED"
@@ -136,6 +172,8 @@ class Catalog(STACObject):
             :class:`~pystac.layout.BestPracticesLayoutStrategy`.
     """
 
+    _untracked_attributes = frozenset({"catalog_type", "strategy"})
+
     catalog_type: CatalogType
     """The catalog type. Defaults to :attr:`CatalogType.ABSOLUTE_PUBLISHED`."""
 
@@ -168,6 +206,11 @@ class Catalog(STACObject):
     Set while reading in a catalog. This is set when a catalog
     is read by a StacIO instance."""
 
+    _async_stac_io: pystac.stac_io.AsyncStacIO | None = None
+    """Optional instance of AsyncStacIO that will be used by default for any
+    asynchronous IO operations on objects contained by this catalog. This is set
+    when a catalog is read by an AsyncStacIO instance."""
+
     DEFAULT_FILE_NAME = "catalog.json"
     """Default file name that will be given to this STAC object in
     a canonical format.
@@ -198,6 +241,8 @@ class Catalog(STACObject):
             self.extra_fields = extra_fields
 
         self._resolved_objects = ResolvedObjectCache()
+        self._link_index: _LinkIndex | None = None
+        self._manifest: CatalogManifest | None = None
 
         self.add_link(Link.root(self))
 
@@ -295,6 +340,8 @@ class Catalog(STACObject):
 
         child_link = Link.child(child, title=title)
         self.add_link(child_link)
+        if self._link_index is not None:
+            self._link_index.add(child_link, self.links)
         return child_link
 
     def add_children(
@@ -366,6 +413,8 @@ class Catalog(STACObject):
 
         item_link = Link.item(item, title=title)
         self.add_link(item_link)
+        if self._link_index is not None:
+            self._link_index.add(item_link, self.links)
         return item_link
 
     def add_items(
@@ -402,13 +451,27 @@ class Catalog(STACObject):
                 to False.
             sort_links_by_id : If True, links containing the ID will be checked
                 first. If links do not contain the ID then setting this to False
-                will improve performance. Defaults to True.
+                will improve performance. Defaults to True. Catalogs with a link
+                index (see :meth:`enable_link_index`) always check links with the ID as
+                a segment of their HREF first.
 
         Return:
             Catalog or Collection or None: The child with the given ID,
             or None if not found.
+
+        Note:
+            If this catalog was read with a manifest (see :meth:`from_file`), a
+            recursive search only reads the catalogs on the path to the child that
+            the manifest gives, unless the child is not found there.
         """
         if not recursive:
+            if self._link_index is not None:
+                link, _ = self._find_indexed_link(pystac.RelType.CHILD, id)
+                if link is None:
+                    return None
+                link.resolve_stac_object(root=self.get_root())
+                return cast(pystac.Catalog | pystac.Collection, link.target)
+
             children: Iterable[pystac.Catalog | pystac.Collection]
             if not sort_links_by_id:
                 children = self.get_children()
@@ -428,6 +491,10 @@ class Catalog(STACObject):
                 )
             return next((c for c in children if c.id == id), None)
         else:
+            if self._manifest is not None:
+                found = self._find_in_manifest("children", id)
+                if found:
+                    return cast(pystac.Catalog | pystac.Collection, found[0])
             for root, _, _ in self.walk():
                 child = root.get_child(id, recursive=False)
                 if child is not None:
@@ -478,9 +545,13 @@ class Catalog(STACObject):
         Return:
             Catalog: Returns ``self``
         """
-        child_ids = [child.id for child in self.get_children()]
-        for child_id in child_ids:
-            self.remove_child(child_id)
+        for link in self.links:
+            if link.rel == pystac.RelType.CHILD and link.is_resolved():
+                child = cast(Catalog, link.target)
+                child.set_parent(None)
+                child.set_root(None)
+
+        self.links = [link for link in self.links if link.rel != pystac.RelType.CHILD]
 
     def remove_child(self, child_id: str) -> None:
         """Removes an child from this catalog.
@@ -488,6 +559,10 @@ class Catalog(STACObject):
         Args:
             child_id : The ID of the child to remove.
         """
+        if self._link_index is not None:
+            self._remove_indexed_link(pystac.RelType.CHILD, child_id)
+            return
+
         new_links: list[pystac.Link] = []
         root = self.get_root()
         for link in self.links:
@@ -535,35 +610,127 @@ class Catalog(STACObject):
                     return item
             return None
 
-    def get_items(self, *ids: str, recursive: bool = False) -> Iterator[Item]:
+    def get_items(
+        self,
+        *ids: str,
+        recursive: bool = False,
+        prefetch: int = 0,
+        release: bool = False,
+        lazy: bool = False,
+    ) -> Iterator[Item]:
         """Return all items or specific items of this catalog.
 
         Args:
-            *ids : The IDs of the items to include.
+            *ids : The IDs of the items to include. Catalogs with a link index (see
+                :meth:`enable_link_index`) look the IDs up in the index, and yield
+                their items in the order of ``ids``.
             recursive : If True, search this catalog and all children for the
                 item; otherwise, only search the items of this catalog. Defaults
                 to False.
+            prefetch : Number of upcoming unresolved item (and, if recursive, child)
+                links of each catalog to read concurrently while iterating. Items are
+                yielded in the same order either way. Defaults to 0, which reads
+                every object only when it is reached.
+            release : If True, item (and, if recursive, child) links that were not
+                resolved before are set back to their HREF once the iteration moves
+                past them, so that read-only scans of large catalogs run in constant
+                memory. Changes made to released items are not saved with this
+                catalog. Defaults to False.
+            lazy : If True, items that are read are parsed with ``lazy=True``, so
+                that their assets and links are only built when accessed (see
+                :meth:`Item.from_dict <pystac.Item.from_dict>`). Defaults to False.
 
         Return:
             Iterator[Item]: Generator of items whose parent is this catalog, and
                 (if recursive) all catalogs or collections connected to this catalog
                 through child links.
+
+        Note:
+            If this catalog was read with a manifest (see :meth:`from_file`), a
+            recursive search for ``ids`` only reads the catalogs on the paths to the
+            items that the manifest gives, and yields them in the order of ``ids``.
+            IDs that are not found there are searched for in the whole catalog.
         """
         items: Iterator[Item]
-        if not recursive:
-            items = map(
-                lambda x: cast(pystac.Item, x),
-                self.get_stac_objects(pystac.RelType.ITEM),
-            )
-        else:
-            items = chain(
-                self.get_items(recursive=False),
-                *(child.get_items(recursive=True) for child in self.get_children()),
+        if ids and recursive and self._manifest is not None:
+            missing: list[str] = []
+            for item_id in dict.fromkeys(ids):
+                found = self._find_in_manifest("items", item_id, lazy)
+                if found:
+                    yield from (cast(pystac.Item, item) for item in found)
+                else:
+                    missing.append(item_id)
+            if not missing:
+                return
+            ids = tuple(missing)
+        if ids and not recursive and self._link_index is not None:
+            yield from self._get_indexed_items(ids, release, lazy)
+            return
+        # The prefetchers of the catalogs of a recursive search share one pool
+        with _prefetch_executor.hold(prefetch if recursive else 0):
+            if not recursive:
+                items = map(
+                    lambda x: cast(pystac.Item, x),
+                    self.get_stac_objects(
+                        pystac.RelType.ITEM,
+                        prefetch=prefetch,
+                        release=release,
+                        lazy=lazy,
+                    ),
+                )
+            elif release:
+                items = chain(
+                    self.get_items(
+                        *ids,
+                        recursive=False,
+                        prefetch=prefetch,
+                        release=True,
+                        lazy=lazy,
+                    ),
+                    chain.from_iterable(
+                        cast(Catalog, child).get_items(
+                            *ids,
+                            recursive=True,
+                            prefetch=prefetch,
+                            release=True,
+                            lazy=lazy,
+                        )
+                        for child in self.get_stac_objects(
+                            pystac.RelType.CHILD, prefetch=prefetch, release=True
+                        )
+                    ),
+                )
+            else:
+                items = chain(
+                    self.get_items(*ids, recursive=False, prefetch=prefetch, lazy=lazy),
+                    *(
+                        cast(Catalog, child).get_items(
+                            *ids, recursive=True, prefetch=prefetch, lazy=lazy
+                        )
+                        for child in self.get_stac_objects(
+                            pystac.RelType.CHILD, prefetch=prefetch
+                        )
+                    ),
+                )
+            if ids and not recursive:
+                yield from (i for i in items if i.id in ids)
+            else:
+                yield from items
+
+    def _get_indexed_items(
+        self, ids: Iterable[str], release: bool, lazy: bool = False
+    ) -> Iterator[Item]:
+        root = self.get_root()
+        for item_id in dict.fromkeys(ids):
+            link, was_resolved = self._find_indexed_link(
+                pystac.RelType.ITEM, item_id, release
             )
-        if ids:
-            yield from (i for i in items if i.id in ids)
-        else:
-            yield from items
+            if link is None:
+                continue
+            link.resolve_stac_object(root=root, lazy=lazy)
+            yield cast(pystac.Item, link.target)
+            if release and not was_resolved:
+                link._release_target(root)
 
     def clear_items(self) -> None:
         """Removes all items from this catalog.
@@ -585,6 +752,10 @@ class Catalog(STACObject):
         Args:
             item_id : The ID of the item to remove.
         """
+        if self._link_index is not None:
+            self._remove_indexed_link(pystac.RelType.ITEM, item_id)
+            return
+
         new_links: list[pystac.Link] = []
         root = self.get_root()
         for link in self.links:
@@ -600,6 +771,152 @@ class Catalog(STACObject):
                     item.set_root(None)
         self.links = new_links
 
+    def _find_in_manifest(
+        self, kind: str, id: str, lazy: bool = False
+    ) -> list[STACObject]:
+        """Returns the children (``kind="children"``) or items (``kind="items"``)
+        with ``id`` found where the manifest of this catalog locates them."""
+        manifest = cast(CatalogManifest, self._manifest)
+        rel = pystac.RelType.ITEM if kind == "items" else pystac.RelType.CHILD
+        found: list[STACObject] = []
+        for entry in getattr(manifest, kind).get(id, []):
+            obj = self._resolve_manifest_entry(entry, rel, lazy)
+            if obj is not None and obj.id == id:
+                found.append(obj)
+        return found
+
+    def _resolve_manifest_entry(
+        self, entry: ManifestEntry, rel: pystac.RelType, lazy: bool = False
+    ) -> STACObject | None:
+        """Resolves the links on the path to the object at ``entry`` of the manifest
+        of this catalog, and returns the object, or None if the path is not found."""
+        base_href = self.get_self_href()
+        if base_href is None:
+            return None
+        root = self.get_root()
+        catalog: Catalog = self
+        for parent_href in entry.parents:
+            parent_link = _find_link(
+                catalog,
+                pystac.RelType.CHILD,
+                make_absolute_href(parent_href, base_href),
+            )
+            if parent_link is None:
+                return None
+            parent_link.resolve_stac_object(root=root)
+            catalog = cast(Catalog, parent_link.target)
+        link = _find_link(catalog, rel, make_absolute_href(entry.href, base_href))
+        if link is None:
+            return None
+        link.resolve_stac_object(root=root, lazy=lazy)
+        return cast(STACObject, link.target)
+
+    def search(
+        self,
+        bbox: Sequence[float] | None = None,
+        intersects: dict[str, Any] | None = None,
+        datetime: IntervalLike | None = None,
+    ) -> Iterator[Item]:
+        """Returns the items of this catalog and all its children that intersect a
+        bounding box, a geometry and/or a time interval.
+
+        If this catalog was read with a manifest (see :meth:`from_file`) and a
+        spatial query is given, only the items whose bounding box in the spatial
+        index of the manifest intersects the query are read, along with the catalogs
+        on the way to them; items added since the manifest was written are not
+        found. Otherwise the catalog is walked, skipping the children of collections
+        whose spatial or temporal extent does not intersect the query.
+
+        Args:
+            bbox : Optional 2D or 3D bounding box the items must intersect. May
+                cross the antimeridian.
+            intersects : Optional GeoJSON geometry the item geometries must
+                intersect, tested in planar coordinates.
+            datetime : Optional datetime or time interval the items must
+                intersect, such as ``"2020-01-01/2021-01-01"``. See
+                :meth:`ItemCollection.search <pystac.ItemCollection.search>`.
+
+        Returns:
+            Iterator[Item]: The matching items. Without ``bbox``, ``intersects`` and
+            ``datetime``, all items.
+        """
+        query = query_bbox(bbox, intersects)
+        interval = None if datetime is None else parse_interval(datetime)
+        if query is not None and self._manifest is not None:
+            for id, entry in self._manifest.search(query):
+                item = self._resolve_manifest_entry(entry, pystac.RelType.ITEM)
+                if (
+                    isinstance(item, pystac.Item)
+                    and item.id == id
+                    and item_intersects(item, bbox, intersects, interval)
+                ):
+                    yield item
+            return
+        yield from self._search(bbox, intersects, query, interval)
+
+    def _search(
+        self,
+        bbox: Sequence[float] | None,
+        intersects: dict[str, Any] | None,
+        query: Sequence[float] | None,
+        interval: Interval | None,
+    ) -> Iterator[Item]:
+        for item in self.get_items():
+            if item_intersects(item, bbox, intersects, interval):
+                yield item
+        for child in self.get_children():
+            if isinstance(child, pystac.Collection):
+                extent = child.extent
+                if query is not None and extent.spatial.bboxes:
+                    if not bbox_intersects(extent.spatial.bboxes[0], query):
+                        continue
+                if interval is not None and extent.temporal.intervals:
+                    start, end = extent.temporal.intervals[0]
+                    if not intervals_overlap((start, end), interval):
+                        continue
+            yield from child._search(bbox, intersects, query, interval)
+
+    def enable_link_index(self) -> None:
+        """Indexes the child and item links of this catalog by the ID of the object
+        they link to.
+
+        With the index, :meth:`get_child`, :meth:`get_items` with IDs,
+        :meth:`remove_child` and :meth:`remove_item` look links up by ID in constant
+        time, instead of resolving and comparing every child or item. The ID of an
+        unresolved link is only known once it has been read: a lookup for an ID that
+        is not indexed yet reads such links, those with the ID as a segment of their
+        HREF first, until it is found, and each link is read at most once for the index.
+
+        The index is kept up to date by the methods of this catalog that add and
+        remove children and items, and is rebuilt, without reading any link, when
+        the links of this catalog are changed in other ways. Changes to the IDs of
+        indexed children and items are not tracked.
+        """
+        self._link_index = _LinkIndex()
+        self._link_index.sync(self.links)
+
+    def disable_link_index(self) -> None:
+        """Drops the index created by :meth:`enable_link_index`."""
+        self._link_index = None
+
+    def _find_indexed_link(
+        self, rel: pystac.RelType, id: str, release: bool = False
+    ) -> tuple[Link | None, bool]:
+        index = cast(_LinkIndex, self._link_index)
+        index.sync(self.links)
+        return index.find(rel, id, self.get_root(), release)
+
+    def _remove_indexed_link(self, rel: pystac.RelType, id: str) -> None:
+        link, _ = self._find_indexed_link(rel, id)
+        if link is None:
+            return
+        if link.is_resolved():
+            target = cast(STACObject, link.target)
+            target.set_parent(None)
+            target.set_root(None)
+        self.links = [x for x in self.links if x is not link]
+        cast(_LinkIndex, self._link_index).remove(link, id, self.links)
+
     def get_all_items(self) -> Iterator[Item]:
         """
         DEPRECATED.
@@ -746,6 +1063,8 @@ class Catalog(STACObject):
         root_href: str,
         strategy: HrefLayoutStrategy | None = None,
         skip_unresolved: bool = False,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
     ) -> None:
         """Normalize HREFs will regenerate all link HREFs based on
         an absolute root_href and the canonical catalog layout as specified
@@ -757,6 +1076,10 @@ class Catalog(STACObject):
         items/children, and you only want to update those newly-added objects,
         not the whole tree.
 
+        The tree is walked without recursion, so its depth is not limited by the
+        Python stack. The new HREFs of all objects are computed before any of them
+        is set.
+
         Args:
             root_href : The absolute HREF that all links will be normalized against.
             strategy : The layout strategy to use in setting the HREFS
@@ -765,6 +1088,19 @@ class Catalog(STACObject):
                 :class:`~pystac.layout.BestPracticesLayoutStrategy`
             skip_unresolved : Skip unresolved links when normalizing the tree.
                 Defaults to False.
+            max_workers : Number of items whose HREFs may be computed by the layout
+                strategy concurrently. If ``executor`` is not provided, a
+                :class:`~concurrent.futures.ThreadPoolExecutor` of this size is used.
+                Defaults to ``None``, which computes HREFs one at a time unless an
+                ``executor`` is provided.
+            executor : Optional :class:`~concurrent.futures.Executor` used to compute
+                the HREFs of items, e.g. a
+                :class:`~concurrent.futures.ProcessPoolExecutor` for a slow
+                :class:`~pystac.layout.CustomLayoutStrategy` (the strategy must then
+                be picklable). Executors other than a
+                :class:`~concurrent.futures.ThreadPoolExecutor` are sent copies of
+                the items built from their dictionaries, which are not linked to
+                the catalog. The executor is not shut down by this method.
 
         See:
             :stac-spec:`STAC best practices document <best-practices.md#catalog-layout>`
@@ -780,78 +1116,103 @@ class Catalog(STACObject):
         if isinstance(_strategy, APILayoutStrategy) and not _is_url(root_href):
             raise STACError("When using APILayoutStrategy the root_href must be a URL")
 
-        def process_item(
-            item: Item, _root_href: str, is_root: bool, parent: Catalog | None
-        ) -> Callable[[], None] | None:
-            if not skip_unresolved:
-                item.resolve_links()
-
-            # Abort as the intended parent is not the actual parent
-            # https://github.com/stac-utils/pystac/issues/1116
-            if parent is not None and item.get_parent() != parent:
-                return None
-
-            new_self_href = _strategy.get_href(item, _root_href, is_root)
-
-            def fn() -> None:
-                item.set_self_href(new_self_href)
-
-            return fn
-
-        def process_catalog(
-            cat: Catalog,
-            _root_href: str,
-            is_root: bool,
-            parent: Catalog | None = None,
-        ) -> list[Callable[[], None]]:
-            setter_funcs: list[Callable[[], None]] = []
+        root = self.get_root()
 
+        # The objects to move and their new self HREFs, with children before the
+        # catalog linking to them. Setting HREFs while walking the catalog can
+        # result in bad links, so they are all set at the end.
+        objects: list[STACObject] = []
+        new_hrefs: list[str | None] = []
+        # Items whose HREF is yet to be computed, with their position in
+        # ``objects`` and the arguments to the strategy.
+        item_positions: list[int] = []
+        items: list[Item] = []
+        item_parent_hrefs: list[str] = []
+        item_is_root: list[bool] = []
+
+        # Catalogs being walked, with their new self HREF and remaining links
+        stack: list[tuple[Catalog, str, bool, Iterator[Link]]] = []
+
+        def visit(
+            cat: Catalog, parent_href: str, is_root: bool, parent: Catalog | None
+        ) -> bool:
             if not skip_unresolved:
                 cat.resolve_links()
 
             # Abort as the intended parent is not the actual parent
             # https://github.com/stac-utils/pystac/issues/1116
             if parent is not None and cat.get_parent() != parent:
-                return setter_funcs
+                return False
 
-            new_self_href = _strategy.get_href(cat, _root_href, is_root)
-            new_root = new_self_href
+            new_self_href = _strategy.get_href(cat, parent_href, is_root)
+            stack.append((cat, new_self_href, is_root, iter(cat.get_links())))
+            return True
 
-            for link in cat.get_links():
+        visit(self, root_href, True, None)
+        while stack:
+            cat, new_self_href, is_root, links = stack[-1]
+            for link in links:
                 if skip_unresolved and not link.is_resolved():
                     continue
                 elif link.rel == pystac.RelType.ITEM:
-                    link.resolve_stac_object(root=self.get_root())
-                    item_fn = process_item(
-                        cast(pystac.Item, link.target), new_root, is_root, cat
-                    )
-                    if item_fn is not None:
-                        setter_funcs.append(item_fn)
+                    link.resolve_stac_object(root=root)
+                    item = cast(pystac.Item, link.target)
+                    if not skip_unresolved:
+                        item.resolve_links()
+                    if item.get_parent() != cat:
+                        continue
+                    item_positions.append(len(objects))
+                    objects.append(item)
+                    new_hrefs.append(None)
+                    items.append(item)
+                    item_parent_hrefs.append(new_self_href)
+                    item_is_root.append(is_root)
                 elif link.rel == pystac.RelType.CHILD:
-                    link.resolve_stac_object(root=self.get_root())
-                    setter_funcs.extend(
-                        process_catalog(
-                            cast(pystac.Catalog | pystac.Collection, link.target),
-                            new_root,
-                            is_root=False,
-                            parent=cat,
-                        )
-                    )
-
-            def fn() -> None:
-                cat.set_self_href(new_self_href)
-
-            setter_funcs.append(fn)
-
-            return setter_funcs
+                    link.resolve_stac_object(root=root)
+                    child = cast(pystac.Catalog | pystac.Collection, link.target)
+                    if visit(child, new_self_href, False, cat):
+                        break
+            else:
+                stack.pop()
+                objects.append(cat)
+                new_hrefs.append(new_self_href)
 
-        # Collect functions that will actually mutate the objects.
-        # Delay mutation as setting hrefs while walking the catalog
-        # can result in bad links.
-        setter_funcs = process_catalog(self, root_href, is_root=True)
+        if max_workers is None and executor is None:
+            item_hrefs: Iterable[str] = map(
+                _strategy.get_href, items, item_parent_hrefs, item_is_root
+            )
+            for position, href in zip(item_positions, item_hrefs):
+                new_hrefs[position] = href
+        else:
+            own_executor = executor is None
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                if isinstance(executor, ThreadPoolExecutor):
+                    item_hrefs = executor.map(
+                        _strategy.get_href, items, item_parent_hrefs, item_is_root
+                    )
+                else:
+                    # Items pickled for other processes would take the whole tree
+                    # they link to along, so they are sent as dictionaries.
+                    item_hrefs = executor.map(
+                        partial(_get_item_href, _strategy),
+                        (
+                            item.to_dict(include_self_link=False, transform_hrefs=False)
+                            for item in items
+                        ),
+                        item_parent_hrefs,
+                        item_is_root,
+                        chunksize=_NORMALIZE_CHUNK_SIZE,
+                    )
+                for position, href in zip(item_positions, item_hrefs):
+                    new_hrefs[position] = href
+            finally:
+                if own_executor:
+                    executor.shutdown()
 
-        for fn in setter_funcs:
-            fn()
+        for obj, new_href in zip(objects, new_hrefs):
+            obj.set_self_href(new_href)
 
     def generate_subcatalogs(
         self,
@@ -891,44 +1252,97 @@ class Catalog(STACObject):
             )
 
         layout_template = LayoutTemplate(template, defaults=defaults)
+        root = self.get_root()
+
+        # Children of the catalogs that existed before, by ID, in the order in
+        # which get_child would find them
+        existing_children: dict[int, dict[str, Catalog]] = {}
+
+        def get_existing_child(parent: Catalog, child_id: str) -> Catalog | None:
+            if parent._link_index is not None:
+                return parent.get_child(child_id)
+            children = existing_children.get(id(parent))
+            if children is None:
+                children = {}
+                preferred: set[str] = set()
+                for link in parent.get_child_links():
+                    link.resolve_stac_object(root=root)
+                    child = cast(Catalog, link.target)
+                    href = link.get_href()
+                    if href is not None and child.id in href:
+                        if child.id not in preferred:
+                            preferred.add(child.id)
+                            children[child.id] = child
+                    elif child.id not in children:
+                        children[child.id] = child
+                existing_children[id(parent)] = children
+            return children.get(child_id)
+
+        # Subcatalogs by their path of IDs below this catalog, and the catalogs
+        # created here, whose children are all in ``subcats``
+        subcats: dict[tuple[str, ...], Catalog] = {}
+        created: set[int] = set()
+        # Items to move, grouped by the subcatalog they are moved to
+        batches: dict[str, tuple[Catalog, list[Item]]] = {}
+        # Paths of IDs matching the parent IDs, whose items are not moved
+        matching_paths: dict[str, bool] = {}
 
         keep_item_links: list[Link] = []
         item_links = [lk for lk in self.links if lk.rel == pystac.RelType.ITEM]
         for link in item_links:
-            link.resolve_stac_object(root=self.get_root())
+            link.resolve_stac_object(root=root)
             item = cast(pystac.Item, link.target)
-            subcat_ids = layout_template.substitute(item).split("/")
-            id_iter = reversed(parent_ids)
-            if all([f"{id}" == next(id_iter, None) for id in reversed(subcat_ids)]):
+            path = layout_template.substitute(item)
+            subcat_ids = path.split("/")
+            matches = matching_paths.get(path)
+            if matches is None:
+                id_iter = reversed(parent_ids)
+                matches = all(
+                    [f"{id}" == next(id_iter, None) for id in reversed(subcat_ids)]
+                )
+                matching_paths[path] = matches
+            if matches:
                 # Skip items for which the sub-catalog structure already
                 # matches the template. The list of parent IDs can include more
                 # elements on the root side, so compare the reversed sequences.
                 keep_item_links.append(link)
                 continue
-            curr_parent = self
-            for subcat_id in subcat_ids:
-                subcat = curr_parent.get_child(subcat_id)
-                if subcat is None:
-                    subcat_desc = "Catalog of items from {} with id {}".format(
-                        curr_parent.id, subcat_id
-                    )
-                    subcat = pystac.Catalog(id=subcat_id, description=subcat_desc)
-                    curr_parent.add_child(subcat)
-                    result.append(subcat)
-                curr_parent = subcat
+
+            batch = batches.get(path)
+            if batch is None:
+                curr_parent = self
+                for depth, subcat_id in enumerate(subcat_ids, 1):
+                    key = tuple(subcat_ids[:depth])
+                    subcat = subcats.get(key)
+                    if subcat is None and id(curr_parent) not in created:
+                        subcat = get_existing_child(curr_parent, subcat_id)
+                    if subcat is None:
+                        subcat_desc = "Catalog of items from {} with id {}".format(
+                            curr_parent.id, subcat_id
+                        )
+                        subcat = pystac.Catalog(id=subcat_id, description=subcat_desc)
+                        curr_parent.add_child(subcat)
+                        result.append(subcat)
+                        created.add(id(subcat))
+                    subcats[key] = subcat
+                    curr_parent = subcat
+                batch = batches[path] = (curr_parent, [])
 
             # resolve collection link so when added back points to correct location
             col_link = item.get_single_link(pystac.RelType.COLLECTION)
             if col_link is not None:
                 col_link.resolve_stac_object()
 
-            curr_parent.add_item(item)
+            batch[1].append(item)
 
         # keep only non-item links and item links that have not been moved elsewhere
         self.links = [
             lk for lk in self.links if lk.rel != pystac.RelType.ITEM
         ] + keep_item_links
 
+        for subcat, items in batches.values():
+            subcat.add_items(items)
+
         return result
 
     def save(
@@ -936,10 +1350,29 @@ class Catalog(STACObject):
         catalog_type: CatalogType | None = None,
         dest_href: str | None = None,
         stac_io: pystac.StacIO | None = None,
-    ) -> None:
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        incremental: bool = False,
+        dry_run: bool = False,
+        manifest: bool | None = None,
+    ) -> list[str]:
         """Save this catalog and all it's children/item to files determined by the
         object's self link HREF or a specified path.
 
+        With ``incremental=True`` only objects that changed since they were read or
+        last saved are written (see :meth:`STACObject.is_dirty
+        <pystac.STACObject.is_dirty>`), which avoids rewriting a whole catalog after
+        changing a few items. With ``dry_run=True`` nothing is written, and the HREFs
+        that would be written are returned instead.
+
+        By default objects are written one at a time. If ``max_workers`` or
+        ``executor`` is given, each object is still serialized to a dictionary in the
+        calling thread, but converting it to JSON and writing it is submitted to a
+        pool of workers. Children and items are always written before the catalog
+        that links to them, and a failure to write one object does not stop the
+        others from being written: all failures are collected and raised together as
+        a :class:`~pystac.STACSaveError` once the save is complete.
+
         Args:
             catalog_type : The catalog type that dictates the structure of
                 the catalog to save. Use a member of :class:`~pystac.CatalogType`.
@@ -951,6 +1384,42 @@ class Catalog(STACObject):
             stac_io : Optional instance of :class:`~pystac.StacIO` to use. If not
                 provided, will use the instance set while reading in the catalog,
                 or the default instance if this is not available.
+            max_workers : Number of objects that may be written concurrently. If
+                ``executor`` is not provided, a
+                :class:`~concurrent.futures.ThreadPoolExecutor` of this size is used.
+                At most twice this number of serialized objects are held in memory
+                waiting to be written. Defaults to ``None``, which writes objects
+                one at a time unless an ``executor`` is provided, in which case it
+                defaults to the number of CPUs.
+            executor : Optional :class:`~concurrent.futures.Executor` used to write
+                objects, e.g. a :class:`~concurrent.futures.ProcessPoolExecutor`
+                when JSON serialization rather than I/O is the bottleneck (the
+                ``stac_io`` must then be picklable). Pass its number of workers as
+                ``max_workers`` to bound the writes waiting for it. The executor is
+                not shut down by this method.
+            incremental : If True, objects that have not changed since they were
+                read from or saved to their self HREF are not written. Ignored, i.e.
+                every object is written, if ``dest_href`` is given or
+                ``catalog_type`` differs from the catalog type of the root catalog.
+                Defaults to False.
+            dry_run : If True, no files are written and the catalog is not
+                modified. Defaults to False.
+            manifest : If True, a manifest mapping the IDs of all children and items
+                below this catalog to their location is written next to the catalog
+                file as ``catalog-manifest.json``, for
+                ``Catalog.from_file(href, manifest=True)`` to speed up recursive
+                lookups. Unresolved children and items that are not in the manifest
+                this catalog was read with are read to build it. Defaults to
+                ``None``, which writes a manifest if this catalog was read with one.
+
+        Returns:
+            List[str]: The HREFs of the files written, or that would be written if
+            ``dry_run`` is True, in the order in which they are written.
+
+        Raises:
+            STACSaveError: If writing was concurrent and any object failed to be
+                written.
+
         Note:
             If the catalog type is ``CatalogType.ABSOLUTE_PUBLISHED``,
             all self links will be included, and hierarchical links be absolute URLs.
@@ -960,7 +1429,103 @@ class Catalog(STACObject):
             If the catalog  type is ``CatalogType.SELF_CONTAINED``, no self links will
             be included and hierarchical links will be relative URLs.
         """
+        root = self.get_root()
+        if incremental and (
+            dest_href is not None
+            or (
+                root is not None
+                and catalog_type is not None
+                and catalog_type != root.catalog_type
+            )
+        ):
+            # Files that are not rewritten would not match the others.
+            incremental = False
+        write_manifest = self._manifest is not None if manifest is None else manifest
+        if incremental and write_manifest and self._manifest is None:
+            # There is no manifest to keep if nothing changed.
+            incremental = False
+
+        if dry_run:
+            writer: _ObjectWriter = _DryRunWriter(incremental)
+            # ``_save`` sets the catalog types, which a dry run must not modify.
+            prev_catalog_types = [(c, c.catalog_type) for c in (self, root) if c]
+            try:
+                self._save(catalog_type, dest_href, stac_io, writer)
+            finally:
+                for c, prev_catalog_type in prev_catalog_types:
+                    c.catalog_type = prev_catalog_type
+            if write_manifest:
+                writer.written.append(self._get_manifest_dest_href(dest_href))
+            return writer.written
+
+        if max_workers is None and executor is None:
+            writer = _ObjectWriter(incremental)
+            self._save(catalog_type, dest_href, stac_io, writer)
+            if write_manifest and (writer.written or not incremental):
+                writer.written.append(self._save_manifest(dest_href, stac_io))
+            return writer.written
+
+        max_workers = max_workers or os.cpu_count() or 1
+        own_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        concurrent_writer = _ConcurrentObjectWriter(
+            executor, max_pending=2 * max_workers, incremental=incremental
+        )
+        try:
+            self._save(catalog_type, dest_href, stac_io, concurrent_writer)
+            concurrent_writer.wait_all()
+        finally:
+            if own_executor:
+                executor.shutdown()
+        if concurrent_writer.errors:
+            raise pystac.STACSaveError(concurrent_writer.errors)
+        if write_manifest and (concurrent_writer.written or not incremental):
+            concurrent_writer.written.append(self._save_manifest(dest_href, stac_io))
+        return concurrent_writer.written
+
+    def _get_manifest_dest_href(self, dest_href: str | None) -> str:
+        if dest_href is not None:
+            return make_absolute_href(MANIFEST_FILE_NAME, dest_href, start_is_dir=True)
+        return get_manifest_href(self.self_href)
+
+    def _save_manifest(
+        self, dest_href: str | None, stac_io: pystac.StacIO | None
+    ) -> str:
+        """Writes the manifest of this catalog and returns where it was written."""
+        manifest = CatalogManifest.from_catalog(self, self._manifest)
+        manifest_href, stac_io = self._get_save_target(
+            self._get_manifest_dest_href(dest_href), stac_io
+        )
+        stac_io.save_json(manifest_href, manifest.to_dict())
+        self._manifest = manifest
+        return manifest_href
+
+    def to_parquet(self, dest_dir: str, chunk_size: int | None = None) -> list[str]:
+        """Writes the items of this catalog and all its children to one GeoParquet
+        file per collection in the stac-geoparquet layout. See
+        :func:`pystac.geoparquet.write_catalog_parquet`. Requires the ``pyarrow``
+        package.
+
+        Args:
+            dest_dir : Directory to write the files to.
+            chunk_size : Optional number of items per row group.
 
+        Returns:
+            list[str]: The paths of the files written.
+        """
+        from pystac.geoparquet import DEFAULT_CHUNK_SIZE, write_catalog_parquet
+
+        return write_catalog_parquet(self, dest_dir, chunk_size or DEFAULT_CHUNK_SIZE)
+
+    @_caching_hrefs()
+    def _save(
+        self,
+        catalog_type: CatalogType | None,
+        dest_href: str | None,
+        stac_io: pystac.StacIO | None,
+        writer: _ObjectWriter,
+    ) -> None:
         root = self.get_root()
         if root is None:
             raise Exception("There is no root catalog")
@@ -970,6 +1535,8 @@ class Catalog(STACObject):
 
         items_include_self_link = root.catalog_type in [CatalogType.ABSOLUTE_PUBLISHED]
 
+        subtree = writer.mark()
+
         for child_link in self.get_child_links():
             if child_link.is_resolved():
                 child = cast(Catalog, child_link.target)
@@ -978,12 +1545,9 @@ class Catalog(STACObject):
                     child_dest_href = make_absolute_href(
                         rel_href, dest_href, start_is_dir=True
                     )
-                    child.save(
-                        dest_href=os.path.dirname(child_dest_href),
-                        stac_io=stac_io,
-                    )
+                    child._save(None, os.path.dirname(child_dest_href), stac_io, writer)
                 else:
-                    child.save(stac_io=stac_io)
+                    child._save(None, None, stac_io, writer)
 
         for item_link in self.get_item_links():
             if item_link.is_resolved():
@@ -993,15 +1557,9 @@ class Catalog(STACObject):
                     item_dest_href = make_absolute_href(
                         rel_href, dest_href, start_is_dir=True
                     )
-                    item.save_object(
-                        include_self_link=items_include_self_link,
-                        dest_href=item_dest_href,
-                        stac_io=stac_io,
-                    )
+                    writer.write(item, items_include_self_link, item_dest_href, stac_io)
                 else:
-                    item.save_object(
-                        include_self_link=items_include_self_link, stac_io=stac_io
-                    )
+                    writer.write(item, items_include_self_link, None, stac_io)
 
         include_self_link = False
         # include a self link if this is the root catalog
@@ -1019,16 +1577,15 @@ class Catalog(STACObject):
             catalog_dest_href = make_absolute_href(
                 rel_href, dest_href, start_is_dir=True
             )
-        self.save_object(
-            include_self_link=include_self_link,
-            dest_href=catalog_dest_href,
-            stac_io=stac_io,
-        )
+
+        # Children and items must be on disk before the catalog linking to them.
+        writer.wait_since(subtree)
+        writer.write(self, include_self_link, catalog_dest_href, stac_io)
         if catalog_type is not None:
             self.catalog_type = catalog_type
 
     def walk(
-        self,
+        self, prefetch: int = 0, release: bool = False
     ) -> Iterable[tuple[Catalog, Iterable[Catalog], Iterable[Item]]]:
         """Walks through children and items of catalogs.
 
@@ -1040,16 +1597,135 @@ class Catalog(STACObject):
 
         This has similar functionality to Python's :func:`os.walk`.
 
+        Args:
+            prefetch : Number of upcoming unresolved child or item links of each
+                catalog to read concurrently while iterating. See
+                :meth:`get_items`. Defaults to 0.
+            release : If True, item links are set back to their HREF once the
+                iteration moves past each item, and child links once the iteration
+                over the yielded children or their subtree has moved past them, so
+                that read-only walks of large catalogs run in constant memory. Links
+                that were already resolved are left untouched. Changes made to
+                released objects are not saved with this catalog. Defaults to False.
+
         Returns:
            Generator[(Catalog, Generator[Catalog], Generator[Item])]: A generator that
            yields a 3-tuple (parent_catalog, children, items).
         """
-        children = self.get_children()
-        items = self.get_items()
+        with _prefetch_executor.hold(prefetch):
+            children = self._get_children(prefetch, release=release)
+            items = self.get_items(prefetch=prefetch, release=release)
 
-        yield self, children, items
-        for child in self.get_children():
-            yield from child.walk()
+            yield self, children, items
+            for child in self._get_children(prefetch, release=release):
+                yield from child.walk(prefetch=prefetch, release=release)
+
+    def _get_children(
+        self, prefetch: int, release: bool = False
+    ) -> Iterator[Catalog | Collection]:
+        return map(
+            lambda x: cast(pystac.Catalog | pystac.Collection, x),
+            self.get_stac_objects(
+                pystac.RelType.CHILD, prefetch=prefetch, release=release
+            ),
+        )
+
+    async def get_children_async(
+        self, stac_io: pystac.stac_io.AsyncStacIO | None = None
+    ) -> AsyncIterator[Catalog | Collection]:
+        """Asynchronous version of :meth:`get_children`. All child links of this
+        catalog are resolved concurrently before the first child is yielded.
+
+        Args:
+            stac_io : Optional :class:`~pystac.stac_io.AsyncStacIO` to read children
+                with. Defaults to the instance set while reading in the catalog, or
+                :meth:`AsyncStacIO.default <pystac.stac_io.AsyncStacIO.default>`.
+
+        Return:
+            AsyncIterator[Catalog or Collection]: The children of this catalog, in
+            link order.
+        """
+        for child in await self._resolve_async(pystac.RelType.CHILD, stac_io):
+            yield cast(pystac.Catalog | pystac.Collection, child)
+
+    async def get_items_async(
+        self,
+        *ids: str,
+        recursive: bool = False,
+        stac_io: pystac.stac_io.AsyncStacIO | None = None,
+    ) -> AsyncIterator[Item]:
+        """Asynchronous version of :meth:`get_items`. The item links of each
+        catalog are resolved concurrently before its first item is yielded.
+
+        Args:
+            *ids : The IDs of the items to include.
+            recursive : If True, search this catalog and all children for the
+                item; otherwise, only search the items of this catalog. Defaults
+                to False.
+            stac_io : Optional :class:`~pystac.stac_io.AsyncStacIO` to read items
+                with. Defaults to the instance set while reading in the catalog, or
+                :meth:`AsyncStacIO.default <pystac.stac_io.AsyncStacIO.default>`.
+
+        Return:
+            AsyncIterator[Item]: Items in the same order as :meth:`get_items`.
+        """
+        for item in await self._resolve_async(pystac.RelType.ITEM, stac_io):
+            if not ids or item.id in ids:
+                yield cast(pystac.Item, item)
+        if recursive:
+            async for child in self.get_children_async(stac_io=stac_io):
+                async for item in child.get_items_async(
+                    *ids, recursive=True, stac_io=stac_io
+                ):
+                    yield item
+
+    async def walk_async(
+        self, stac_io: pystac.stac_io.AsyncStacIO | None = None
+    ) -> AsyncIterator[tuple[Catalog, list[Catalog | Collection], list[Item]]]:
+        """Asynchronous version of :meth:`walk`.
+
+        The children and items of each catalog are resolved concurrently, so unlike
+        :meth:`walk` the yielded children and items are lists rather than lazy
+        iterables.
+
+        Args:
+            stac_io : Optional :class:`~pystac.stac_io.AsyncStacIO` to read objects
+                with. Defaults to the instance set while reading in the catalog, or
+                :meth:`AsyncStacIO.default <pystac.stac_io.AsyncStacIO.default>`.
+
+        Returns:
+           AsyncIterator[(Catalog, list[Catalog], list[Item])]: An async iterator
+           that yields a 3-tuple (parent_catalog, children, items).
+        """
+        children, items = await asyncio.gather(
+            self._resolve_async(pystac.RelType.CHILD, stac_io),
+            self._resolve_async(pystac.RelType.ITEM, stac_io),
+        )
+        yield (
+            self,
+            cast(list[pystac.Catalog | pystac.Collection], children),
+            cast(list[pystac.Item], items),
+        )
+        for child in children:
+            async for result in cast(Catalog, child).walk_async(stac_io=stac_io):
+                yield result
+
+    async def _resolve_async(
+        self, rel: str | pystac.RelType, stac_io: pystac.stac_io.AsyncStacIO | None
+    ) -> list[STACObject]:
+        root = self.get_root()
+        links = [link for link in self.links if link.rel == rel]
+        await asyncio.gather(
+            *(
+                link.resolve_stac_object_async(root=root, stac_io=stac_io)
+                for link in links
+                if not link.is_resolved()
+            )
+        )
+        for link in links:
+            # Sets the parent of objects that were already resolved
+            link.resolve_stac_object(root=root)
+        return [cast(STACObject, link.target) for link in links]
 
     def fully_resolve(self) -> None:
         """Resolves every link in this catalog.
@@ -1065,6 +1741,39 @@ class Catalog(STACObject):
             for item in items:
                 pass
 
+    def set_cache_limits(
+        self, max_objects: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        """Bounds the number and approximate size of the items kept in memory by the
+        resolved object cache of this catalog's root.
+
+        Once a limit is exceeded, the least recently used items that were read from
+        an HREF and not modified since are evicted: the link they were read
+        through falls back to their HREF, and they are read again on next access.
+        This keeps memory bounded while iterating over large catalogs, e.g. with
+        :meth:`walk` or :meth:`get_items`. See
+        :meth:`ResolvedObjectCache.set_limits
+        <pystac.cache.ResolvedObjectCache.set_limits>` for details.
+
+        Args:
+            max_objects : Maximum number of items read from an HREF to keep in
+                memory. Defaults to None, which is unbounded.
+            max_bytes : Approximate maximum size in bytes of the items read from an
+                HREF to keep in memory. Defaults to None, which is unbounded.
+        """
+        root = self.get_root() or self
+        root._resolved_objects.set_limits(max_objects=max_objects, max_bytes=max_bytes)
+
+    def get_cache_stats(self) -> CacheStats:
+        """Returns the hit, miss and eviction counters of the resolved object cache
+        of this catalog's root.
+
+        Returns:
+            CacheStats: The counters of the cache.
+        """
+        root = self.get_root() or self
+        return root._resolved_objects.stats
+
     def validate_all(self, max_items: int | None = None, recursive: bool = True) -> int:
         """Validates each catalog, collection, item contained within this catalog.
 
@@ -1229,16 +1938,15 @@ class Catalog(STACObject):
     ) -> C:
         if migrate:
             info = identify_stac_object(d)
-            d = migrate_to_latest(d, info)
+            d = migrate_to_latest(d, info, in_place=not preserve_dict)
+        elif preserve_dict:
+            d = deepcopy(d)
 
         if not cls.matches_object_type(d):
             raise STACTypeError(d, cls)
 
         catalog_type = CatalogType.determine_type(d)
 
-        if preserve_dict:
-            d = deepcopy(d)
-
         id = d.pop("id")
         description = d.pop("description")
         title = d.pop("title", None)
@@ -1276,12 +1984,59 @@ class Catalog(STACObject):
         return cast(Catalog, super().full_copy(root, parent))
 
     @classmethod
-    def from_file(cls: type[C], href: HREF, stac_io: pystac.StacIO | None = None) -> C:
+    def from_file(
+        cls: type[C],
+        href: HREF,
+        stac_io: pystac.StacIO | None = None,
+        manifest: bool = False,
+    ) -> C:
+        """Reads a catalog from a file.
+
+        Args:
+            href : The HREF to read the catalog from.
+            stac_io : Optional instance of :class:`~pystac.StacIO` to use. If not
+                provided, will use the default instance.
+            manifest : If True, also reads the manifest written next to the catalog
+                file by ``Catalog.save(manifest=True)``, which is used by
+                :meth:`get_child` and :meth:`get_items` to find children and items
+                without reading the whole catalog. Defaults to False.
+        """
         if stac_io is None:
             stac_io = pystac.StacIO.default()
 
         result = super().from_file(href, stac_io)
         result._stac_io = stac_io
+        if manifest:
+            result._manifest = CatalogManifest.from_dict(
+                stac_io.read_json(get_manifest_href(result.self_href))
+            )
+
+        return result
+
+    @classmethod
+    async def from_file_async(
+        cls: type[C], href: HREF, stac_io: pystac.stac_io.AsyncStacIO | None = None
+    ) -> C:
+        """Asynchronous version of :meth:`from_file`.
+
+        Args:
+            href : The HREF to read the catalog from.
+            stac_io : Optional :class:`~pystac.stac_io.AsyncStacIO` to use. If not
+                provided, :meth:`AsyncStacIO.default
+                <pystac.stac_io.AsyncStacIO.default>` is used. The instance is kept
+                on the catalog for resolving its children and items with the
+                ``*_async`` methods.
+        """
+        if stac_io is None:
+            stac_io = pystac.stac_io.AsyncStacIO.default()
+
+        href = make_posix_style(href)
+        if not is_absolute_href(href):
+            href = make_absolute_href(href)
+
+        d = await stac_io.read_json(href)
+        result = cls._from_file_dict(d, href)
+        result._async_stac_io = stac_io
 
         return result
 
@@ -1300,3 +2055,242 @@ class Catalog(STACObject):
         from pystac.extensions.ext import CatalogExt
 
         return CatalogExt(stac_object=self)
+
+
+class _ObjectWriter:
+    """Writes the objects of a :meth:`Catalog.save` one at a time, in the calling
+    thread. If ``incremental`` is True, objects that are not dirty are skipped.
+    The HREFs written are recorded in :attr:`written`."""
+
+    def __init__(self, incremental: bool = False):
+        self.incremental = incremental
+        self.written: list[str] = []
+
+    def write(
+        self,
+        obj: STACObject,
+        include_self_link: bool,
+        dest_href: str | None,
+        stac_io: pystac.StacIO | None,
+    ) -> None:
+        if self.incremental and not obj.is_dirty():
+            return
+        dest_href, stac_io = obj._get_save_target(dest_href, stac_io)
+        obj.save_object(
+            include_self_link=include_self_link, dest_href=dest_href, stac_io=stac_io
+        )
+        self.written.append(dest_href)
+
+    def mark(self) -> int:
+        """Returns a marker for the writes submitted from now on."""
+        return 0
+
+    def wait_since(self, marker: int) -> None:
+        """Blocks until every write submitted after ``marker`` has finished."""
+        pass
+
+
+class _DryRunWriter(_ObjectWriter):
+    """Records the HREFs a :meth:`Catalog.save` would write, without writing."""
+
+    def write(
+        self,
+        obj: STACObject,
+        include_self_link: bool,
+        dest_href: str | None,
+        stac_io: pystac.StacIO | None,
+    ) -> None:
+        if self.incremental and not obj.is_dirty():
+            return
+        dest_href, _ = obj._get_save_target(dest_href, stac_io)
+        self.written.append(dest_href)
+
+
+class _ConcurrentObjectWriter(_ObjectWriter):
+    """Writes the objects of a :meth:`Catalog.save` using an executor.
+
+    Objects are converted to dictionaries in the calling thread, since that walks
+    the (not thread-safe) object graph; only JSON serialization and writing happen
+    in the executor. At most ``max_pending`` writes are in flight at once. Failures
+    are collected in :attr:`errors` rather than raised.
+    """
+
+    def __init__(self, executor: Executor, max_pending: int, incremental: bool = False):
+        super().__init__(incremental)
+        self.executor = executor
+        self.max_pending = max_pending
+        self.errors: dict[str, Exception] = {}
+        self._count = 0
+        self._pending: dict[Future[None], tuple[int, str, STACObject]] = {}
+
+    def write(
+        self,
+        obj: STACObject,
+        include_self_link: bool,
+        dest_href: str | None,
+        stac_io: pystac.StacIO | None,
+    ) -> None:
+        if self.incremental and not obj.is_dirty():
+            return
+        try:
+            dest_href, stac_io = obj._get_save_target(dest_href, stac_io)
+            d = obj.to_dict(include_self_link=include_self_link)
+        except Exception as e:
+            self.errors[dest_href or repr(obj)] = e
+            return
+
+        while len(self._pending) >= self.max_pending:
+            done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+            self._reap(done)
+
+        future = self.executor.submit(stac_io.save_json, dest_href, d)
+        self._pending[future] = (self._count, dest_href, obj)
+        self._count += 1
+        self.written.append(dest_href)
+
+    def mark(self) -> int:
+        return self._count
+
+    def wait_since(self, marker: int) -> None:
+        futures = [f for f, (n, _, _) in self._pending.items() if n >= marker]
+        if futures:
+            done, _ = wait(futures)
+            self._reap(done)
+
+    def wait_all(self) -> None:
+        self.wait_since(0)
+
+    def _reap(self, done: Iterable[Future[None]]) -> None:
+        for future in done:
+            _, href, obj = self._pending.pop(future)
+            error = future.exception()
+            if isinstance(error, Exception):
+                self.errors[href] = error
+            elif href == obj.get_self_href():
+                obj._mark_clean()
+
+
+def _find_link(catalog: Catalog, rel: str, href: str) -> Link | None:
+    return next(
+        (
+            link
+            for link in catalog.links
+            if link.rel == rel and link.get_absolute_href() == href
+        ),
+        None,
+    )
+
+
+class _LinkIndex:
+    """Index of the child and item links of a catalog by the ID of the object they
+    link to, see :meth:`Catalog.enable_link_index`.
+
+    Links that were never resolved, so that the ID of their target is unknown, are
+    kept in :attr:`unknown` until a lookup reads them, and :attr:`segments` maps the
+    path segments of their HREFs, without file extension, to them. The index
+    remembers the list of links it was built from, and :meth:`sync` rebuilds it if
+    that list was replaced or changed length other than through :meth:`add` and
+    :meth:`remove`.
+    """
+
+    def __init__(self) -> None:
+        self.ids: dict[str, dict[str, Link]] = {}
+        self.unknown: dict[str, dict[Link, tuple[str, ...]]] = {}
+        self.segments: dict[str, dict[str, dict[Link, None]]] = {}
+        self._links: list[Link] | None = None
+        self._size = 0
+
+    def sync(self, links: list[Link]) -> None:
+        """Rebuilds the index if ``links`` changed since it was indexed."""
+        if links is self._links and len(links) == self._size:
+            return
+        known = {link: id for ids in self.ids.values() for id, link in ids.items()}
+        self.ids = {pystac.RelType.CHILD: {}, pystac.RelType.ITEM: {}}
+        self.unknown = {pystac.RelType.CHILD: {}, pystac.RelType.ITEM: {}}
+        self.segments = {pystac.RelType.CHILD: {}, pystac.RelType.ITEM: {}}
+        for link in links:
+            self._index(link, known.get(link))
+        self._links = links
+        self._size = len(links)
+
+    def add(self, link: Link, links: list[Link]) -> None:
+        """Indexes ``link``, which was just appended to ``links``."""
+        if links is self._links and len(links) == self._size + 1:
+            self._index(link)
+            self._size += 1
+        else:
+            self.sync(links)
+
+    def remove(self, link: Link, id: str, links: list[Link]) -> None:
+        """Drops ``link`` to the object with ``id``, after it was removed from the
+        links, which are now ``links``."""
+        ids = self.ids[link.rel]
+        if ids.get(id) is link:
+            del ids[id]
+        self._forget(link)
+        self._links = links
+        self._size = len(links)
+
+    def find(
+        self, rel: str, id: str, root: Catalog | None, release: bool = False
+    ) -> tuple[Link | None, bool]:
+        """Returns the link with ``rel`` to the object with ``id`` and whether it was
+        resolved before, or ``(None, False)`` if there is no such link.
+
+        Links with an unknown target ID are read until the object is found, those
+        with ``id`` as a segment of their HREF first. If ``release`` is True, those
+        that do not link to it are set back to their HREF once read; their IDs stay
+        in the index.
+        """
+        ids = self.ids[rel]
+        link = ids.get(id)
+        if link is not None:
+            if not link.is_resolved() or cast(STACObject, link.target).id == id:
+                return link, link.is_resolved()
+            # The ID of the object changed after it was indexed
+            del ids[id]
+            self._index(link)
+            if id in ids:
+                return ids[id], ids[id].is_resolved()
+
+        unknown = self.unknown[rel]
+        candidates = list(self.segments[rel].get(id, ()))[::-1]
+        while unknown:
+            link = candidates.pop() if candidates else next(iter(unknown))
+            resolved = link.is_resolved()
+            link.resolve_stac_object(root=root)
+            self._forget(link)
+            self._index(link)
+            if cast(STACObject, link.target).id == id:
+                return link, resolved
+            if release and not resolved:
+                link._release_target(root)
+        return None, False
+
+    def _index(self, link: Link, id: str | None = None) -> None:
+        ids = self.ids.get(link.rel)
+        if ids is None:
+            return
+        if id is None and link.is_resolved():
+            id = cast(STACObject, link.target).id
+        if id is not None:
+            # Like a scan, lookups find the first link to an ID.
+            ids.setdefault(id, link)
+            return
+        href = link.get_href(transform_href=False) or ""
+        *dirs, name = href.split("/")
+        keys = tuple({*dirs, os.path.splitext(name)[0]})
+        self.unknown[link.rel][link] = keys
+        segments = self.segments[link.rel]
+        for key in keys:
+            segments.setdefault(key, {})[link] = None
+
+    def _forget(self, link: Link) -> None:
+        keys = self.unknown[link.rel].pop(link, None)
+        if keys is None:
+            return
+        segments = self.segments[link.rel]
+        for key in keys:
+            del segments[key][link]
+            if not segments[key]:
+                del segments[key]
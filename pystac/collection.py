@@ -12,8 +12,6 @@ from typing import (
     cast,
 )
 
-from dateutil import tz
-
 import pystac
 from pystac import CatalogType, STACObjectType
 from pystac.asset import Asset, Assets
@@ -384,59 +382,273 @@ class Extent:
             Extent: An Extent that spatially and temporally covers all of the
             given items.
         """
-        bounds_values: list[list[float]] = [
-            [float("inf")],
-            [float("inf")],
-            [float("-inf")],
-            [float("-inf")],
-        ]
-        datetimes: list[datetime] = []
-        starts: list[datetime] = []
-        ends: list[datetime] = []
+        return ExtentAccumulator().update(items).to_extent(extra_fields)
+
+
+class ExtentAccumulator:
+    """Computes the :class:`Extent` of items in a single pass, keeping only the
+    running bounds in memory.
+
+    Accumulators can be filled separately, for example by parallel workers each
+    reading part of the items, and then combined with :meth:`merge`. They only hold
+    floats and datetimes, so they can be pickled.
 
+    Bounding boxes crossing the antimeridian, whose west edge is greater than their
+    east edge, are supported. Once one is added, longitudes are taken in
+    ``[0, 360)`` so that the extent crosses the antimeridian too, or covers all
+    longitudes if a bounding box also crosses the prime meridian. An extent crossing
+    the antimeridian is followed by two sub-extents split at the antimeridian.
+
+    Example:
+
+        >>> accumulator = ExtentAccumulator()
+        >>> for item in items:
+        ...     accumulator.add_item(item)
+        >>> collection.extent = accumulator.to_extent()
+    """
+
+    count: int
+    """Number of bounding boxes added."""
+
+    start: datetime | None
+    """Earliest datetime or start datetime added, if any."""
+
+    end: datetime | None
+    """Latest datetime or end datetime added, if any."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.start = None
+        self.end = None
+        inf = float("inf")
+        self._south = inf
+        self._north = -inf
+        # Longitude range in [-180, 180], or None once a bbox crosses the
+        # antimeridian.
+        self._lon: list[float] | None = [inf, -inf]
+        # Longitude range in [0, 360), as the least west edge and greatest east
+        # edge east and west of the prime meridian, with the western ones standing
+        # for themselves plus 360. They are not shifted, so that no precision is
+        # lost. Not used once a bbox crosses the prime meridian.
+        self._east_lon = [inf, -inf]
+        self._west_lon = [inf, -inf]
+        self._crosses_meridian = False
+        # Latitude ranges of the bboxes reaching east and west of the prime
+        # meridian, for the sub-extents.
+        self._east_lat = [inf, -inf]
+        self._west_lat = [inf, -inf]
+
+    def add_item(self, item: Item) -> None:
+        """Adds the bounding box and datetimes of ``item``."""
+        if item.bbox:
+            self.add_bbox(item.bbox)
+        self.add_interval(item.datetime, item.datetime)
+        start = item.properties.get("start_datetime")
+        if start is not None:
+            self.add_interval(_parse_datetime(start), None)
+        end = item.properties.get("end_datetime")
+        if end is not None:
+            self.add_interval(None, _parse_datetime(end))
+
+    def update(self, items: Iterable[Item]) -> ExtentAccumulator:
+        """Adds all ``items`` and returns this accumulator."""
         for item in items:
-            if item.bbox is not None:
-                for i in range(0, 4):
-                    bounds_values[i].append(item.bbox[i])
-            if item.datetime is not None:
-                datetimes.append(item.datetime)
-            if item.common_metadata.start_datetime is not None:
-                starts.append(item.common_metadata.start_datetime)
-            if item.common_metadata.end_datetime is not None:
-                ends.append(item.common_metadata.end_datetime)
-
-        if not any(datetimes + starts):
-            start_timestamp = None
-        else:
-            start_timestamp = min(
-                [
-                    dt if dt.tzinfo else dt.replace(tzinfo=tz.UTC)
-                    for dt in datetimes + starts
-                ]
+            self.add_item(item)
+        return self
+
+    def add_bbox(self, bbox: list[float] | list[int]) -> None:
+        """Adds a 2D or 3D bounding box, which may cross the antimeridian."""
+        half = len(bbox) // 2
+        self._add(bbox[0], bbox[1], bbox[half], bbox[half + 1])
+
+    def add_bboxes(self, bboxes: Any) -> None:
+        """Adds 2D or 3D bounding boxes, given as a sequence or an array of shape
+        ``(n, 4)`` or ``(n, 6)``. Uses NumPy if it is installed. Rows containing NaN
+        are skipped."""
+        try:
+            import numpy as np
+        except ImportError:
+            for bbox in bboxes:
+                if not any(v != v for v in bbox):
+                    self.add_bbox(bbox)
+            return
+
+        array = np.asarray(bboxes, dtype=float)
+        if len(array) == 0:
+            return
+        array = array[~np.isnan(array).any(axis=1)]
+        half = array.shape[1] // 2
+        west, south = array[:, 0], array[:, 1]
+        east, north = array[:, half], array[:, half + 1]
+        if len(west) == 0:
+            return
+        self.count += len(west)
+        self._south = min(self._south, float(south.min()))
+        self._north = max(self._north, float(north.max()))
+
+        crosses = west > east
+        if self._lon is not None:
+            if crosses.any():
+                self._lon = None
+            else:
+                self._extend(self._lon, float(west.min()), float(east.max()))
+        if not self._crosses_meridian:
+            crosses_meridian = np.where(
+                crosses, (west < 0) | (east > 0), (west < 0) & (east > 0)
             )
-        if not any(datetimes + ends):
-            end_timestamp = None
-        else:
-            end_timestamp = max(
-                [
-                    dt if dt.tzinfo else dt.replace(tzinfo=tz.UTC)
-                    for dt in datetimes + ends
-                ]
+            if crosses_meridian.any():
+                self._crosses_meridian = True
+            else:
+                positive = west >= 0
+                for bounds, wests, easts in (
+                    (self._east_lon, west[positive], east[positive & ~crosses]),
+                    (self._west_lon, west[~positive], east[~positive | crosses]),
+                ):
+                    self._extend(
+                        bounds,
+                        float(wests.min()) if len(wests) else bounds[0],
+                        float(easts.max()) if len(easts) else bounds[1],
+                    )
+        reaches_east = (east >= 0) | crosses
+        reaches_west = (west < 0) | crosses
+        if reaches_east.any():
+            self._extend(
+                self._east_lat,
+                float(south[reaches_east].min()),
+                float(north[reaches_east].max()),
+            )
+        if reaches_west.any():
+            self._extend(
+                self._west_lat,
+                float(south[reaches_west].min()),
+                float(north[reaches_west].max()),
             )
 
-        spatial = SpatialExtent(
-            [
-                [
-                    min(bounds_values[0]),
-                    min(bounds_values[1]),
-                    max(bounds_values[2]),
-                    max(bounds_values[3]),
-                ]
-            ]
+    def _add(self, west: float, south: float, east: float, north: float) -> None:
+        self.count += 1
+        if south < self._south:
+            self._south = south
+        if north > self._north:
+            self._north = north
+
+        crosses = west > east
+        if self._lon is not None:
+            if crosses:
+                self._lon = None
+            else:
+                self._extend(self._lon, west, east)
+        if not self._crosses_meridian:
+            if crosses:
+                if west < 0 or east > 0:
+                    self._crosses_meridian = True
+                else:
+                    self._extend(self._east_lon, west, self._east_lon[1])
+                    self._extend(self._west_lon, self._west_lon[0], east)
+            elif west >= 0:
+                self._extend(self._east_lon, west, east)
+            elif east <= 0:
+                self._extend(self._west_lon, west, east)
+            else:
+                self._crosses_meridian = True
+        if east >= 0 or crosses:
+            self._extend(self._east_lat, south, north)
+        if west < 0 or crosses:
+            self._extend(self._west_lat, south, north)
+
+    @staticmethod
+    def _extend(bounds: list[float], low: float, high: float) -> None:
+        if low < bounds[0]:
+            bounds[0] = low
+        if high > bounds[1]:
+            bounds[1] = high
+
+    def add_interval(self, start: datetime | None, end: datetime | None) -> None:
+        """Adds a time interval. Either end may be None. Naive datetimes are assumed
+        to be in UTC."""
+        if start is not None:
+            if start.tzinfo is None:
+                start = start.replace(tzinfo=timezone.utc)
+            if self.start is None or start < self.start:
+                self.start = start
+        if end is not None:
+            if end.tzinfo is None:
+                end = end.replace(tzinfo=timezone.utc)
+            if self.end is None or end > self.end:
+                self.end = end
+
+    def merge(self, other: ExtentAccumulator) -> ExtentAccumulator:
+        """Adds the bounding boxes and datetimes added to ``other``, and returns this
+        accumulator."""
+        self.count += other.count
+        self._south = min(self._south, other._south)
+        self._north = max(self._north, other._north)
+        if self._lon is not None:
+            if other._lon is None:
+                self._lon = None
+            else:
+                self._extend(self._lon, *other._lon)
+        self._crosses_meridian |= other._crosses_meridian
+        self._extend(self._east_lon, *other._east_lon)
+        self._extend(self._west_lon, *other._west_lon)
+        self._extend(self._east_lat, *other._east_lat)
+        self._extend(self._west_lat, *other._west_lat)
+        self.add_interval(other.start, other.end)
+        return self
+
+    def bboxes(self) -> Bboxes:
+        """Returns the bounding box covering everything added, followed by its parts
+        on each side of the antimeridian if it crosses it.
+
+        Without any bounding box added, returns the infinite bounding box
+        ``[[inf, inf, -inf, -inf]]``.
+        """
+        if self.count == 0:
+            inf = float("inf")
+            return [[inf, inf, -inf, -inf]]
+        lon = self._lon
+        if lon is not None:
+            west, east = lon
+        elif not self._crosses_meridian:
+            inf = float("inf")
+            west = self._east_lon[0] if self._east_lon[0] < inf else self._west_lon[0]
+            east = self._west_lon[1] if self._west_lon[1] > -inf else self._east_lon[1]
+            # Edges on the antimeridian are taken on the side of the extent
+            if west == 180:
+                west = -180.0
+            if east == -180:
+                east = 180.0
+        else:
+            west, east = -180.0, 180.0
+        bbox: list[float | int] = [west, self._south, east, self._north]
+        if west <= east:
+            return [bbox]
+        return [
+            bbox,
+            [west, self._east_lat[0], 180, self._east_lat[1]],
+            [-180, self._west_lat[0], east, self._west_lat[1]],
+        ]
+
+    def to_extent(self, extra_fields: dict[str, Any] | None = None) -> Extent:
+        """Returns the :class:`Extent` covering everything added.
+
+        Args:
+            extra_fields : Optional dictionary containing additional top-level fields
+                defined on the Extent object.
+        """
+        return Extent(
+            spatial=SpatialExtent(self.bboxes()),
+            temporal=TemporalExtent([[self.start, self.end]]),
+            extra_fields=extra_fields,
         )
-        temporal = TemporalExtent([[start_timestamp, end_timestamp]])
 
-        return Extent(spatial=spatial, temporal=temporal, extra_fields=extra_fields)
+
+def _parse_datetime(s: str) -> datetime:
+    # datetime.fromisoformat is much faster than str_to_datetime, but before Python
+    # 3.11 only reads some of the RFC 3339 timestamps.
+    try:
+        return datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+    except ValueError:
+        return str_to_datetime(s)
 
 
 class Collection(Catalog, Assets):
@@ -639,16 +851,15 @@ class Collection(Catalog, Assets):
 
         if migrate:
             info = identify_stac_object(d)
-            d = migrate_to_latest(d, info)
+            d = migrate_to_latest(d, info, in_place=not preserve_dict)
+        elif preserve_dict:
+            d = deepcopy(d)
 
         if not cls.matches_object_type(d):
             raise STACTypeError(d, cls)
 
         catalog_type = CatalogType.determine_type(d)
 
-        if preserve_dict:
-            d = deepcopy(d)
-
         id = d.pop("id")
         description = d.pop("description")
         license = d.pop("license")
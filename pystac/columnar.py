@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from copy import deepcopy
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+import pystac
+from pystac.collection import ExtentAccumulator
+from pystac.errors import STACTypeError
+from pystac.index import (
+    IntervalLike,
+    geometry_intersects,
+    parse_interval,
+    query_bbox,
+    split_bbox,
+)
+from pystac.utils import str_to_datetime
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from pystac.item_collection import ItemCollection
+
+
+class ColumnarItemCollection(Collection[pystac.Item]):
+    """A GeoJSON FeatureCollection of STAC Items, stored as columns.
+
+    The IDs, bounding boxes, datetimes and selected properties of the items are
+    held in NumPy arrays, which can be filtered and sorted without creating any
+    :class:`~pystac.Item`. Items are only created from their dictionaries when they
+    are accessed, and are then kept.
+
+    The columns are read when the collection is created, so they do not follow
+    changes made to the items afterwards. :meth:`to_dict` does include those
+    changes.
+
+    Requires the ``numpy`` package.
+
+    Args:
+        features : The dictionaries of the items. They are not copied, and must not
+            be modified afterwards.
+        properties : Names of the item properties to store as columns in
+            :attr:`properties`.
+        extra_fields : Dictionary of additional top-level fields of the
+            FeatureCollection.
+
+    Raises:
+        ImportError: If ``numpy`` is not installed.
+    """
+
+    ids: NDArray[Any]
+    """IDs of the items."""
+
+    bboxes: NDArray[np.float64]
+    """2D bounding boxes of the items, as an array of shape ``(len(self), 4)``. NaN
+    for items without a bounding box."""
+
+    start_datetimes: NDArray[np.datetime64]
+    """Start of the time interval of each item, in UTC: its ``start_datetime``
+    property, otherwise its ``datetime``. NaT for items without either."""
+
+    end_datetimes: NDArray[np.datetime64]
+    """End of the time interval of each item, in UTC: its ``end_datetime`` property,
+    otherwise its ``datetime``. NaT for items without either."""
+
+    properties: dict[str, NDArray[Any]]
+    """The selected properties of the items, by name. Numeric properties are stored
+    as floats, with NaN where an item does not have the property. Other properties
+    are stored as strings, booleans or objects, with None where missing."""
+
+    extra_fields: dict[str, Any]
+    """Dictionary of additional top-level fields for the GeoJSON
+    FeatureCollection."""
+
+    def __init__(
+        self,
+        features: Iterable[dict[str, Any]],
+        properties: Sequence[str] = (),
+        extra_fields: dict[str, Any] | None = None,
+    ) -> None:
+        if not HAS_NUMPY:
+            raise ImportError("Cannot instantiate, requires numpy package")
+
+        self._features = list(features)
+        self._items: list[pystac.Item | None] = [None] * len(self._features)
+        self.extra_fields = extra_fields or {}
+
+        n = len(self._features)
+        self.ids = np.array([f["id"] for f in self._features], dtype=str)
+        self.bboxes = np.full((n, 4), np.nan)
+        self.start_datetimes = np.full(n, np.datetime64("NaT", "us"))
+        self.end_datetimes = np.full(n, np.datetime64("NaT", "us"))
+        for i, feature in enumerate(self._features):
+            bbox = feature.get("bbox")
+            if bbox is not None:
+                half = len(bbox) // 2
+                self.bboxes[i] = [bbox[0], bbox[1], bbox[half], bbox[half + 1]]
+            props = feature.get("properties") or {}
+            dt = props.get("datetime")
+            start = props.get("start_datetime") or dt
+            end = props.get("end_datetime") or dt
+            if start is not None:
+                self.start_datetimes[i] = _datetime64(start)
+            if end is not None:
+                self.end_datetimes[i] = _datetime64(end)
+        self.properties = {
+            name: _column(
+                [(f.get("properties") or {}).get(name) for f in self._features]
+            )
+            for name in properties
+        }
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[pystac.Item],
+        properties: Sequence[str] = (),
+        extra_fields: dict[str, Any] | None = None,
+    ) -> ColumnarItemCollection:
+        """Creates a :class:`ColumnarItemCollection` from the dictionaries of
+        ``items``.
+
+        Args:
+            items : The items to include.
+            properties : Names of the item properties to store as columns.
+            extra_fields : Dictionary of additional top-level fields.
+        """
+        return cls(
+            (item.to_dict(transform_hrefs=False) for item in items),
+            properties,
+            extra_fields,
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        d: dict[str, Any],
+        properties: Sequence[str] = (),
+        preserve_dict: bool = True,
+    ) -> ColumnarItemCollection:
+        """Creates a :class:`ColumnarItemCollection` from a GeoJSON
+        FeatureCollection dictionary, such as the output of
+        :meth:`ItemCollection.to_dict <pystac.ItemCollection.to_dict>`.
+
+        Args:
+            d : The dictionary to read.
+            properties : Names of the item properties to store as columns.
+            preserve_dict: If False, the features of ``d`` are used without being
+                copied, and must not be modified afterwards. Defaults to True.
+        """
+        if not pystac.ItemCollection.is_item_collection(d):
+            raise STACTypeError(d, cls)
+        features = d.get("features", [])
+        if preserve_dict:
+            features = deepcopy(features)
+        extra_fields = {k: v for k, v in d.items() if k not in ("features", "type")}
+        return cls(features, properties, deepcopy(extra_fields))
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def __getitem__(self, idx: int) -> pystac.Item:
+        item = self._items[idx]
+        if item is None:
+            item = pystac.Item.from_dict(self._features[idx], preserve_dict=True)
+            self._items[idx] = item
+        return item
+
+    def __iter__(self) -> Iterator[pystac.Item]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __contains__(self, __x: object) -> bool:
+        return any(item is __x for item in self._items)
+
+    def select(self, rows: ArrayLike) -> ColumnarItemCollection:
+        """Returns a collection of the items in ``rows``, which is either a boolean
+        mask with one value per item, or an array of positions of items.
+
+        The selected items that were already created are shared with the returned
+        collection.
+
+        Examples:
+
+            >>> cloudless = items.select(items.properties["eo:cloud_cover"] < 10)
+        """
+        positions = np.arange(len(self))[np.asarray(rows)]
+        selected = self.__class__.__new__(self.__class__)
+        selected._features = [self._features[i] for i in positions]
+        selected._items = [self._items[i] for i in positions]
+        selected.extra_fields = dict(self.extra_fields)
+        selected.ids = self.ids[positions]
+        selected.bboxes = self.bboxes[positions]
+        selected.start_datetimes = self.start_datetimes[positions]
+        selected.end_datetimes = self.end_datetimes[positions]
+        selected.properties = {
+            name: column[positions] for name, column in self.properties.items()
+        }
+        return selected
+
+    def sort(
+        self, by: str = "datetime", reverse: bool = False
+    ) -> ColumnarItemCollection:
+        """Returns a collection of the items sorted by a column, keeping the order of
+        equal items. Items without a value come last.
+
+        Args:
+            by : ``"id"``, ``"datetime"`` or ``"start_datetime"`` to sort by
+                :attr:`start_datetimes`, ``"end_datetime"``, or the name of a column
+                of :attr:`properties`.
+            reverse : Whether to sort in descending order.
+        """
+        column = self.column(by)
+        missing = _missing(column)
+        present = np.flatnonzero(~missing)
+        order = present[np.argsort(column[present], kind="stable")]
+        if reverse:
+            order = order[::-1]
+        return self.select(np.concatenate([order, np.flatnonzero(missing)]))
+
+    def search(
+        self,
+        bbox: Sequence[float] | None = None,
+        intersects: dict[str, Any] | None = None,
+        datetime: IntervalLike | None = None,
+    ) -> ColumnarItemCollection:
+        """Returns the items that intersect a bounding box, a geometry and/or a time
+        interval, in their order in this collection.
+
+        Bounding boxes and datetimes are compared on the columns. ``intersects`` is
+        tested against the geometries of the items whose bounding box intersects it.
+
+        Args:
+            bbox : Optional 2D or 3D bounding box the items must intersect. May
+                cross the antimeridian.
+            intersects : Optional GeoJSON geometry the item geometries must
+                intersect, tested in planar coordinates.
+            datetime : Optional datetime or time interval the items must
+                intersect. See :meth:`ItemCollection.search
+                <pystac.ItemCollection.search>`.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        query = query_bbox(bbox, intersects)
+        if query is not None:
+            mask &= self._bbox_mask(query)
+        if intersects is not None:
+            for i in np.flatnonzero(mask):
+                geometry = self._features[i].get("geometry")
+                if geometry is None or not geometry_intersects(geometry, intersects):
+                    mask[i] = False
+        if datetime is not None:
+            start, end = parse_interval(datetime)
+            if start is not None:
+                mask &= self.end_datetimes >= _datetime64(start)
+            if end is not None:
+                mask &= self.start_datetimes <= _datetime64(end)
+            mask &= ~np.isnat(self.start_datetimes)
+        return self.select(mask)
+
+    def _bbox_mask(self, bbox: Sequence[float]) -> NDArray[np.bool_]:
+        west, south, east, north = self.bboxes.T
+        crosses = west > east
+        mask = np.zeros(len(self), dtype=bool)
+        for q_west, q_south, q_east, q_north in split_bbox(bbox):
+            x = np.where(
+                crosses,
+                ((west <= q_east) & (q_west <= 180))
+                | ((-180 <= q_east) & (q_west <= east)),
+                (west <= q_east) & (q_west <= east),
+            )
+            mask |= x & (south <= q_north) & (q_south <= north)
+        return mask
+
+    def column(self, name: str) -> NDArray[Any]:
+        """Returns the column ``name``: ``"id"``, ``"datetime"`` or
+        ``"start_datetime"``, ``"end_datetime"``, or the name of a column of
+        :attr:`properties`.
+
+        Raises:
+            KeyError: If there is no such column.
+        """
+        if name == "id":
+            return self.ids
+        if name in ("datetime", "start_datetime"):
+            return self.start_datetimes
+        if name == "end_datetime":
+            return self.end_datetimes
+        return self.properties[name]
+
+    def get_extent(self) -> pystac.Extent:
+        """Returns the :class:`~pystac.Extent` of the items, computed from
+        :attr:`bboxes`, :attr:`start_datetimes` and :attr:`end_datetimes`."""
+        accumulator = ExtentAccumulator()
+        accumulator.add_bboxes(self.bboxes)
+        starts = self.start_datetimes[~np.isnat(self.start_datetimes)]
+        ends = self.end_datetimes[~np.isnat(self.end_datetimes)]
+        accumulator.add_interval(
+            starts.min().item() if len(starts) else None,
+            ends.max().item() if len(ends) else None,
+        )
+        return accumulator.to_extent()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializes this collection to a GeoJSON FeatureCollection dictionary, in
+        the format of :meth:`ItemCollection.to_dict
+        <pystac.ItemCollection.to_dict>`. Items that were created are serialized
+        with their changes."""
+        return {
+            "type": "FeatureCollection",
+            "features": [
+                deepcopy(feature) if item is None else item.to_dict()
+                for feature, item in zip(self._features, self._items)
+            ],
+            **self.extra_fields,
+        }
+
+    def to_item_collection(self) -> ItemCollection:
+        """Returns an :class:`~pystac.ItemCollection` of all items, which are
+        created if needed and not cloned."""
+        return pystac.ItemCollection(
+            list(self), extra_fields=dict(self.extra_fields), clone_items=False
+        )
+
+
+def _datetime64(value: str | datetime) -> np.datetime64:
+    dt = str_to_datetime(value) if isinstance(value, str) else value
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(dt, "us")
+
+
+def _column(values: list[Any]) -> NDArray[Any]:
+    present = [v for v in values if v is not None]
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        return np.array([np.nan if v is None else v for v in values], dtype=float)
+    if len(present) == len(values):
+        if all(isinstance(v, str) for v in present):
+            return np.array(values, dtype=str)
+        if all(isinstance(v, bool) for v in present):
+            return np.array(values, dtype=bool)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _missing(column: NDArray[Any]) -> NDArray[np.bool_]:
+    missing: NDArray[np.bool_]
+    if column.dtype.kind == "f":
+        missing = np.isnan(column)
+    elif column.dtype.kind == "M":
+        missing = np.isnat(column)
+    elif column.dtype.kind == "O":
+        missing = np.array([v is None for v in column], dtype=bool)
+    else:
+        missing = np.zeros(len(column), dtype=bool)
+    return missing
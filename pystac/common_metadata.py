@@ -49,6 +49,7 @@ class CommonMetadata:
                 self.object.extra_fields[prop_name] = v
         else:
             raise pystac.STACError(f"Cannot set field {prop_name} on {self}.")
+        pystac.asset._mark_dirty(getattr(self.object, "owner", self.object))
 
     def _get_field(self, prop_name: str, _typ: type[P]) -> P | None:
         if hasattr(self.object, prop_name):
@@ -117,3 +117,20 @@ class DeprecatedWarning(FutureWarning):
     version extension ``deprecated`` field is present and set to ``True``."""
 
     pass
+
+
+class STACSaveError(STACError):
+    """Raised by a concurrent :meth:`Catalog.save <pystac.Catalog.save>` after every
+    object has been attempted, if writing any of them failed.
+
+    Args:
+        errors : Mapping of the destination HREF of each object that could not be
+            written to the exception raised while writing it.
+    """
+
+    def __init__(self, errors: dict[str, Exception]):
+        self.errors = errors
+        hrefs = ", ".join(list(errors)[:5])
+        if len(errors) > 5:
+            hrefs += ", ..."
+        super().__init__(f"Failed to save {len(errors)} STAC object(s): {hrefs}")
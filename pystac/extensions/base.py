@@ -92,6 +92,17 @@ class PropertiesExtension(ABC):
             ]
         else:
             self.properties[prop_name] = v
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        # Extensions keep the object they wrap as ``item``, ``collection`` or
+        # ``asset``; assets are written as part of their owner.
+        obj = getattr(self, "item", None) or getattr(self, "collection", None)
+        if obj is None:
+            obj = getattr(getattr(self, "asset", None), "owner", None)
+        mark_dirty = getattr(obj, "mark_dirty", None)
+        if mark_dirty is not None:
+            mark_dirty()
 
 
 class ExtensionManagementMixin(Generic[S], ABC):
@@ -129,6 +140,7 @@ class ExtensionManagementMixin(Generic[S], ABC):
             obj.stac_extensions = [cls.get_schema_uri()]
         elif not cls.has_extension(obj):
             obj.stac_extensions.append(cls.get_schema_uri())
+            obj.mark_dirty()
 
     @classmethod
     def remove_from(cls, obj: S) -> None:
@@ -0,0 +1,559 @@
+from __future__ import annotations
+
+import json
+import operator
+import os
+import struct
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime, timezone
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any
+
+import pystac
+from pystac.errors import STACError
+from pystac.index import IntervalLike, parse_interval, split_bbox
+from pystac.utils import datetime_to_str, str_to_datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+if TYPE_CHECKING:
+    from pystac.catalog import Catalog
+
+GEOPARQUET_VERSION = "1.1.0"
+STAC_GEOPARQUET_VERSION = "1.0.0"
+
+DEFAULT_CHUNK_SIZE = 65536
+"""Default number of items per row group of the files written by
+:func:`write_parquet`."""
+
+TIMESTAMP_PROPERTIES = (
+    "datetime",
+    "start_datetime",
+    "end_datetime",
+    "created",
+    "updated",
+)
+"""Item properties stored as UTC timestamp columns rather than strings."""
+
+CORE_COLUMNS = (
+    "type",
+    "stac_version",
+    "stac_extensions",
+    "id",
+    "geometry",
+    "bbox",
+    "links",
+    "assets",
+    "collection",
+)
+"""Columns holding the top-level fields of items. The properties of the items are
+stored in one column each, next to these."""
+
+
+def write_parquet(
+    items: Iterable[pystac.Item],
+    where: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    schema: pa.Schema | None = None,
+) -> None:
+    """Writes items to a GeoParquet file in the `stac-geoparquet
+    <https://github.com/stac-utils/stac-geoparquet>`__ layout, one row group of
+    ``chunk_size`` items at a time.
+
+    Item properties become top-level columns, with the :data:`TIMESTAMP_PROPERTIES`
+    stored as UTC timestamps, the geometry is stored as WKB and the bounding box as
+    a struct of ``xmin``, ``ymin``, ``xmax`` and ``ymax``. Empty objects nested in
+    the items are not written.
+
+    All row groups share one schema, and only one chunk of items is converted to
+    Arrow at a time, so ``items`` is read once and may be a generator. If
+    ``schema`` is not given, it is inferred from the first chunk. When a later
+    chunk does not fit it, the following row groups are written with a schema that
+    also fits that chunk, and the row groups written before are rewritten with the
+    final schema once all items are written.
+
+    Args:
+        items : The items to write.
+        where : Path of the file to write.
+        chunk_size : Number of items per row group.
+        schema : Optional Arrow schema of the file.
+
+    Raises:
+        STACError: If an item property has the name of a :data:`CORE_COLUMNS`
+            column, or if an item does not fit ``schema``.
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    _check_pyarrow()
+    fixed = schema is not None
+    # The files the row groups were written to, one per schema
+    segments: list[str] = []
+    writer = None
+    extent = _Extent()
+    try:
+        for table, bboxes in _tables(items, chunk_size):
+            if schema is None:
+                schema = table.schema
+            elif (unified := _unify(schema, table.schema)) != schema:
+                if fixed:
+                    ids = table.column("id").to_pylist()
+                    raise STACError(
+                        f"Items {ids[0]} to {ids[-1]} do not fit the schema."
+                    )
+                schema = unified
+                if writer is not None:
+                    writer.close()
+                    writer = None
+            if writer is None:
+                segments.append(f"{where}.{len(segments)}" if segments else where)
+                writer = pq.ParquetWriter(segments[-1], schema)
+            writer.write_table(_conform(table, schema), row_group_size=chunk_size)
+            extent.add(bboxes)
+        if writer is None:
+            schema = pa.schema([("id", pa.string())]) if schema is None else schema
+            writer = pq.ParquetWriter(where, schema)
+        elif len(segments) > 1:
+            writer.close()
+            segments.append(f"{where}.{len(segments)}")
+            writer = pq.ParquetWriter(segments[-1], schema)
+            for segment in segments[:-1]:
+                file = pq.ParquetFile(segment)
+                for i in range(file.num_row_groups):
+                    table = _conform(file.read_row_group(i), schema)
+                    writer.write_table(table, row_group_size=chunk_size)
+                file.close()
+        writer.add_key_value_metadata(_metadata(extent))
+        writer.close()
+        if len(segments) > 1:
+            os.replace(segments[-1], where)
+    finally:
+        if writer is not None:
+            writer.close()
+        for segment in segments[1:]:
+            if os.path.exists(segment):
+                os.remove(segment)
+
+
+def read_parquet(
+    source: str,
+    columns: Sequence[str] | None = None,
+    bbox: Sequence[float] | None = None,
+    datetime: IntervalLike | None = None,
+) -> Iterator[pystac.Item]:
+    """Reads the items of a stac-geoparquet file, one record batch at a time.
+
+    ``bbox`` and ``datetime`` are evaluated by Arrow, which skips the row groups
+    whose column statistics show that none of their items can match.
+
+    Args:
+        source : Path of the file to read.
+        columns : Optional names of the columns to read. Items are built from the
+            columns that are read, so this should include the columns of all
+            required fields, such as ``"datetime"``.
+        bbox : Optional 2D bounding box the bounding box of the items must
+            intersect. May cross the antimeridian.
+        datetime : Optional datetime or time interval the items must intersect.
+            See :meth:`ItemCollection.search <pystac.ItemCollection.search>`.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    _check_pyarrow()
+    dataset = ds.dataset(source, format="parquet")
+    names = set(dataset.schema.names)
+    expression = None
+    if bbox is not None:
+        expression = _bbox_filter(bbox, _may_cross_antimeridian(source))
+    if datetime is not None:
+        time_filter = _datetime_filter(parse_interval(datetime), names)
+        expression = time_filter if expression is None else expression & time_filter
+    for batch in dataset.to_batches(
+        columns=None if columns is None else list(columns), filter=expression
+    ):
+        for row in batch.to_pylist():
+            yield pystac.Item.from_dict(_from_row(row), preserve_dict=False)
+
+
+def write_catalog_parquet(
+    catalog: Catalog, dest_dir: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> list[str]:
+    """Writes the items of a catalog to one stac-geoparquet file per collection,
+    named after the collection ID, in ``dest_dir``.
+
+    The items of a collection include those of its child catalogs that are not
+    collections. Items that are not below any collection are written to a file
+    named after the ID of ``catalog``.
+
+    Each file is written while the items that go into it are read, and the items
+    are released from the catalog once written, so that the items of the catalog
+    are not all held in memory.
+
+    Returns:
+        list[str]: The paths of the files written.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    _check_pyarrow()
+    os.makedirs(dest_dir, exist_ok=True)
+    written = []
+    owners: list[Catalog] = [catalog]
+    while owners:
+        owner = owners.pop(0)
+        items = _owned_items(owner, owners)
+        first = next(items, None)
+        if first is not None:
+            path = os.path.join(dest_dir, f"{owner.id}.parquet")
+            write_parquet(chain([first], items), path, chunk_size)
+            written.append(path)
+    return written
+
+
+def _owned_items(catalog: Catalog, collections: list[Catalog]) -> Iterator[pystac.Item]:
+    """Yields the items of ``catalog`` and of its child catalogs that are not
+    collections, releasing them once yielded. Child collections are appended to
+    ``collections`` instead."""
+    yield from catalog.get_items(release=True)
+    for child in catalog._get_children(0, release=True):
+        if isinstance(child, pystac.Collection):
+            collections.append(child)
+        else:
+            yield from _owned_items(child, collections)
+
+
+def _check_pyarrow() -> None:
+    if not HAS_PYARROW:
+        raise ImportError("Reading and writing GeoParquet requires pyarrow package")
+
+
+def _tables(
+    items: Iterable[pystac.Item], size: int
+) -> Iterator[tuple[pa.Table, list[Any]]]:
+    """Converts items to Arrow tables of ``size`` rows, each with the bounding
+    boxes of its rows. Unlike Table.from_pylist, which only takes the columns of the
+    first row, the tables have the columns of all rows."""
+    iterator = iter(items)
+    while rows := [
+        _to_row(item.to_dict(transform_hrefs=False)) for item in islice(iterator, size)
+    ]:
+        table = pa.Table.from_struct_array(pa.array(rows))
+        yield table, [row.get("bbox") for row in rows]
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Casts ``table`` to ``schema``, which has all its columns and fields."""
+    return pa.Table.from_arrays(
+        [
+            table.column(field.name).cast(field.type)
+            if field.name in table.column_names
+            else pa.nulls(len(table), field.type)
+            for field in schema
+        ],
+        schema=schema,
+    )
+
+
+def _unify(schema: pa.Schema | None, other: pa.Schema) -> pa.Schema:
+    if schema is None:
+        return other
+    return pa.unify_schemas([schema, other], promote_options="permissive")
+
+
+class _Extent:
+    """The 2D bounding box of the items written to a file, unless one of them
+    crosses the antimeridian."""
+
+    def __init__(self) -> None:
+        self.bbox: list[float] | None = None
+        self.crosses_antimeridian = False
+
+    def add(self, bboxes: Iterable[dict[str, float] | None]) -> None:
+        for bbox in bboxes:
+            if bbox is None:
+                continue
+            if bbox["xmin"] > bbox["xmax"]:
+                self.crosses_antimeridian = True
+            box = [bbox["xmin"], bbox["ymin"], bbox["xmax"], bbox["ymax"]]
+            if self.bbox is None:
+                self.bbox = box
+            else:
+                self.bbox = [
+                    *map(min, self.bbox[:2], box[:2]),
+                    *map(max, self.bbox[2:], box[2:]),
+                ]
+
+
+def _metadata(extent: _Extent) -> dict[str, str]:
+    geometry: dict[str, Any] = {
+        "encoding": "WKB",
+        "geometry_types": [],
+        "covering": {
+            "bbox": {key: ["bbox", key] for key in ("xmin", "ymin", "xmax", "ymax")}
+        },
+    }
+    if extent.bbox is not None and not extent.crosses_antimeridian:
+        geometry["bbox"] = extent.bbox
+    geo = {
+        "version": GEOPARQUET_VERSION,
+        "primary_column": "geometry",
+        "columns": {"geometry": geometry},
+    }
+    return {
+        "geo": json.dumps(geo),
+        "stac-geoparquet": json.dumps({"version": STAC_GEOPARQUET_VERSION}),
+    }
+
+
+def _may_cross_antimeridian(source: str) -> bool:
+    """Returns whether the bounding box of an item of the file at ``source`` may
+    cross the antimeridian, which is not the case if the GeoParquet metadata gives
+    a bounding box of the geometries that does not cross it."""
+    geo = (pq.read_metadata(source).metadata or {}).get(b"geo")
+    if geo is None:
+        return True
+    bbox = json.loads(geo)["columns"].get("geometry", {}).get("bbox")
+    return bbox is None or bbox[0] > bbox[-2]
+
+
+def _to_row(d: dict[str, Any]) -> dict[str, Any]:
+    row = {k: _drop_empty(v) for k, v in d.items() if k not in ("properties",)}
+    geometry = d.get("geometry")
+    row["geometry"] = None if geometry is None else wkb_from_geojson(geometry)
+    bbox = d.get("bbox")
+    if bbox is not None:
+        keys = (
+            ("xmin", "ymin", "zmin", "xmax", "ymax", "zmax")
+            if len(bbox) == 6
+            else ("xmin", "ymin", "xmax", "ymax")
+        )
+        row["bbox"] = {key: float(value) for key, value in zip(keys, bbox)}
+    for name, value in d.get("properties", {}).items():
+        if name in CORE_COLUMNS:
+            raise STACError(
+                f"Item {d.get('id')} has a property named {name}, which cannot be "
+                "stored in stac-geoparquet."
+            )
+        if name in TIMESTAMP_PROPERTIES and isinstance(value, str):
+            value = _utc(str_to_datetime(value))
+        row[name] = _drop_empty(value)
+    return row
+
+
+def _from_row(row: dict[str, Any]) -> dict[str, Any]:
+    d: dict[str, Any] = {
+        "type": "Feature",
+        "stac_version": pystac.get_stac_version(),
+        "stac_extensions": [],
+        "geometry": None,
+        "links": [],
+        "assets": {},
+    }
+    properties: dict[str, Any] = {}
+    for name, value in row.items():
+        value = _drop_none(value)
+        if value is None:
+            continue
+        if name == "geometry":
+            d[name] = geojson_from_wkb(value)
+        elif name == "bbox":
+            d[name] = [
+                value[key]
+                for key in ("xmin", "ymin", "zmin", "xmax", "ymax", "zmax")
+                if key in value
+            ]
+        elif name in CORE_COLUMNS:
+            d[name] = value
+        elif isinstance(value, datetime):
+            properties[name] = datetime_to_str(value)
+        else:
+            properties[name] = value
+    properties.setdefault("datetime", None)
+    d["properties"] = properties
+    return d
+
+
+def _utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _drop_empty(value: Any) -> Any:
+    """Replaces empty objects, which Parquet cannot store, with None."""
+    if isinstance(value, dict):
+        return {k: _drop_empty(v) for k, v in value.items()} or None
+    if isinstance(value, list):
+        return [_drop_empty(v) for v in value]
+    return value
+
+
+def _drop_none(value: Any) -> Any:
+    """Removes the null fields that Arrow adds to objects to give all objects of a
+    column the same fields."""
+    if isinstance(value, dict):
+        return {k: _drop_none(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_none(v) for v in value]
+    return value
+
+
+def _bbox_filter(bbox: Sequence[float], crossing_items: bool) -> ds.Expression:
+    # Comparisons of columns with values let Arrow skip row groups using their
+    # statistics, but comparisons between columns do not, so the items crossing the
+    # antimeridian are only looked for in files that may have some.
+    xmin, ymin = ds.field("bbox", "xmin"), ds.field("bbox", "ymin")
+    xmax, ymax = ds.field("bbox", "xmax"), ds.field("bbox", "ymax")
+    expression = None
+    for west, south, east, north in split_bbox(bbox):
+        x = (xmin <= east) & (xmax >= west)
+        if crossing_items:
+            x = ((xmin <= xmax) & x) | (
+                (xmin > xmax) & ((xmin <= east) | (xmax >= west))
+            )
+        xy = x & (ymin <= north) & (ymax >= south)
+        expression = xy if expression is None else expression | xy
+    return expression
+
+
+def _datetime_filter(
+    interval: tuple[datetime | None, datetime | None], names: set[str]
+) -> ds.Expression:
+    # The start and end of an item are its start_datetime and end_datetime, falling
+    # back to its datetime. Comparing each column rather than their coalescence
+    # lets Arrow skip row groups using their statistics.
+    def compare(
+        name: str, op: Callable[[Any, Any], ds.Expression], value: datetime
+    ) -> ds.Expression:
+        scalar = pa.scalar(_utc(value), pa.timestamp("us", "UTC"))
+        field, fallback = ds.field(name), ds.field("datetime")
+        if name in names and "datetime" in names:
+            return op(field, scalar) | (field.is_null() & op(fallback, scalar))
+        if name in names:
+            return op(field, scalar)
+        if "datetime" in names:
+            return op(fallback, scalar)
+        return ds.scalar(False)
+
+    start, end = interval
+    expression = ds.scalar(True)
+    if start is not None:
+        expression &= compare("end_datetime", operator.ge, start)
+    if end is not None:
+        expression &= compare("start_datetime", operator.le, end)
+    return expression
+
+
+_WKB_TYPES = {
+    "Point": 1,
+    "LineString": 2,
+    "Polygon": 3,
+    "MultiPoint": 4,
+    "MultiLineString": 5,
+    "MultiPolygon": 6,
+    "GeometryCollection": 7,
+}
+_GEOJSON_TYPES = {code: name for name, code in _WKB_TYPES.items()}
+
+
+def wkb_from_geojson(geometry: dict[str, Any]) -> bytes:
+    """Encodes a GeoJSON geometry as little-endian ISO WKB."""
+    parts: list[bytes] = []
+    _write_wkb(geometry, parts)
+    return b"".join(parts)
+
+
+def geojson_from_wkb(wkb: bytes) -> dict[str, Any]:
+    """Decodes a WKB geometry, as written by :func:`wkb_from_geojson`, to GeoJSON.
+
+    Raises:
+        STACError: If the WKB is not a 2D or 3D (Z) geometry.
+    """
+    geometry, _ = _read_wkb(wkb, 0)
+    return geometry
+
+
+def _dimensions(geometry: dict[str, Any]) -> int:
+    if geometry["type"] == "GeometryCollection":
+        return 2
+    coordinates = geometry["coordinates"]
+    while coordinates and isinstance(coordinates[0], list):
+        coordinates = coordinates[0]
+    return 3 if len(coordinates) == 3 else 2
+
+
+def _write_wkb(geometry: dict[str, Any], parts: list[bytes]) -> None:
+    typ = geometry["type"]
+    dims = _dimensions(geometry)
+    parts.append(struct.pack("<BI", 1, _WKB_TYPES[typ] + (1000 if dims == 3 else 0)))
+    point = struct.Struct(f"<{dims}d")
+
+    def points(coordinates: list[Any]) -> None:
+        parts.append(struct.pack("<I", len(coordinates)))
+        parts.extend(point.pack(*c[:dims]) for c in coordinates)
+
+    if typ == "GeometryCollection":
+        parts.append(struct.pack("<I", len(geometry["geometries"])))
+        for g in geometry["geometries"]:
+            _write_wkb(g, parts)
+        return
+    coordinates = geometry["coordinates"]
+    if typ == "Point":
+        parts.append(point.pack(*coordinates[:dims]))
+    elif typ == "LineString":
+        points(coordinates)
+    elif typ == "Polygon":
+        parts.append(struct.pack("<I", len(coordinates)))
+        for ring in coordinates:
+            points(ring)
+    else:
+        parts.append(struct.pack("<I", len(coordinates)))
+        for part in coordinates:
+            _write_wkb({"type": typ[len("Multi") :], "coordinates": part}, parts)
+
+
+def _read_wkb(wkb: bytes, offset: int) -> tuple[dict[str, Any], int]:
+    order = "<" if wkb[offset] == 1 else ">"
+    (code,) = struct.unpack_from(f"{order}I", wkb, offset + 1)
+    offset += 5
+    dims = 3 if code // 1000 == 1 else 2
+    if code // 1000 > 1 or code % 1000 not in _GEOJSON_TYPES:
+        raise STACError(f"Unsupported WKB geometry type {code}")
+    typ = _GEOJSON_TYPES[code % 1000]
+    point = struct.Struct(f"{order}{dims}d")
+
+    def count() -> int:
+        nonlocal offset
+        (n,) = struct.unpack_from(f"{order}I", wkb, offset)
+        offset += 4
+        return int(n)
+
+    def points() -> list[list[float]]:
+        nonlocal offset
+        result = []
+        for _ in range(count()):
+            result.append(list(point.unpack_from(wkb, offset)))
+            offset += point.size
+        return result
+
+    if typ == "Point":
+        coordinates: Any = list(point.unpack_from(wkb, offset))
+        offset += point.size
+    elif typ == "LineString":
+        coordinates = points()
+    elif typ == "Polygon":
+        coordinates = [points() for _ in range(count())]
+    else:
+        members = []
+        for _ in range(count()):
+            member, offset = _read_wkb(wkb, offset)
+            members.append(member)
+        if typ == "GeometryCollection":
+            return {"type": typ, "geometries": members}, offset
+        coordinates = [member["coordinates"] for member in members]
+    return {"type": typ, "coordinates": coordinates}, offset
@@ -0,0 +1,458 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from math import ceil, inf, sqrt
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from pystac.utils import str_to_datetime
+
+if TYPE_CHECKING:
+    from pystac.item import Item
+
+T = TypeVar("T")
+
+Box = tuple[float, float, float, float]
+Point = tuple[float, float]
+Segment = tuple[Point, Point]
+
+Interval = tuple[datetime | None, datetime | None]
+"""A time interval, from a start to an end datetime. None is an open end."""
+
+IntervalLike = str | datetime | Interval
+"""A time interval, or a datetime, or a string in the format of the ``datetime``
+parameter of the STAC API: a single datetime, or a start and end datetime separated
+by ``/``, where ``..`` or an empty string is an open end."""
+
+
+class SpatialIndex(Generic[T]):
+    """A static R-tree over bounding boxes, packed with the Sort-Tile-Recursive
+    algorithm, which finds the values whose bounding box intersects a query box.
+
+    Bounding boxes may be 2D (``[west, south, east, north]``) or 3D (``[west,
+    south, min elevation, east, north, max elevation]``), in which case only their
+    2D extent is indexed. A box whose west edge is greater than its east edge
+    crosses the antimeridian.
+
+    Args:
+        entries : The bounding boxes and the values they index. Entries without a
+            bounding box are not indexed.
+        node_size : Maximum number of children of a node of the tree.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[tuple[Sequence[float] | None, T]] = (),
+        node_size: int = 16,
+    ) -> None:
+        self.node_size = node_size
+        self.values: list[T] = []
+        leaves: list[tuple[Box, int]] = []
+        for bbox, value in entries:
+            if bbox is not None:
+                for box in split_bbox(bbox):
+                    leaves.append((box, len(self.values)))
+            self.values.append(value)
+        self._pack(leaves)
+
+    def _pack(self, leaves: list[tuple[Box, int]]) -> None:
+        # Sort into vertical slices by center x, then each slice by center y, so
+        # that consecutive leaves, and thus the nodes grouping them, are close.
+        leaves.sort(key=lambda leaf: leaf[0][0] + leaf[0][2])
+        slice_size = self.node_size * max(
+            1, ceil(sqrt(ceil(len(leaves) / self.node_size)))
+        )
+        packed: list[tuple[Box, int]] = []
+        for i in range(0, len(leaves), slice_size):
+            packed.extend(
+                sorted(
+                    leaves[i : i + slice_size],
+                    key=lambda leaf: leaf[0][1] + leaf[0][3],
+                )
+            )
+
+        self._leaf_values = [value for _, value in packed]
+        self._levels: list[list[Box]] = [[box for box, _ in packed]]
+        while len(self._levels[-1]) > self.node_size:
+            level = self._levels[-1]
+            self._levels.append(
+                [
+                    _union(level[i : i + self.node_size])
+                    for i in range(0, len(level), self.node_size)
+                ]
+            )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def search(self, bbox: Sequence[float]) -> list[T]:
+        """Returns the values whose bounding box intersects ``bbox``, in the order
+        in which they were indexed.
+
+        Args:
+            bbox : The 2D or 3D bounding box to search for.
+        """
+        return [self.values[i] for i in self.search_indices(bbox)]
+
+    def search_indices(self, bbox: Sequence[float]) -> list[int]:
+        """Returns the positions in :attr:`values` of the values whose bounding box
+        intersects ``bbox``, in increasing order."""
+        levels = self._levels
+        node_size = self.node_size
+        hits: set[int] = set()
+        top = len(levels) - 1
+        for west, south, east, north in split_bbox(bbox):
+            stack = [(top, i) for i in range(len(levels[top]))]
+            while stack:
+                depth, i = stack.pop()
+                box = levels[depth][i]
+                if box[0] > east or box[2] < west or box[1] > north or box[3] < south:
+                    continue
+                if depth == 0:
+                    hits.add(self._leaf_values[i])
+                else:
+                    end = min((i + 1) * node_size, len(levels[depth - 1]))
+                    stack.extend((depth - 1, j) for j in range(i * node_size, end))
+        return sorted(hits)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the JSON representation of this index. The values must be JSON
+        serializable."""
+        return {
+            "node_size": self.node_size,
+            "values": self.values,
+            "leaf_values": self._leaf_values,
+            "levels": [[list(box) for box in level] for level in self._levels],
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> SpatialIndex[Any]:
+        """Reads an index written by :meth:`to_dict`, without rebuilding it."""
+        index: SpatialIndex[Any] = cls(node_size=d["node_size"])
+        index.values = list(d["values"])
+        index._leaf_values = list(d["leaf_values"])
+        index._levels = [
+            [(box[0], box[1], box[2], box[3]) for box in level] for level in d["levels"]
+        ]
+        return index
+
+
+class TemporalIndex(Generic[T]):
+    """A static index over time intervals, which finds the values whose interval
+    overlaps a query interval.
+
+    Intervals are sorted by start, so that a query only looks at the intervals that
+    start before the end of the query and after the earliest start of an interval
+    that may still be running at the start of the query. For instants and short
+    intervals, that is little more than the matching intervals.
+
+    Args:
+        entries : The intervals and the values they index. Entries without an
+            interval are not indexed. Naive datetimes are taken to be in UTC.
+    """
+
+    def __init__(self, entries: Iterable[tuple[Interval | None, T]] = ()) -> None:
+        self.values: list[T] = []
+        intervals: list[tuple[float, float, int]] = []
+        for interval, value in entries:
+            if interval is not None:
+                intervals.append(
+                    (
+                        _timestamp(interval[0], -inf),
+                        _timestamp(interval[1], inf),
+                        len(self.values),
+                    )
+                )
+            self.values.append(value)
+        intervals.sort()
+
+        self._starts = [start for start, _, _ in intervals]
+        self._ends = [end for _, end, _ in intervals]
+        self._positions = [position for _, _, position in intervals]
+        # The latest end of the intervals up to each one, which never decreases.
+        self._max_ends: list[float] = []
+        max_end = -inf
+        for end in self._ends:
+            max_end = max(max_end, end)
+            self._max_ends.append(max_end)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def search(self, interval: IntervalLike) -> list[T]:
+        """Returns the values whose interval overlaps ``interval``, in the order in
+        which they were indexed.
+
+        Args:
+            interval : The interval to search for. Both of its ends are included.
+        """
+        return [self.values[i] for i in self.search_indices(interval)]
+
+    def search_indices(self, interval: IntervalLike) -> list[int]:
+        """Returns the positions in :attr:`values` of the values whose interval
+        overlaps ``interval``, in increasing order."""
+        start, end = parse_interval(interval)
+        query_start, query_end = _timestamp(start, -inf), _timestamp(end, inf)
+        first = bisect_left(self._max_ends, query_start)
+        last = bisect_right(self._starts, query_end)
+        ends = self._ends
+        return sorted(
+            self._positions[i] for i in range(first, last) if ends[i] >= query_start
+        )
+
+
+def parse_interval(interval: IntervalLike) -> Interval:
+    """Returns the start and end of a time interval given as an
+    :data:`IntervalLike`.
+
+    Raises:
+        ValueError: If ``interval`` is a string that cannot be parsed, or an
+            interval that ends before it starts.
+    """
+    start: datetime | None
+    end: datetime | None
+    if isinstance(interval, datetime):
+        return interval, interval
+    if isinstance(interval, str):
+        parts = interval.split("/")
+        if len(parts) == 1:
+            start = end = str_to_datetime(interval)
+        elif len(parts) == 2:
+            start, end = (
+                None if part in ("", "..") else str_to_datetime(part) for part in parts
+            )
+        else:
+            raise ValueError(f"Invalid datetime interval: {interval}")
+    else:
+        start, end = interval
+    if _timestamp(start, -inf) > _timestamp(end, inf):
+        raise ValueError(f"Datetime interval ends before it starts: {interval}")
+    return start, end
+
+
+def intervals_overlap(a: Interval, b: Interval) -> bool:
+    """Returns whether two time intervals overlap, including their ends."""
+    return _timestamp(a[0], -inf) <= _timestamp(b[1], inf) and _timestamp(
+        b[0], -inf
+    ) <= _timestamp(a[1], inf)
+
+
+def item_interval(item: Item) -> Interval | None:
+    """Returns the time interval covered by ``item``: from its ``start_datetime`` to
+    its ``end_datetime`` where given, otherwise its ``datetime``. Returns None if
+    the item has none of those."""
+    start = item.properties.get("start_datetime")
+    end = item.properties.get("end_datetime")
+    start_dt = item.datetime if start is None else str_to_datetime(start)
+    end_dt = item.datetime if end is None else str_to_datetime(end)
+    if start_dt is None and end_dt is None:
+        return None
+    return (start_dt or end_dt, end_dt or start_dt)
+
+
+def split_bbox(bbox: Sequence[float]) -> list[Box]:
+    """Returns the 2D boxes covered by a 2D or 3D bounding box: two if it crosses the
+    antimeridian, otherwise one."""
+    if len(bbox) == 6:
+        west, south, east, north = bbox[0], bbox[1], bbox[3], bbox[4]
+    else:
+        west, south, east, north = bbox[0], bbox[1], bbox[2], bbox[3]
+    if west > east:
+        return [(west, south, 180.0, north), (-180.0, south, east, north)]
+    return [(west, south, east, north)]
+
+
+def bbox_intersects(a: Sequence[float], b: Sequence[float]) -> bool:
+    """Returns whether two 2D or 3D bounding boxes intersect, in 2D."""
+    return any(
+        ax0 <= bx1 and bx0 <= ax1 and ay0 <= by1 and by0 <= ay1
+        for ax0, ay0, ax1, ay1 in split_bbox(a)
+        for bx0, by0, bx1, by1 in split_bbox(b)
+    )
+
+
+def geometry_bbox(geometry: dict[str, Any]) -> list[float]:
+    """Returns the 2D bounding box of a GeoJSON geometry."""
+    return list(_Parts(geometry).bbox())
+
+
+def geometry_intersects(a: dict[str, Any], b: dict[str, Any]) -> bool:
+    """Returns whether two GeoJSON geometries intersect (including touching), in
+    planar coordinates."""
+    a_parts, b_parts = _Parts(a), _Parts(b)
+    if not bbox_intersects(a_parts.bbox(), b_parts.bbox()):
+        return False
+    for s in a_parts.segments:
+        for t in b_parts.segments:
+            if _segments_intersect(s, t):
+                return True
+    for points, other in ((a_parts.vertices(), b_parts), (b_parts.vertices(), a_parts)):
+        for p in points:
+            if other.contains_point(p):
+                return True
+    return False
+
+
+def item_intersects(
+    item: Item,
+    bbox: Sequence[float] | None = None,
+    intersects: dict[str, Any] | None = None,
+    interval: Interval | None = None,
+) -> bool:
+    """Returns whether ``item`` intersects ``bbox``, the GeoJSON geometry
+    ``intersects`` and the time ``interval``, where given. Items without geometry
+    or datetimes intersect nothing."""
+    if bbox is not None and (item.bbox is None or not bbox_intersects(item.bbox, bbox)):
+        return False
+    if intersects is not None and (
+        item.geometry is None or not geometry_intersects(item.geometry, intersects)
+    ):
+        return False
+    if interval is not None:
+        item_time = item_interval(item)
+        if item_time is None or not intervals_overlap(item_time, interval):
+            return False
+    return True
+
+
+def query_bbox(
+    bbox: Sequence[float] | None, intersects: dict[str, Any] | None
+) -> Sequence[float] | None:
+    """Returns the bounding box to search a :class:`SpatialIndex` with for the items
+    intersecting ``bbox`` and ``intersects``, or None to match all items."""
+    if bbox is not None:
+        return bbox
+    if intersects is not None:
+        return geometry_bbox(intersects)
+    return None
+
+
+def _union(boxes: Sequence[Box]) -> Box:
+    return (
+        min(b[0] for b in boxes),
+        min(b[1] for b in boxes),
+        max(b[2] for b in boxes),
+        max(b[3] for b in boxes),
+    )
+
+
+class _Parts:
+    """The points, segments and polygon rings of a GeoJSON geometry."""
+
+    def __init__(self, geometry: dict[str, Any]) -> None:
+        self.points: list[Point] = []
+        self.segments: list[Segment] = []
+        self.polygons: list[list[list[Point]]] = []
+        self._add(geometry)
+
+    def _add(self, geometry: dict[str, Any]) -> None:
+        typ = geometry["type"]
+        if typ == "GeometryCollection":
+            for g in geometry["geometries"]:
+                self._add(g)
+            return
+        coordinates = geometry["coordinates"]
+        if typ == "Point":
+            self.points.append(_point(coordinates))
+        elif typ == "MultiPoint":
+            self.points.extend(_point(c) for c in coordinates)
+        elif typ == "LineString":
+            self._add_line(coordinates)
+        elif typ == "MultiLineString":
+            for line in coordinates:
+                self._add_line(line)
+        elif typ == "Polygon":
+            self._add_polygon(coordinates)
+        elif typ == "MultiPolygon":
+            for polygon in coordinates:
+                self._add_polygon(polygon)
+        else:
+            raise ValueError(f"Unknown geometry type {typ}")
+
+    def _add_line(self, coordinates: list[Any]) -> list[Point]:
+        line = [_point(c) for c in coordinates]
+        if len(line) == 1:
+            self.points.append(line[0])
+        self.segments.extend(zip(line, line[1:]))
+        return line
+
+    def _add_polygon(self, coordinates: list[Any]) -> None:
+        self.polygons.append([self._add_line(ring) for ring in coordinates])
+
+    def bbox(self) -> Box:
+        points = self.vertices()
+        return (
+            min(p[0] for p in points),
+            min(p[1] for p in points),
+            max(p[0] for p in points),
+            max(p[1] for p in points),
+        )
+
+    def vertices(self) -> list[Point]:
+        return self.points + [p for s in self.segments for p in s]
+
+    def contains_point(self, p: Point) -> bool:
+        if p in self.points:
+            return True
+        if any(_on_segment(p, s) for s in self.segments):
+            return True
+        return any(
+            _in_ring(p, rings[0]) and not any(_in_ring(p, hole) for hole in rings[1:])
+            for rings in self.polygons
+            if rings
+        )
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _timestamp(dt: datetime | None, default: float) -> float:
+    if dt is None:
+        return default
+    if dt.tzinfo is None:
+        return (dt - _EPOCH).total_seconds()
+    return dt.timestamp()
+
+
+def _point(c: Sequence[float]) -> Point:
+    return (c[0], c[1])
+
+
+def _orientation(p: Point, q: Point, r: Point) -> float:
+    return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+
+
+def _on_segment(p: Point, s: Segment) -> bool:
+    (x0, y0), (x1, y1) = s
+    return (
+        _orientation(s[0], s[1], p) == 0
+        and min(x0, x1) <= p[0] <= max(x0, x1)
+        and min(y0, y1) <= p[1] <= max(y0, y1)
+    )
+
+
+def _segments_intersect(s: Segment, t: Segment) -> bool:
+    d1 = _orientation(t[0], t[1], s[0])
+    d2 = _orientation(t[0], t[1], s[1])
+    d3 = _orientation(s[0], s[1], t[0])
+    d4 = _orientation(s[0], s[1], t[1])
+    if ((d1 > 0 and d2 < 0) or (d1 < 0 and d2 > 0)) and (
+        (d3 > 0 and d4 < 0) or (d3 < 0 and d4 > 0)
+    ):
+        return True
+    return (
+        _on_segment(s[0], t)
+        or _on_segment(s[1], t)
+        or _on_segment(t[0], s)
+        or _on_segment(t[1], s)
+    )
+
+
+def _in_ring(p: Point, ring: list[Point]) -> bool:
+    x, y = p
+    inside = False
+    for (x0, y0), (x1, y1) in zip(ring, ring[1:]):
+        if (y0 > y) != (y1 > y) and x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
+            inside = not inside
+    return inside
@@ -111,6 +111,10 @@ class Item(STACObject, Assets):
 
     STAC_OBJECT_TYPE = STACObjectType.ITEM
 
+    _lazy_assets: dict[str, dict[str, Any]]
+    _lazy_links: tuple[list[dict[str, Any]], str | None]
+    _lazy_targets: dict[str, Catalog | None]
+
     def __init__(
         self,
         id: str,
@@ -175,8 +179,107 @@ class Item(STACObject, Assets):
     def __repr__(self) -> str:
         return f"<Item id={self.id}>"
 
+    if not TYPE_CHECKING:
+        # Kept out of type checking so that misspelled attributes are still caught.
+
+        def __getattr__(self, name: str) -> Any:
+            # Only called when regular lookup fails, i.e. for the fields of items
+            # parsed with ``from_dict(..., lazy=True)`` that were not accessed yet.
+            if name == "assets" and "_lazy_assets" in self.__dict__:
+                self._materialize_assets()
+                return self.assets
+            if name == "links" and "_lazy_links" in self.__dict__:
+                self._materialize_links()
+                return self.links
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Assigning the assets or links of a lazy item replaces the raw data.
+        if name == "assets":
+            self.__dict__.pop("_lazy_assets", None)
+        elif name == "links":
+            self.__dict__.pop("_lazy_links", None)
+            self.__dict__.pop("_lazy_targets", None)
+        super().__setattr__(name, value)
+
+    def _materialize_assets(self) -> None:
+        assets = self.__dict__.pop("_lazy_assets")
+        dirty = self._dirty
+        self.assets = {}
+        for k, v in assets.items():
+            self.add_asset(k, Asset.from_dict(v))
+        self._dirty = dirty
+
+    def _materialize_links(self) -> None:
+        links, href = self.__dict__.pop("_lazy_links")
+        targets = self.__dict__.pop("_lazy_targets", {})
+        dirty = self._dirty
+        self.links = []
+        if href is not None:
+            self.set_self_href(href)
+        self._add_links_from_dicts(links, href)
+        # Replay the calls made while the links were lazy the way set_self_href,
+        # set_root and set_parent would, without caching the item again.
+        for rel, target in targets.items():
+            index = next((i for i, x in enumerate(self.links) if x.rel == rel), None)
+            if rel == RelType.SELF:
+                self_link = self.links.pop(cast(int, index))
+                self.add_link(self_link)
+            elif target is None:
+                self.remove_links(rel)
+            elif rel == RelType.ROOT and index is not None:
+                self.links[index] = Link.root(target).set_owner(self)
+            elif rel == RelType.ROOT:
+                self.add_link(Link.root(target))
+            else:
+                self.remove_links(rel)
+                self.add_link(Link.parent(target))
+        self._dirty = dirty
+
+    def _has_lazy_links(self) -> bool:
+        # Lazy links with a known self HREF can take the same self HREF, a root
+        # and a parent without being built, see _materialize_links.
+        return "_lazy_links" in self.__dict__ and self._lazy_links[1] is not None
+
+    def _lazy_links_to(self, rel: str, target: Catalog | None) -> bool:
+        """Like ``_links_to``, for the raw links of a lazy item."""
+        targets = self.__dict__.get("_lazy_targets", {})
+        if rel in targets:
+            return targets[rel] is target
+        links, href = self._lazy_links
+        link = next((x for x in links if x.get("rel") == rel), None)
+        if link is None or target is None:
+            return link is None and target is None
+        target_href = target.get_self_href()
+        return target_href is not None and (
+            make_absolute_href(link["href"], href) == target_href
+        )
+
+    def _set_lazy_target(self, rel: str, target: Catalog | None) -> None:
+        unchanged = rel == RelType.SELF or self._lazy_links_to(rel, target)
+        targets = self.__dict__.setdefault("_lazy_targets", {})
+        if rel != RelType.ROOT:
+            # These links are removed and added again, i.e. they move last.
+            targets.pop(rel, None)
+        targets[rel] = target
+        if not unchanged:
+            self._dirty = True
+
+    def _add_links_from_dicts(
+        self, links: list[dict[str, Any]], href: str | None
+    ) -> None:
+        for link in links:
+            if href is None or link.get("rel", None) != RelType.SELF:
+                self.add_link(Link.from_dict(link))
+
     def __getstate__(self) -> dict[str, Any]:
         """Ensure that pystac does not encode too much information when pickling"""
+        if "_lazy_assets" in self.__dict__:
+            self._materialize_assets()
+        if "_lazy_links" in self.__dict__:
+            self._materialize_links()
         d = self.__dict__.copy()
 
         d["links"] = [
@@ -201,6 +304,40 @@ class Item(STACObject, Assets):
 
         self.__dict__ = d
 
+    def get_self_href(self) -> str | None:
+        if self._has_lazy_links():
+            return self._lazy_links[1]
+        return super().get_self_href()
+
+    def get_root(self) -> Catalog | None:
+        if self._has_lazy_links() and RelType.ROOT in self.__dict__.get(
+            "_lazy_targets", {}
+        ):
+            return self._lazy_targets[RelType.ROOT]
+        return super().get_root()
+
+    def set_root(self, root: Catalog | None) -> None:
+        if not self._has_lazy_links():
+            return super().set_root(root)
+        previous = self.__dict__.get("_lazy_targets", {}).get(RelType.ROOT)
+        if previous is not None:
+            previous._resolved_objects.remove(self)
+        self._set_lazy_target(RelType.ROOT, root)
+        if root is not None:
+            root._resolved_objects.cache(self)
+
+    def get_parent(self) -> Catalog | None:
+        if self._has_lazy_links() and RelType.PARENT in self.__dict__.get(
+            "_lazy_targets", {}
+        ):
+            return self._lazy_targets[RelType.PARENT]
+        return super().get_parent()
+
+    def set_parent(self, parent: Catalog | None) -> None:
+        if not self._has_lazy_links():
+            return super().set_parent(parent)
+        self._set_lazy_target(RelType.PARENT, parent)
+
     def set_self_href(self, href: str | None) -> None:
         """Sets the absolute HREF that is represented by the ``rel == 'self'``
         :class:`~pystac.Link`.
@@ -218,11 +355,14 @@ class Item(STACObject, Assets):
                 HREF based on the current working directory. If this is None
                 the call will clear the self HREF link.
         """
+        if self._has_lazy_links() and href == self._lazy_links[1]:
+            self._set_lazy_target(RelType.SELF, None)
+            return
         prev_href = self.get_self_href()
         super().set_self_href(href)
         new_href = self.get_self_href()  # May have been made absolute.
 
-        if prev_href is not None and new_href is not None:
+        if prev_href is not None and new_href is not None and prev_href != new_href:
             # Make sure relative asset links remain valid.
             for asset in self.assets.values():
                 asset_href = asset.href
@@ -418,15 +558,44 @@ class Item(STACObject, Assets):
         root: Catalog | None = None,
         migrate: bool = True,
         preserve_dict: bool = True,
+        lazy: bool = False,
     ) -> T:
-        from pystac.extensions.version import ItemVersionExtension
+        """Parses an :class:`Item` from the passed in dictionary.
 
-        if preserve_dict:
-            d = deepcopy(d)
+        Args:
+            d : The dict to parse.
+            href : Optional href that is the file location of the object being
+                parsed.
+            root : Optional root catalog for this object.
+                If provided, the root of the returned Item will be set
+                to this parameter.
+            migrate: By default, STAC objects and extensions are migrated to
+                their latest supported version. Set this to False to disable
+                this behavior.
+            preserve_dict: If False, the dict parameter ``d`` may be modified
+                during this method call. Otherwise the dict is not mutated.
+                Defaults to True, which results results in a deepcopy of the
+                parameter. Set to False when possible to avoid the performance
+                hit of a deepcopy.
+            lazy: If True, the :attr:`assets` and the :attr:`links` of the Item are
+                only built from their JSON the first time they are accessed, which
+                avoids creating :class:`~pystac.Asset` and :class:`~pystac.Link`
+                objects in scans that only read e.g. the id, datetime, bbox or
+                properties of many Items. Setting the self HREF, root or parent of
+                such an Item does not build its links. Defaults to False.
+
+        Returns:
+            Item: The Item parsed from this dict.
+        """
+        from pystac.extensions.version import ItemVersionExtension
 
         if migrate:
+            # Migration copies the dict unless it may be modified, so that it is
+            # never copied more than once.
             info = identify_stac_object(d)
-            d = migrate_to_latest(d, info)
+            d = migrate_to_latest(d, info, in_place=not preserve_dict)
+        elif preserve_dict:
+            d = deepcopy(d)
 
         if not cls.matches_object_type(d):
             raise pystac.STACTypeError(d, cls)
@@ -459,18 +628,27 @@ class Item(STACObject, Assets):
             if k not in [*pass_through_fields, *parse_fields, *exclude_fields]
         }
 
-        item = cls(
-            **{k: d.get(k) for k in pass_through_fields},  # type: ignore
-            datetime=datetime,
-            properties=properties,
-            extra_fields=extra_fields,
-            href=href,
-            assets={k: Asset.from_dict(v) for k, v in assets.items()},
-        )
-
-        for link in links:
-            if href is None or link.get("rel", None) != RelType.SELF:
-                item.add_link(Link.from_dict(link))
+        if lazy:
+            item = cls(
+                **{k: d.get(k) for k in pass_through_fields},  # type: ignore
+                datetime=datetime,
+                properties=properties,
+                extra_fields=extra_fields,
+            )
+            del item.assets
+            del item.links
+            item._lazy_assets = assets
+            item._lazy_links = (links, href)
+        else:
+            item = cls(
+                **{k: d.get(k) for k in pass_through_fields},  # type: ignore
+                datetime=datetime,
+                properties=properties,
+                extra_fields=extra_fields,
+                href=href,
+                assets={k: Asset.from_dict(v) for k, v in assets.items()},
+            )
+            item._add_links_from_dicts(links, href)
 
         if root:
             item.set_root(root)
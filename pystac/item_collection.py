@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable, Iterator
+from collections.abc import Collection, Iterable, Iterator, Sequence
 from copy import deepcopy
 from html import escape
 from typing import (
+    TYPE_CHECKING,
     Any,
     TypeAlias,
     TypeVar,
@@ -12,9 +13,21 @@ from typing import (
 import pystac
 from pystac.errors import STACTypeError
 from pystac.html.jinja_env import get_jinja_env
+from pystac.index import (
+    IntervalLike,
+    SpatialIndex,
+    TemporalIndex,
+    item_intersects,
+    item_interval,
+    parse_interval,
+    query_bbox,
+)
 from pystac.serialization.identify import identify_stac_object_type
 from pystac.utils import HREF, is_absolute_href, make_absolute_href, make_posix_style
 
+if TYPE_CHECKING:
+    from pystac.columnar import ColumnarItemCollection
+
 ItemLike: TypeAlias = pystac.Item | dict[str, Any]
 
 #: Generalized version of :class:`ItemCollection`
@@ -90,6 +103,9 @@ class ItemCollection(Collection[pystac.Item]):
     """Dictionary of additional top-level fields for the GeoJSON
     FeatureCollection."""
 
+    _spatial_index: tuple[list[pystac.Item], int, SpatialIndex[int]] | None
+    _temporal_index: tuple[list[pystac.Item], int, TemporalIndex[int]] | None
+
     def __init__(
         self,
         items: Iterable[ItemLike],
@@ -105,6 +121,8 @@ class ItemCollection(Collection[pystac.Item]):
 
         self.items = list(map(map_item, items))
         self.extra_fields = extra_fields or {}
+        self._spatial_index = None
+        self._temporal_index = None
 
     def __getitem__(self, idx: int) -> pystac.Item:
         return self.items[idx]
@@ -125,6 +143,131 @@ class ItemCollection(Collection[pystac.Item]):
         combined = [*self.items, *other.items]
         return ItemCollection(items=combined)
 
+    def search(
+        self,
+        bbox: Sequence[float] | None = None,
+        intersects: dict[str, Any] | None = None,
+        datetime: IntervalLike | None = None,
+    ) -> ItemCollection:
+        """Returns the items of this collection that intersect a bounding box, a
+        geometry and/or a time interval, in their order in this collection.
+
+        Candidates are found with a :class:`~pystac.index.SpatialIndex` over the
+        bounding boxes and a :class:`~pystac.index.TemporalIndex` over the
+        datetimes of the items, which are built by the first search that needs them
+        and rebuilt when items are added to or removed from :attr:`items`. Call
+        :meth:`clear_search_index` after changing the geometry or datetimes of
+        items.
+
+        Args:
+            bbox : Optional 2D or 3D bounding box the items must intersect. May
+                cross the antimeridian.
+            intersects : Optional GeoJSON geometry the item geometries must
+                intersect, tested in planar coordinates.
+            datetime : Optional datetime or time interval the items must
+                intersect, such as ``"2020-01-01/2021-01-01"`` or
+                ``"2020-01-01T00:00:00Z/.."``. Items cover the interval from their
+                ``start_datetime`` to their ``end_datetime`` where given, otherwise
+                their ``datetime``.
+
+        Returns:
+            ItemCollection: The matching items, not cloned, with the extra fields
+            of this collection.
+        """
+        query = query_bbox(bbox, intersects)
+        interval = None if datetime is None else parse_interval(datetime)
+        positions: Iterable[int] = range(len(self.items))
+        if query is not None:
+            positions = self._get_spatial_index().search_indices(query)
+        if interval is not None:
+            in_interval = self._get_temporal_index().search_indices(interval)
+            if query is None:
+                positions = in_interval
+            else:
+                positions = sorted(set(positions).intersection(in_interval))
+        return ItemCollection(
+            items=[
+                self.items[i]
+                for i in positions
+                if query is None or item_intersects(self.items[i], bbox, intersects)
+            ],
+            extra_fields=dict(self.extra_fields),
+            clone_items=False,
+        )
+
+    def clear_search_index(self) -> None:
+        """Drops the indexes built by :meth:`search`."""
+        self._spatial_index = None
+        self._temporal_index = None
+
+    def _get_spatial_index(self) -> SpatialIndex[int]:
+        if self._spatial_index is not None:
+            items, size, index = self._spatial_index
+            if items is self.items and size == len(items):
+                return index
+        index = SpatialIndex((item.bbox, i) for i, item in enumerate(self.items))
+        self._spatial_index = (self.items, len(self.items), index)
+        return index
+
+    def _get_temporal_index(self) -> TemporalIndex[int]:
+        if self._temporal_index is not None:
+            items, size, index = self._temporal_index
+            if items is self.items and size == len(items):
+                return index
+        index = TemporalIndex(
+            (item_interval(item), i) for i, item in enumerate(self.items)
+        )
+        self._temporal_index = (self.items, len(self.items), index)
+        return index
+
+    def to_columnar(self, properties: Sequence[str] = ()) -> ColumnarItemCollection:
+        """Returns a :class:`~pystac.columnar.ColumnarItemCollection` of the items of
+        this collection. Requires the ``numpy`` package.
+
+        Args:
+            properties : Names of the item properties to store as columns.
+        """
+        from pystac.columnar import ColumnarItemCollection
+
+        return ColumnarItemCollection.from_items(
+            self.items, properties, deepcopy(self.extra_fields)
+        )
+
+    def to_parquet(self, where: str, chunk_size: int | None = None) -> None:
+        """Writes the items of this collection to a GeoParquet file in the
+        stac-geoparquet layout. See :func:`pystac.geoparquet.write_parquet`.
+        Requires the ``pyarrow`` package.
+
+        Args:
+            where : Path of the file to write.
+            chunk_size : Optional number of items per row group.
+        """
+        from pystac.geoparquet import DEFAULT_CHUNK_SIZE, write_parquet
+
+        write_parquet(self.items, where, chunk_size or DEFAULT_CHUNK_SIZE)
+
+    @classmethod
+    def from_parquet(
+        cls: type[C],
+        source: str,
+        columns: Sequence[str] | None = None,
+        bbox: Sequence[float] | None = None,
+        datetime: IntervalLike | None = None,
+    ) -> C:
+        """Reads the items of a stac-geoparquet file. See
+        :func:`pystac.geoparquet.read_parquet`. Requires the ``pyarrow`` package.
+
+        Args:
+            source : Path of the file to read.
+            columns : Optional names of the columns to read.
+            bbox : Optional 2D bounding box the items must intersect.
+            datetime : Optional datetime or time interval the items must
+                intersect.
+        """
+        from pystac.geoparquet import read_parquet
+
+        return cls(read_parquet(source, columns, bbox, datetime), clone_items=False)
+
     def to_dict(self, transform_hrefs: bool = False) -> dict[str, Any]:
         """Serializes an :class:`ItemCollection` instance to a dictionary.
 
@@ -168,6 +311,7 @@ class ItemCollection(Collection[pystac.Item]):
         d: dict[str, Any],
         preserve_dict: bool = True,
         root: pystac.Catalog | None = None,
+        lazy: bool = False,
     ) -> C:
         """Creates a :class:`ItemCollection` instance from a dictionary.
 
@@ -175,20 +319,25 @@ class ItemCollection(Collection[pystac.Item]):
             d : The dictionary from which the :class:`ItemCollection` will be created
             preserve_dict: If False, the dict parameter ``d`` may be modified
                 during this method call. Otherwise the dict is not mutated.
-                Defaults to True, which results results in a deepcopy of the
-                parameter. Set to False when possible to avoid the performance
-                hit of a deepcopy.
+                Defaults to True, which results in a deepcopy of each feature.
+                Set to False when possible to avoid the performance hit of a
+                deepcopy.
+            root : Optional root catalog of the items.
+            lazy : If True, the items are parsed with ``lazy=True``, see
+                :meth:`Item.from_dict <pystac.Item.from_dict>`. Defaults to False.
         """
         if not cls.is_item_collection(d):
             raise STACTypeError(d, cls)
 
         items = [
-            pystac.Item.from_dict(item, preserve_dict=preserve_dict, root=root)
+            pystac.Item.from_dict(
+                item, preserve_dict=preserve_dict, root=root, lazy=lazy
+            )
             for item in d.get("features", [])
         ]
         extra_fields = {k: v for k, v in d.items() if k not in ("features", "type")}
 
-        return cls(items=items, extra_fields=extra_fields)
+        return cls(items=items, extra_fields=extra_fields, clone_items=False)
 
     @classmethod
     def from_file(cls: type[C], href: HREF, stac_io: pystac.StacIO | None = None) -> C:
@@ -201,11 +350,7 @@ class ItemCollection(Collection[pystac.Item]):
         if stac_io is None:
             stac_io = pystac.StacIO.default()
 
-        href = make_posix_style(href)
-        if not is_absolute_href(href):
-            href = make_absolute_href(href)
-
-        d = stac_io.read_json(href)
+        d = stac_io.read_json(_absolute_href(href))
 
         return cls.from_dict(d, preserve_dict=False)
 
@@ -226,6 +371,79 @@ class ItemCollection(Collection[pystac.Item]):
 
         stac_io.save_json(dest_href, self.to_dict())
 
+    @staticmethod
+    def iter_file(
+        href: HREF, stac_io: pystac.StacIO | None = None, lazy: bool = False
+    ) -> Iterator[pystac.Item]:
+        """Reads the items of a GeoJSON FeatureCollection file one at a time.
+
+        Unlike :meth:`from_file`, the file is parsed incrementally, so that only one
+        item is held in memory at a time when ``stac_io`` supports
+        :meth:`~pystac.StacIO.read_text_chunks`, as
+        :class:`~pystac.stac_io.DefaultStacIO` does. Top-level fields other than the
+        features are not read.
+
+        Arguments:
+            href : Path to the file.
+            stac_io : A :class:`~pystac.StacIO` instance to use for file I/O
+            lazy : If True, the items are parsed with ``lazy=True``, see
+                :meth:`Item.from_dict <pystac.Item.from_dict>`. Defaults to False.
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+
+        for d in stac_io.read_features(_absolute_href(href)):
+            yield pystac.Item.from_dict(d, preserve_dict=False, lazy=lazy)
+
+    @staticmethod
+    def iter_ndjson(
+        href: HREF, stac_io: pystac.StacIO | None = None, lazy: bool = False
+    ) -> Iterator[pystac.Item]:
+        """Reads the items of a newline-delimited JSON file, with one item per line,
+        one at a time.
+
+        Arguments:
+            href : Path to the file.
+            stac_io : A :class:`~pystac.StacIO` instance to use for file I/O
+            lazy : If True, the items are parsed with ``lazy=True``, see
+                :meth:`Item.from_dict <pystac.Item.from_dict>`. Defaults to False.
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+
+        for d in stac_io.read_ndjson(_absolute_href(href)):
+            yield pystac.Item.from_dict(d, preserve_dict=False, lazy=lazy)
+
+    @staticmethod
+    def write_ndjson(
+        href: HREF,
+        items: Iterable[ItemLike],
+        stac_io: pystac.StacIO | None = None,
+    ) -> None:
+        """Writes items to a newline-delimited JSON file, with one item per line.
+
+        Items are serialized one at a time, so ``items`` can be a generator, such as
+        the one returned by :meth:`iter_ndjson`, to convert files that do not fit in
+        memory.
+
+        Arguments:
+            href : Path to the file.
+            items : The items, or dictionaries of items, to write.
+            stac_io : A :class:`~pystac.StacIO` instance to use for file I/O
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+
+        stac_io.save_ndjson(
+            href,
+            (
+                item.to_dict(transform_hrefs=False)
+                if isinstance(item, pystac.Item)
+                else item
+                for item in items
+            ),
+        )
+
     @staticmethod
     def is_item_collection(d: dict[str, Any]) -> bool:
         """Checks if the given dictionary represents a valid :class:`ItemCollection`.
@@ -251,3 +469,10 @@ class ItemCollection(Collection[pystac.Item]):
             identify_stac_object_type(feature) == pystac.STACObjectType.ITEM
             for feature in d.get("features", [])
         )
+
+
+def _absolute_href(href: HREF) -> str:
+    href = make_posix_style(href)
+    if not is_absolute_href(href):
+        href = make_absolute_href(href)
+    return href
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import os
 import posixpath
+import re
 import warnings
 from abc import ABC, abstractmethod
-from collections import OrderedDict
 from collections.abc import Callable
+from datetime import datetime
+from operator import attrgetter
 from string import Formatter
 from typing import TYPE_CHECKING, Any
 
@@ -121,88 +123,112 @@ class LayoutTemplate:
                     v = f"{v}:{formatter_parse_result[2]}"
                 template_vars.append(v)
         self.template_vars = template_vars
-
-    def _get_template_value(self, stac_object: STACObject, template_var: str) -> Any:
+        self._compiled: _CompiledTemplate | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The compiled accessors are closures, which cannot be pickled
+        state = self.__dict__.copy()
+        state["_compiled"] = None
+        return state
+
+    def _compile(self) -> _CompiledTemplate:
+        compiled = self._compiled
+        if compiled is None or compiled.template is not self.template:
+            compiled = _CompiledTemplate(self)
+            self._compiled = compiled
+        return compiled
+
+    def _compile_var(self, template_var: str) -> _Accessor:
+        """Returns a function getting the value of ``template_var`` from a STAC
+        object and the datetime of the object, if it is an item."""
         if template_var in self.ITEM_TEMPLATE_VARS:
-            if isinstance(stac_object, pystac.Item):
-                # Datetime
-                dt = stac_object.datetime
-                if dt is None:
-                    dt = stac_object.common_metadata.start_datetime
-                if dt is None:
-                    raise pystac.TemplateError(
-                        "Item {} does not have a datetime or "
-                        "datetime range set; cannot template {} in {}".format(
-                            stac_object, template_var, self.template
-                        )
+            return self._compile_item_var(template_var)
+
+        # Allow dot-notation properties for arbitrary object values.
+        props = template_var.split(".")
+        first = props[0]
+
+        def error(stac_object: STACObject) -> pystac.TemplateError:
+            return pystac.TemplateError(
+                f"Cannot find property {template_var} on {stac_object} for "
+                f"template {self.template}"
+            )
+
+        def get_value(stac_object: STACObject, dt: datetime | None) -> Any:
+            try:
+                prop_source: STACObject | dict[str, Any] | None = None
+                if hasattr(stac_object, first):
+                    prop_source = stac_object
+
+                if prop_source is None:
+                    obj_props: dict[str, Any] | None = getattr(
+                        stac_object, "properties", None
                     )
+                    if obj_props is not None and first in obj_props:
+                        prop_source = obj_props
 
-                if template_var == "year":
-                    return dt.year
-                if template_var == "month":
-                    return dt.month
-                if template_var == "day":
-                    return dt.day
-                if template_var == "date":
-                    return dt.date().isoformat()
-
-                # Collection
-                if template_var == "collection":
-                    if stac_object.collection_id is not None:
-                        return stac_object.collection_id
-                    raise pystac.TemplateError(
-                        f"Item {stac_object} does not have a collection ID set; "
-                        f"cannot template {template_var} in {self.template}"
+                if prop_source is None:
+                    extra_fields: dict[str, Any] | None = getattr(
+                        stac_object, "extra_fields", None
                     )
-            else:
+                    if extra_fields is not None and first in extra_fields:
+                        prop_source = extra_fields
+
+                if prop_source is None:
+                    raise error(stac_object)
+
+                v: Any = prop_source
+                for prop in props:
+                    if isinstance(v, dict):
+                        if prop not in v:
+                            raise error(stac_object)
+                        v = v[prop]
+                    else:
+                        if not hasattr(v, prop):
+                            raise error(stac_object)
+                        v = getattr(v, prop)
+            except pystac.TemplateError:
+                if template_var in self.defaults:
+                    return self.defaults[template_var]
+                raise
+            return v
+
+        return get_value
+
+    def _compile_item_var(self, template_var: str) -> _Accessor:
+        get_part: Callable[[datetime], Any] | None = None
+        if template_var in ("year", "month", "day"):
+            get_part = attrgetter(template_var)
+        elif template_var == "date":
+            get_part = _get_iso_date
+
+        def get_value(stac_object: STACObject, dt: datetime | None) -> Any:
+            if not isinstance(stac_object, pystac.Item):
                 raise pystac.TemplateError(
-                    '"{}" cannot be used to template non-Item {} in {}'.format(
-                        template_var, stac_object, self.template
-                    )
+                    f'"{template_var}" cannot be used to template non-Item '
+                    f"{stac_object} in {self.template}"
                 )
-
-        # Allow dot-notation properties for arbitrary object values.
-        props = template_var.split(".")
-        prop_source: pystac.STACObject | dict[str, Any] | None = None
-        error = pystac.TemplateError(
-            "Cannot find property {} on {} for template {}".format(
-                template_var, stac_object, self.template
+            if dt is None:
+                raise pystac.TemplateError(
+                    f"Item {stac_object} does not have a datetime or datetime range "
+                    f"set; cannot template {template_var} in {self.template}"
+                )
+            if get_part is not None:
+                return get_part(dt)
+            if stac_object.collection_id is not None:
+                return stac_object.collection_id
+            raise pystac.TemplateError(
+                f"Item {stac_object} does not have a collection ID set; "
+                f"cannot template {template_var} in {self.template}"
             )
-        )
 
-        try:
-            if hasattr(stac_object, props[0]):
-                prop_source = stac_object
-
-            if prop_source is None and hasattr(stac_object, "properties"):
-                obj_props: dict[str, Any] | None = stac_object.properties
-                if obj_props is not None and props[0] in obj_props:
-                    prop_source = obj_props
-
-            if prop_source is None and hasattr(stac_object, "extra_fields"):
-                extra_fields: dict[str, Any] | None = stac_object.extra_fields
-                if extra_fields is not None and props[0] in extra_fields:
-                    prop_source = extra_fields
-
-            if prop_source is None:
-                raise error
-
-            v: Any = prop_source
-            for prop in template_var.split("."):
-                if isinstance(v, dict):
-                    if prop not in v:
-                        raise error
-                    v = v[prop]
-                else:
-                    if not hasattr(v, prop):
-                        raise error
-                    v = getattr(v, prop)
-        except pystac.TemplateError as e:
-            if template_var in self.defaults:
-                return self.defaults[template_var]
-            raise e
-
-        return v
+        return get_value
+
+    def _get_template_value(self, stac_object: STACObject, template_var: str) -> Any:
+        accessor = self._compile().accessors.get(template_var)
+        if accessor is None:
+            accessor = self._compile_var(template_var)
+        return accessor(stac_object, _get_item_datetime(stac_object))
 
     def get_template_values(self, stac_object: STACObject) -> dict[str, Any]:
         """Gets a dictionary of template variables to values derived from
@@ -224,9 +250,12 @@ class LayoutTemplate:
                 derived from the stac object and there is no default,
                 this error will be raised.
         """
-        return OrderedDict(
-            [(k, self._get_template_value(stac_object, k)) for k in self.template_vars]
-        )
+        compiled = self._compile()
+        dt = _get_item_datetime(stac_object) if compiled.uses_datetime else None
+        return {
+            var: accessor(stac_object, dt)
+            for var, accessor in compiled.accessors.items()
+        }
 
     def substitute(self, stac_object: STACObject) -> str:
         """Substitutes the values derived from
@@ -248,11 +277,53 @@ class LayoutTemplate:
                 this error will be raised.
         """
         parts = self.get_template_values(stac_object)
+        compiled = self._compile()
+        return compiled.format_string.format(*[parts[v] for v in compiled.substituted])
+
+
+#: Gets the value of a template variable from a STAC object and the datetime of
+#: the object, if it is an item.
+_Accessor = Callable[["STACObject", "datetime | None"], Any]
+
 
-        s = self.template
-        for key, value in parts.items():
-            s = s.replace("${" + f"{key}" + "}", f"{value}")
-        return s
+def _get_iso_date(dt: datetime) -> str:
+    return dt.date().isoformat()
+
+
+def _get_item_datetime(stac_object: STACObject) -> datetime | None:
+    """Returns the datetime of an item, or its start datetime if it has none."""
+    if not isinstance(stac_object, pystac.Item):
+        return None
+    dt = stac_object.datetime
+    if dt is None:
+        dt = stac_object.common_metadata.start_datetime
+    return dt
+
+
+class _CompiledTemplate:
+    """The variables of a :class:`LayoutTemplate` with their accessors, and its
+    template string split around the variables."""
+
+    def __init__(self, layout_template: LayoutTemplate) -> None:
+        self.template = layout_template.template
+        self.accessors: dict[str, _Accessor] = {
+            var: layout_template._compile_var(var)
+            for var in layout_template.template_vars
+        }
+        self.uses_datetime = any(
+            var in layout_template.ITEM_TEMPLATE_VARS for var in self.accessors
+        )
+        # The template as a format string with a positional field in place of each
+        # occurrence of a variable in ``substituted``
+        pieces = [self.template]
+        if self.accessors:
+            pattern = "|".join(re.escape(var) for var in self.accessors)
+            # Literal text at even positions and variables at odd positions
+            pieces = re.split(r"\$\{(" + pattern + r")\}", self.template)
+        self.substituted = pieces[1::2]
+        self.format_string = "{}".join(
+            piece.replace("{", "{{").replace("}", "}}") for piece in pieces[::2]
+        )
 
 
 class HrefLayoutStrategy(ABC):
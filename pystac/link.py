@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import copy
 from html import escape
 from typing import TYPE_CHECKING, Any, TypeVar
@@ -28,7 +31,10 @@ if TYPE_CHECKING:
     PathLike = os.PathLike[str]
 
 else:
-    PathLike = os.PathLike
+    # os.PathLike recognizes Link by its __fspath__ method, so it is left out of
+    # the bases at runtime: it has no __slots__, which would give every Link a
+    # __dict__.
+    PathLike = object
 
 #: Generalized version of :class:`Link`
 L = TypeVar("L", bound="Link")
@@ -44,6 +50,87 @@ HIERARCHICAL_LINKS = [
 ]
 
 
+class _HrefContext:
+    """Caches what :meth:`Link.get_href` looks up to make HREFs relative, while the
+    objects the links belong to are not modified, e.g. during
+    :meth:`Catalog.save <pystac.Catalog.save>`."""
+
+    def __init__(self) -> None:
+        self.rel_links: dict[tuple[type, tuple[str, ...]], frozenset[str]] = {}
+        self.self_hrefs: dict[int, tuple[STACObject, str | None]] = {}
+        # Targets of the hierarchical links below each root: the objects by id,
+        # kept so that their ids stay valid, and the HREFs.
+        self.hierarchies: dict[int, tuple[list[STACObject], set[int], set[str]]] = {}
+
+    def get_rel_links(self, owner: STACObject) -> frozenset[str]:
+        """Returns the relation types of the hierarchical links of ``owner``,
+        including those added by its extensions."""
+        key = (type(owner), tuple(owner.stac_extensions))
+        rel_links = self.rel_links.get(key)
+        if rel_links is None:
+            rel_links = frozenset(
+                [
+                    *HIERARCHICAL_LINKS,
+                    *pystac.EXTENSION_HOOKS.get_extended_object_links(owner),
+                ]
+            )
+            self.rel_links[key] = rel_links
+        return rel_links
+
+    def get_self_href(self, obj: STACObject) -> str | None:
+        cached = self.self_hrefs.get(id(obj))
+        if cached is None:
+            cached = (obj, obj.get_self_href())
+            self.self_hrefs[id(obj)] = cached
+        return cached[1]
+
+    def in_hierarchy(self, root: Catalog, target: str | STACObject) -> bool:
+        """Returns whether ``target`` is in the hierarchical link tree of ``root``,
+        like :meth:`STACObject.target_in_hierarchy
+        <pystac.STACObject.target_in_hierarchy>`, walking the tree only once."""
+        hierarchy = self.hierarchies.get(id(root))
+        if hierarchy is None:
+            objects: list[STACObject] = [root]
+            ids = {id(root)}
+            hrefs: set[str] = set()
+            stack: list[STACObject] = [root]
+            while stack:
+                for link in stack.pop().links:
+                    if not link.is_hierarchical():
+                        continue
+                    link_target = link.target
+                    if isinstance(link_target, str):
+                        hrefs.add(link_target)
+                    elif id(link_target) not in ids:
+                        ids.add(id(link_target))
+                        objects.append(link_target)
+                        stack.append(link_target)
+            hierarchy = (objects, ids, hrefs)
+            self.hierarchies[id(root)] = hierarchy
+        if isinstance(target, str):
+            return target in hierarchy[2]
+        return id(target) in hierarchy[1]
+
+
+_href_context: ContextVar[_HrefContext | None] = ContextVar(
+    "_href_context", default=None
+)
+
+
+@contextmanager
+def _caching_hrefs() -> Iterator[None]:
+    """Caches the lookups of :meth:`Link.get_href` within the block, which must not
+    modify the links or self HREFs of any object. Can also decorate a function."""
+    if _href_context.get() is not None:
+        yield
+        return
+    token = _href_context.set(_HrefContext())
+    try:
+        yield
+    finally:
+        _href_context.reset(token)
+
+
 class Link(PathLike):
     """A link connects a :class:`~pystac.STACObject` to another entity.
 
@@ -80,10 +167,6 @@ class Link(PathLike):
     """Optional description of the media type. Registered Media Types are preferred.
     See :class:`~pystac.MediaType` for common media types."""
 
-    extra_fields: dict[str, Any]
-    """Optional, additional fields for this link. This is used by extensions as a
-    way to serialize and deserialize properties on link object JSON."""
-
     owner: STACObject | None
     """The owner of this link. The link will use its owner's root catalog
     :class:`~pystac.cache.ResolvedObjectCache` to resolve objects, and
@@ -92,6 +175,17 @@ class Link(PathLike):
     _target_href: str | None
     _target_object: STACObject | None
     _title: str | None
+    _extra_fields: dict[str, Any] | None
+
+    __slots__ = (
+        "rel",
+        "media_type",
+        "owner",
+        "_target_href",
+        "_target_object",
+        "_title",
+        "_extra_fields",
+    )
 
     def __init__(
         self,
@@ -113,7 +207,7 @@ class Link(PathLike):
             self._target_object = target
         self.media_type = media_type
         self.title = title
-        self.extra_fields = extra_fields or {}
+        self._extra_fields = extra_fields or None
         self.owner = None
 
     def set_owner(self, owner: STACObject | None) -> Link:
@@ -125,6 +219,18 @@ class Link(PathLike):
         self.owner = owner
         return self
 
+    @property
+    def extra_fields(self) -> dict[str, Any]:
+        """Optional, additional fields for this link. This is used by extensions as a
+        way to serialize and deserialize properties on link object JSON."""
+        if self._extra_fields is None:
+            self._extra_fields = {}
+        return self._extra_fields
+
+    @extra_fields.setter
+    def extra_fields(self, v: dict[str, Any]) -> None:
+        self._extra_fields = v
+
     @property
     def title(self) -> str | None:
         """Optional title for this link. If not provided during instantiation, this will
@@ -169,28 +275,33 @@ class Link(PathLike):
             then the HREF returned will be relative.
             In all other cases, this method will return an absolute HREF.
         """
+        context = _href_context.get()
         # get the self href
         if self._target_object:
-            href = self._target_object.get_self_href()
+            if context is None:
+                href = self._target_object.get_self_href()
+            else:
+                href = context.get_self_href(self._target_object)
         else:
             href = self._target_href
 
-        if (
-            transform_href
-            and href
-            and is_absolute_href(href)
-            and self.owner
-            and self.owner.get_root()
-        ):
+        if transform_href and href and self.owner and is_absolute_href(href):
             root = self.owner.get_root()
-            rel_links = [
-                *HIERARCHICAL_LINKS,
-                *pystac.EXTENSION_HOOKS.get_extended_object_links(self.owner),
-            ]
             # if a hierarchical link with an owner and root, and relative catalog
             if root and root.is_relative():
-                if self.rel in rel_links or root.target_in_hierarchy(self.target):
-                    owner_href = self.owner.get_self_href()
+                if context is None:
+                    rel_links = [
+                        *HIERARCHICAL_LINKS,
+                        *pystac.EXTENSION_HOOKS.get_extended_object_links(self.owner),
+                    ]
+                    if self.rel in rel_links or root.target_in_hierarchy(self.target):
+                        owner_href = self.owner.get_self_href()
+                        if owner_href is not None:
+                            href = make_relative_href(href, owner_href)
+                elif self.rel in context.get_rel_links(
+                    self.owner
+                ) or context.in_hierarchy(root, self.target):
+                    owner_href = context.get_self_href(self.owner)
                     if owner_href is not None:
                         href = make_relative_href(href, owner_href)
 
@@ -279,7 +390,9 @@ class Link(PathLike):
         else:
             return escape(repr(self))
 
-    def resolve_stac_object(self, root: Catalog | None = None) -> Link:
+    def resolve_stac_object(
+        self, root: Catalog | None = None, lazy: bool = False
+    ) -> Link:
         """Resolves a STAC object from the HREF of this link, if the link is not
         already resolved.
 
@@ -287,61 +400,167 @@ class Link(PathLike):
             root : Optional root of the catalog for this link.
                 If provided, the root's resolved object cache is used to search for
                 previously resolved instances of the STAC object.
+            lazy : If True and the target is an :class:`~pystac.Item` that is read,
+                it is parsed with ``lazy=True``, see :meth:`Item.from_dict
+                <pystac.Item.from_dict>`. Defaults to False.
         """
         if self._target_object:
             pass
         elif self._target_href:
-            target_href = self._target_href
-
-            # If it's a relative link, base it off the parent.
-            if not is_absolute_href(target_href):
-                if self.owner is None:
-                    raise pystac.STACError(
-                        "Relative path {} encountered "
-                        "without owner or start_href.".format(target_href)
-                    )
-                start_href = self.owner.get_self_href()
+            target_href = self._get_absolute_target_href()
+            obj = None
 
-                if start_href is None:
-                    raise pystac.STACError(
-                        "Relative path {} encountered "
-                        'without owner "self" link set.'.format(target_href)
-                    )
+            if root is not None:
+                obj = root._resolved_objects.get_by_href(target_href)
 
-                target_href = make_absolute_href(target_href, start_href)
-            obj = None
+            if obj is None:
+                stac_io = self._get_stac_io(root)
+                try:
+                    obj = stac_io.read_stac_object(target_href, root=root, lazy=lazy)
+                except Exception as e:
+                    raise STACError(
+                        f"HREF: '{target_href}' does not resolve to a STAC object"
+                    ) from e
+                obj = self._cache_resolved_object(obj, target_href, root)
+            self._target_object = obj
+        else:
+            raise ValueError("Cannot resolve STAC object without a target")
 
-            stac_io: pystac.StacIO | None = None
+        self._set_target_parent()
+        return self
+
+    async def resolve_stac_object_async(
+        self,
+        root: Catalog | None = None,
+        stac_io: pystac.stac_io.AsyncStacIO | None = None,
+        lazy: bool = False,
+    ) -> Link:
+        """Asynchronous version of :meth:`resolve_stac_object`, which reads the
+        target with an :class:`~pystac.stac_io.AsyncStacIO`.
+
+        Args:
+            root : Optional root of the catalog for this link.
+                If provided, the root's resolved object cache is used to search for
+                previously resolved instances of the STAC object.
+            stac_io : Optional :class:`~pystac.stac_io.AsyncStacIO` to read the
+                target with. If not provided, the instance set while reading the
+                root (or owner) catalog is used, falling back to
+                :meth:`AsyncStacIO.default <pystac.stac_io.AsyncStacIO.default>`.
+            lazy : If True and the target is an :class:`~pystac.Item` that is read,
+                it is parsed with ``lazy=True``. Defaults to False.
+        """
+        if self._target_object:
+            pass
+        elif self._target_href:
+            target_href = self._get_absolute_target_href()
+            obj = None
 
             if root is not None:
                 obj = root._resolved_objects.get_by_href(target_href)
-                stac_io = root._stac_io
+                stac_io = stac_io or root._async_stac_io
 
             if obj is None:
+                if stac_io is None and isinstance(self.owner, pystac.Catalog):
+                    stac_io = self.owner._async_stac_io
                 if stac_io is None:
-                    if self.owner is not None:
-                        if isinstance(self.owner, pystac.Catalog):
-                            stac_io = self.owner._stac_io
-                        elif self.rel != pystac.RelType.ROOT:
-                            owner_root = self.owner.get_root()
-                            if owner_root is not None:
-                                stac_io = owner_root._stac_io
-                    if stac_io is None:
-                        stac_io = pystac.StacIO.default()
+                    stac_io = pystac.stac_io.AsyncStacIO.default()
                 try:
-                    obj = stac_io.read_stac_object(target_href, root=root)
+                    obj = await stac_io.read_stac_object(
+                        target_href, root=root, lazy=lazy
+                    )
                 except Exception as e:
                     raise STACError(
                         f"HREF: '{target_href}' does not resolve to a STAC object"
                     ) from e
-                obj.set_self_href(target_href)
+                # Another coroutine may have resolved the same object meanwhile.
                 if root is not None:
-                    obj = root._resolved_objects.get_or_cache(obj)
-                    obj.set_root(root)
+                    cached = root._resolved_objects._peek(target_href)
+                    if cached is not None:
+                        obj = cached
+                obj = self._cache_resolved_object(obj, target_href, root)
             self._target_object = obj
         else:
             raise ValueError("Cannot resolve STAC object without a target")
 
+        self._set_target_parent()
+        return self
+
+    def _get_stac_io(self, root: Catalog | None) -> pystac.StacIO:
+        """Returns the StacIO used to read the target of this link."""
+        stac_io: pystac.StacIO | None = None
+        if root is not None:
+            stac_io = root._stac_io
+        if stac_io is None:
+            if self.owner is not None:
+                if isinstance(self.owner, pystac.Catalog):
+                    stac_io = self.owner._stac_io
+                elif self.rel != pystac.RelType.ROOT:
+                    owner_root = self.owner.get_root()
+                    if owner_root is not None:
+                        stac_io = owner_root._stac_io
+            if stac_io is None:
+                stac_io = pystac.StacIO.default()
+        return stac_io
+
+    def _resolve_from_object(
+        self, obj: STACObject, target_href: str, root: Catalog | None
+    ) -> None:
+        """Resolves this link with its target ``obj``, already read from
+        ``target_href`` without a root."""
+        cached = None
+        if root is not None:
+            cached = root._resolved_objects.get_by_href(target_href)
+        if cached is None:
+            cached = self._cache_resolved_object(obj, target_href, root)
+        self._target_object = cached
+        self._set_target_parent()
+
+    def _get_absolute_target_href(self) -> str:
+        """Returns the target HREF of this unresolved link made absolute against
+        the owner's self HREF."""
+        assert self._target_href is not None
+        target_href = self._target_href
+
+        # If it's a relative link, base it off the parent.
+        if not is_absolute_href(target_href):
+            if self.owner is None:
+                raise pystac.STACError(
+                    "Relative path {} encountered "
+                    "without owner or start_href.".format(target_href)
+                )
+            start_href = self.owner.get_self_href()
+
+            if start_href is None:
+                raise pystac.STACError(
+                    "Relative path {} encountered "
+                    'without owner "self" link set.'.format(target_href)
+                )
+
+            target_href = make_absolute_href(target_href, start_href)
+        return target_href
+
+    def _cache_resolved_object(
+        self, obj: STACObject, target_href: str, root: Catalog | None
+    ) -> STACObject:
+        """Sets the self HREF of a newly read target and ties it to ``root``."""
+        obj.set_self_href(target_href)
+        if root is not None:
+            obj = root._resolved_objects.get_or_cache(obj)
+            obj.set_root(root)
+            root._resolved_objects.track(obj, self)
+        return obj
+
+    def _release_target(self, root: Catalog | None) -> None:
+        """Sets this resolved link back to its target HREF, dropping the target
+        object from the resolved object cache of ``root``."""
+        obj = self._target_object
+        if obj is None or self._target_href is None:
+            return
+        if root is not None:
+            root._resolved_objects.discard(obj)
+        self._target_object = None
+
+    def _set_target_parent(self) -> None:
         if (
             self.owner
             and self.rel in [pystac.RelType.CHILD, pystac.RelType.ITEM]
@@ -353,8 +572,6 @@ class Link(PathLike):
             if self._target_object._allow_parent_to_override_href:
                 self._target_object.set_parent(self.owner)
 
-        return self
-
     def is_resolved(self) -> bool:
         """Determines if the link's target is a resolved STACObject.
 
@@ -399,8 +616,9 @@ class Link(PathLike):
         if self.title is not None:
             d["title"] = self.title
 
-        for k, v in self.extra_fields.items():
-            d[k] = v
+        if self._extra_fields:
+            for k, v in self._extra_fields.items():
+                d[k] = v
 
         return d
 
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+import pystac
+from pystac.errors import STACError
+from pystac.index import SpatialIndex
+from pystac.utils import make_absolute_href, make_relative_href
+
+if TYPE_CHECKING:
+    from pystac.catalog import Catalog
+
+MANIFEST_FILE_NAME = "catalog-manifest.json"
+"""Name of the manifest file written next to a catalog file by
+:meth:`Catalog.save <pystac.Catalog.save>`."""
+
+MANIFEST_TYPE = "pystac-catalog-manifest"
+MANIFEST_VERSION = 1
+
+
+def get_manifest_href(catalog_href: str) -> str:
+    """Returns the HREF of the manifest of the catalog at ``catalog_href``."""
+    return make_absolute_href(MANIFEST_FILE_NAME, catalog_href)
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Location of a child or item in a :class:`CatalogManifest`."""
+
+    href: str
+    """HREF of the object, relative to the catalog the manifest belongs to."""
+
+    parents: tuple[str, ...] = ()
+    """HREFs of the catalogs linking from the manifest's catalog to the object,
+    relative to the manifest's catalog and excluding it."""
+
+    bbox: tuple[float, ...] | None = None
+    """Bounding box of the item, if the object is an item with a geometry."""
+
+
+@dataclass
+class CatalogManifest:
+    """Maps the IDs of all children and items below a catalog to their location, so
+    that a recursive lookup only needs to read the files on the path to an object.
+
+    Manifests are written with ``Catalog.save(manifest=True)`` and read with
+    ``Catalog.from_file(href, manifest=True)``. They are only a hint: lookups check
+    that the objects they lead to have the expected ID, and search the catalog as
+    usual if they do not.
+
+    A manifest also stores a :class:`~pystac.index.SpatialIndex` over the bounding
+    boxes of the items, used by :meth:`Catalog.search <pystac.Catalog.search>`.
+    """
+
+    children: dict[str, list[ManifestEntry]] = field(default_factory=dict)
+    """Locations of the catalogs and collections below the catalog, by ID."""
+
+    items: dict[str, list[ManifestEntry]] = field(default_factory=dict)
+    """Locations of the items below the catalog, by ID."""
+
+    _spatial_index: SpatialIndex[int] | None = field(
+        default=None, compare=False, repr=False
+    )
+
+    def _item_entries(self) -> list[tuple[str, ManifestEntry]]:
+        return [(id, entry) for id, entries in self.items.items() for entry in entries]
+
+    @property
+    def spatial_index(self) -> SpatialIndex[int]:
+        """Index of the bounding boxes of the items of the manifest, whose values
+        are the positions of the items in the order of :attr:`items`."""
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex(
+                (entry.bbox, i) for i, (_, entry) in enumerate(self._item_entries())
+            )
+        return self._spatial_index
+
+    def search(self, bbox: Sequence[float]) -> list[tuple[str, ManifestEntry]]:
+        """Returns the IDs and locations of the items whose bounding box intersects
+        ``bbox``."""
+        entries = self._item_entries()
+        return [entries[i] for i in self.spatial_index.search(bbox)]
+
+    @classmethod
+    def from_catalog(
+        cls, catalog: Catalog, previous: CatalogManifest | None = None
+    ) -> CatalogManifest:
+        """Builds the manifest of ``catalog``.
+
+        Unresolved children and items are read to learn their IDs and children,
+        unless they are found in the ``previous`` manifest of the catalog.
+
+        Raises:
+            STACError: If the catalog has no self HREF.
+        """
+        base_href = catalog.get_self_href()
+        if base_href is None:
+            raise STACError("Cannot build the manifest of a catalog without self HREF.")
+        manifest = cls()
+        manifest._add_catalog(
+            catalog,
+            (),
+            base_href,
+            catalog.get_root(),
+            _PreviousManifest(previous) if previous is not None else None,
+        )
+        return manifest
+
+    def _add_catalog(
+        self,
+        catalog: Catalog,
+        parents: tuple[str, ...],
+        base_href: str,
+        root: Catalog | None,
+        previous: _PreviousManifest | None,
+    ) -> None:
+        for link in catalog.links:
+            if link.rel not in (pystac.RelType.ITEM, pystac.RelType.CHILD):
+                continue
+            absolute_href = link.get_absolute_href()
+            if absolute_href is None:
+                continue
+            href = make_relative_href(absolute_href, base_href)
+            if link.rel == pystac.RelType.ITEM:
+                known = None if previous is None else previous.items.get(href)
+                if link.is_resolved() or known is None:
+                    link.resolve_stac_object(root=root)
+                    item = cast(pystac.Item, link.target)
+                    bbox = None if item.bbox is None else tuple(item.bbox)
+                    item_id, entry = item.id, ManifestEntry(href, parents, bbox)
+                else:
+                    item_id, entry = known
+                self.items.setdefault(item_id, []).append(entry)
+            else:
+                if not link.is_resolved() and previous is not None:
+                    if previous.copy_subtree(href, parents, self):
+                        continue
+                link.resolve_stac_object(root=root)
+                child = cast(pystac.Catalog, link.target)
+                self.children.setdefault(child.id, []).append(
+                    ManifestEntry(href, parents)
+                )
+                self._add_catalog(child, parents + (href,), base_href, root, previous)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the JSON representation of this manifest."""
+
+        def entry_to_dict(entry: ManifestEntry) -> dict[str, Any]:
+            d: dict[str, Any] = {"href": entry.href, "parents": list(entry.parents)}
+            if entry.bbox is not None:
+                d["bbox"] = list(entry.bbox)
+            return d
+
+        def entries_to_dict(
+            entries: dict[str, list[ManifestEntry]],
+        ) -> dict[str, list[dict[str, Any]]]:
+            return {id: [entry_to_dict(e) for e in es] for id, es in entries.items()}
+
+        return {
+            "type": MANIFEST_TYPE,
+            "version": MANIFEST_VERSION,
+            "children": entries_to_dict(self.children),
+            "items": entries_to_dict(self.items),
+            "spatial_index": self.spatial_index.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> CatalogManifest:
+        """Reads a manifest from its JSON representation.
+
+        Raises:
+            STACError: If ``d`` is not a manifest of a supported version.
+        """
+        if d.get("type") != MANIFEST_TYPE or d.get("version") != MANIFEST_VERSION:
+            raise STACError(
+                f"Not a version {MANIFEST_VERSION} catalog manifest: "
+                f"type={d.get('type')!r}, version={d.get('version')!r}"
+            )
+
+        def entry_from_dict(e: dict[str, Any]) -> ManifestEntry:
+            bbox = e.get("bbox")
+            return ManifestEntry(
+                e["href"],
+                tuple(e.get("parents", [])),
+                None if bbox is None else tuple(bbox),
+            )
+
+        def entries_from_dict(
+            entries: dict[str, list[dict[str, Any]]],
+        ) -> dict[str, list[ManifestEntry]]:
+            return {id: [entry_from_dict(e) for e in es] for id, es in entries.items()}
+
+        manifest = cls(
+            children=entries_from_dict(d.get("children", {})),
+            items=entries_from_dict(d.get("items", {})),
+        )
+        if "spatial_index" in d:
+            manifest._spatial_index = SpatialIndex.from_dict(d["spatial_index"])
+        return manifest
+
+
+class _PreviousManifest:
+    """Reverse lookups into the manifest a new one is built from."""
+
+    def __init__(self, manifest: CatalogManifest):
+        self.items: dict[str, tuple[str, ManifestEntry]] = {}
+        # Entries by the HREFs of the catalogs they are below, starting with the
+        # entry of the catalog itself.
+        self.subtrees: dict[str, list[tuple[str, str, ManifestEntry]]] = {}
+        for id, entries in manifest.children.items():
+            for entry in entries:
+                self.subtrees.setdefault(entry.href, []).insert(
+                    0, ("children", id, entry)
+                )
+                for parent in entry.parents:
+                    self.subtrees.setdefault(parent, []).append(("children", id, entry))
+        for id, entries in manifest.items.items():
+            for entry in entries:
+                self.items[entry.href] = (id, entry)
+                for parent in entry.parents:
+                    self.subtrees.setdefault(parent, []).append(("items", id, entry))
+
+    def copy_subtree(
+        self, href: str, parents: tuple[str, ...], manifest: CatalogManifest
+    ) -> bool:
+        """Adds the child at ``href`` below ``parents`` and everything below it to
+        ``manifest``, if they are known. Returns whether they were."""
+        subtree = self.subtrees.get(href)
+        if not subtree or subtree[0][2].href != href:
+            return False
+        if subtree[0][2].parents != parents:
+            return False
+        for kind, id, entry in subtree:
+            getattr(manifest, kind).setdefault(id, []).append(entry)
+        return True
@@ -155,7 +155,7 @@ def _get_removed_extension_migrations() -> (
 
 
 def migrate_to_latest(
-    json_dict: dict[str, Any], info: STACJSONDescription
+    json_dict: dict[str, Any], info: STACJSONDescription, in_place: bool = False
 ) -> dict[str, Any]:
     """Migrates the STAC JSON to the latest version
 
@@ -164,12 +164,15 @@ def migrate_to_latest(
         info : The info from
             :func:`~pystac.serialization.identify_stac_object` that describes
             the STAC object contained in the JSON dict.
+        in_place : If True, ``json_dict`` is migrated and returned instead of a
+            copy of it. Defaults to False.
 
     Returns:
-        dict: A copy of the dict that is migrated to the latest version (the
-        version that is pystac.version.STACVersion.DEFAULT_STAC_VERSION)
+        dict: A copy of the dict (or the dict itself, if ``in_place``) that is
+        migrated to the latest version (the version that is
+        pystac.version.STACVersion.DEFAULT_STAC_VERSION)
     """
-    result = deepcopy(json_dict)
+    result = json_dict if in_place else deepcopy(json_dict)
     version = info.version_range.latest_valid_version()
 
     object_migrations = _get_object_migrations()
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+import gzip
 import json
 import logging
 import os
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import Executor
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import partial
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from typing import TYPE_CHECKING, Any, cast
 from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit, urlunsplit
 from urllib.request import Request, urlopen
 
 import pystac
@@ -39,6 +51,169 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+TEXT_CHUNK_SIZE = 64 * 1024
+"""Number of characters, or bytes for URLs, read at a time by
+:meth:`DefaultStacIO.read_text_chunks`."""
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _json_dumps_line(json_dict: dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(json_dict).decode("utf-8")
+    return json.dumps(json_dict, separators=(",", ":"))
+
+
+def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    parts: list[str] = []
+    for chunk in chunks:
+        start = 0
+        while (end := chunk.find("\n", start)) != -1:
+            parts.append(chunk[start:end])
+            yield "".join(parts).removesuffix("\r")
+            parts = []
+            start = end + 1
+        parts.append(chunk[start:])
+    tail = "".join(parts)
+    if tail:
+        yield tail
+
+
+class _JSONStream:
+    """Incremental reader of JSON values from chunks of text."""
+
+    def __init__(self, chunks: Iterable[str]):
+        self.chunks = iter(chunks)
+        self.text = ""
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def read_more(self, size: int = 1) -> bool:
+        """Reads chunks until at least ``size`` more characters are buffered after
+        the current position. Returns whether anything was read."""
+        parts = [self.text[self.pos :]]
+        target = len(parts[0]) + size
+        buffered = len(parts[0])
+        for chunk in self.chunks:
+            parts.append(chunk)
+            buffered += len(chunk)
+            if buffered >= target:
+                break
+        self.text = "".join(parts)
+        self.pos = 0
+        return len(parts) > 1
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character, or an empty string at
+        the end of the text."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.text) or not self.read_more():
+                return self.text[self.pos : self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self.text, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                # The value may continue in the next chunks. Read at least as much
+                # again as is buffered, so that long values are parsed a bounded
+                # number of times.
+                if not self.read_more(max(len(self.text) - self.pos, 1)):
+                    raise
+                continue
+            # A number may continue in the next chunk
+            if end == len(self.text) and self.read_more():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_json_array(chunks: Iterable[str], key: str) -> Iterator[Any]:
+    """Yields the elements of the array at ``key`` of the JSON object in
+    ``chunks``, one at a time."""
+    stream = _JSONStream(chunks)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        name = stream.value()
+        stream.expect(":")
+        if name == key:
+            stream.expect("[")
+            if stream.peek() == "]":
+                stream.pos += 1
+            else:
+                while True:
+                    yield stream.value()
+                    if stream.peek() == "]":
+                        stream.pos += 1
+                        break
+                    stream.expect(",")
+        else:
+            stream.value()
+        if stream.peek() == "}":
+            return
+        stream.expect(",")
+
+
+def _stac_object_from_dict(
+    d: dict[str, Any],
+    href: HREF | None = None,
+    root: Catalog | None = None,
+    preserve_dict: bool = True,
+    lazy: bool = False,
+) -> STACObject:
+    if preserve_dict:
+        d = deepcopy(d)
+    # ``d`` is now ours to modify, so it is merged and migrated in place and then
+    # parsed without being copied or migrated again.
+    href_str = None if href is None else str(os.fspath(href))
+    if identify_stac_object_type(d) == pystac.STACObjectType.ITEM:
+        collection_cache = None
+        if root is not None:
+            collection_cache = root._resolved_objects.as_collection_cache()
+
+        # Merge common properties in case this is an older STAC object.
+        merge_common_properties(
+            d, json_href=href_str, collection_cache=collection_cache
+        )
+
+    info = identify_stac_object(d)
+    d = migrate_to_latest(d, info, in_place=True)
+
+    result: STACObject
+    if info.object_type == pystac.STACObjectType.CATALOG:
+        result = pystac.Catalog.from_dict(
+            d, href=href_str, root=root, migrate=False, preserve_dict=False
+        )
+    elif info.object_type == pystac.STACObjectType.COLLECTION:
+        result = pystac.Collection.from_dict(
+            d, href=href_str, root=root, migrate=False, preserve_dict=False
+        )
+    elif info.object_type == pystac.STACObjectType.ITEM:
+        result = pystac.Item.from_dict(
+            d,
+            href=href_str,
+            root=root,
+            migrate=False,
+            preserve_dict=False,
+            lazy=lazy,
+        )
+    else:
+        raise ValueError(f"Unknown STAC object type {info.object_type}")
+
+    if href_str is not None:
+        # Read from ``href``, so there is nothing to write back until it changes.
+        result._mark_clean()
+    return result
+
 
 class StacIO(ABC):
     _default_io: Callable[[], StacIO] | None = None
@@ -137,6 +312,7 @@ class StacIO(ABC):
         href: HREF | None = None,
         root: Catalog | None = None,
         preserve_dict: bool = True,
+        lazy: bool = False,
     ) -> STACObject:
         """Deserializes a :class:`~pystac.STACObject` sub-class instance from a
         dictionary.
@@ -152,39 +328,16 @@ class StacIO(ABC):
                 Defaults to ``True``, which results results in a deepcopy of the
                 parameter. Set to ``False`` when possible to avoid the performance
                 hit of a deepcopy.
+            lazy : If True, :class:`~pystac.Item` objects are parsed with
+                ``lazy=True``, see :meth:`Item.from_dict <pystac.Item.from_dict>`.
+                Defaults to False.
         """
-        href_str = None if href is None else str(os.fspath(href))
-        if identify_stac_object_type(d) == pystac.STACObjectType.ITEM:
-            collection_cache = None
-            if root is not None:
-                collection_cache = root._resolved_objects.as_collection_cache()
-
-            # Merge common properties in case this is an older STAC object.
-            merge_common_properties(
-                d, json_href=href_str, collection_cache=collection_cache
-            )
-
-        info = identify_stac_object(d)
-        d = migrate_to_latest(d, info)
-
-        if info.object_type == pystac.STACObjectType.CATALOG:
-            result = pystac.Catalog.from_dict(
-                d, href=href_str, root=root, migrate=True, preserve_dict=preserve_dict
-            )
-            result._stac_io = self
-            return result
-
-        if info.object_type == pystac.STACObjectType.COLLECTION:
-            return pystac.Collection.from_dict(
-                d, href=href_str, root=root, migrate=True, preserve_dict=preserve_dict
-            )
-
-        if info.object_type == pystac.STACObjectType.ITEM:
-            return pystac.Item.from_dict(
-                d, href=href_str, root=root, migrate=True, preserve_dict=preserve_dict
-            )
-
-        raise ValueError(f"Unknown STAC object type {info.object_type}")
+        result = _stac_object_from_dict(
+            d, href=href, root=root, preserve_dict=preserve_dict, lazy=lazy
+        )
+        if result.STAC_OBJECT_TYPE == pystac.STACObjectType.CATALOG:
+            cast(pystac.Catalog, result)._stac_io = self
+        return result
 
     def read_json(self, source: HREF, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """Read a dict from the given source.
@@ -211,6 +364,7 @@ class StacIO(ABC):
         source: HREF,
         root: Catalog | None = None,
         *args: Any,
+        lazy: bool = False,
         **kwargs: Any,
     ) -> STACObject:
         """Read a STACObject from a JSON file at the given source.
@@ -225,6 +379,9 @@ class StacIO(ABC):
                 previously resolved instances of the STAC object.
             *args : Additional positional arguments to be passed to
                 :meth:`StacIO.read_json`.
+            lazy : If True, an :class:`~pystac.Item` is parsed with ``lazy=True``,
+                see :meth:`Item.from_dict <pystac.Item.from_dict>`. Defaults to
+                False.
             **kwargs : Additional keyword arguments to be passed to
                 :meth:`StacIO.read_json`.
 
@@ -234,7 +391,7 @@ class StacIO(ABC):
         """
         d = self.read_json(source, *args, **kwargs)
         return self.stac_object_from_dict(
-            d, href=source, root=root, preserve_dict=False
+            d, href=source, root=root, preserve_dict=False, lazy=lazy
         )
 
     def save_json(
@@ -260,6 +417,78 @@ class StacIO(ABC):
         txt = self.json_dumps(json_dict, *args, **kwargs)
         self.write_text(dest, txt)
 
+    def read_text_chunks(self, source: HREF) -> Iterator[str]:
+        """Reads text from the given source in consecutive chunks.
+
+        Used to stream large files, such as with :meth:`read_ndjson` and
+        :meth:`read_features`. The default implementation yields the whole text
+        returned by :meth:`read_text` as one chunk; sub-classes that can read files
+        incrementally may override it to keep memory use flat.
+
+        Args:
+            source : The source to read from.
+        """
+        yield self.read_text(source)
+
+    def read_text_lines(self, source: HREF) -> Iterator[str]:
+        """Reads the lines of the text at the given source one at a time, without
+        their line endings. Built on :meth:`read_text_chunks`.
+
+        Args:
+            source : The source to read from.
+        """
+        return _iter_lines(self.read_text_chunks(source))
+
+    def write_text_lines(self, dest: HREF, lines: Iterable[str]) -> None:
+        """Writes lines of text, each followed by a newline, to the given
+        destination.
+
+        The default implementation joins the lines and passes them to
+        :meth:`write_text`; sub-classes that can write files incrementally may
+        override it.
+
+        Args:
+            dest : The destination to write to.
+            lines : The lines to write, without line endings.
+        """
+        self.write_text(dest, "".join(f"{line}\n" for line in lines))
+
+    def read_ndjson(self, source: HREF) -> Iterator[dict[str, Any]]:
+        """Reads the dictionaries of a newline-delimited JSON file one at a time.
+        Blank lines are skipped.
+
+        Args:
+            source : The source to read from.
+        """
+        for line in self.read_text_lines(source):
+            if line.strip():
+                yield self.json_loads(line)
+
+    def save_ndjson(self, dest: HREF, json_dicts: Iterable[dict[str, Any]]) -> None:
+        """Writes dictionaries to the given destination as newline-delimited JSON,
+        one compact JSON document per line.
+
+        Args:
+            dest : The destination to write to.
+            json_dicts : The dictionaries to write.
+        """
+        self.write_text_lines(dest, map(_json_dumps_line, json_dicts))
+
+    def read_features(self, source: HREF) -> Iterator[dict[str, Any]]:
+        """Reads the features of a GeoJSON FeatureCollection one at a time.
+
+        The file is parsed incrementally from :meth:`read_text_chunks`, so only the
+        feature being parsed is held in memory. Other top-level fields of the
+        FeatureCollection are skipped.
+
+        Args:
+            source : The source to read from.
+
+        Raises:
+            json.JSONDecodeError: If the file is not a JSON object.
+        """
+        return _iter_json_array(self.read_text_chunks(source), "features")
+
     @classmethod
     def set_default(cls, stac_io_class: Callable[[], StacIO]) -> None:
         """Set the default StacIO instance to use."""
@@ -337,6 +566,250 @@ class DefaultStacIO(StacIO):
         with open(href, "w", encoding="utf-8") as f:
             f.write(txt)
 
+    def _reads_directly(self) -> bool:
+        cls = type(self)
+        return (
+            cls.read_text is DefaultStacIO.read_text
+            and cls.read_text_from_href is DefaultStacIO.read_text_from_href
+        )
+
+    def _writes_directly(self) -> bool:
+        cls = type(self)
+        return (
+            cls.write_text is DefaultStacIO.write_text
+            and cls.write_text_to_href is DefaultStacIO.write_text_to_href
+        )
+
+    def read_text_chunks(self, source: HREF) -> Iterator[str]:
+        """A concrete implementation of :meth:`StacIO.read_text_chunks
+        <pystac.StacIO.read_text_chunks>` that reads local files and URLs
+        incrementally. Sub-classes overriding :meth:`read_text` or
+        :meth:`read_text_from_href` read the whole text through them instead."""
+        if not self._reads_directly():
+            yield from super().read_text_chunks(source)
+            return
+        href = str(os.fspath(source))
+        if _is_url(href):
+            try:
+                logger.debug(f"GET {href} Headers: {self.headers}")
+                req = Request(href, headers=self.headers)
+                with urlopen(req) as f:
+                    decoder = codecs.getincrementaldecoder("utf-8")()
+                    while data := f.read(TEXT_CHUNK_SIZE):
+                        yield decoder.decode(data)
+                    yield decoder.decode(b"", final=True)
+            except HTTPError as e:
+                raise Exception(f"Could not read uri {href}") from e
+        else:
+            href = safe_urlparse(href).path
+            with open(href, encoding="utf-8") as f:
+                while chunk := f.read(TEXT_CHUNK_SIZE):
+                    yield chunk
+
+    def write_text_lines(self, dest: HREF, lines: Iterable[str]) -> None:
+        """A concrete implementation of :meth:`StacIO.write_text_lines
+        <pystac.StacIO.write_text_lines>` that writes local files one line at a
+        time. Sub-classes overriding :meth:`write_text` or
+        :meth:`write_text_to_href` write the whole text through them instead."""
+        href = str(os.fspath(dest))
+        if not self._writes_directly() or _is_url(href):
+            return super().write_text_lines(dest, lines)
+        href = safe_urlparse(href).path
+        dirname = os.path.dirname(href)
+        if dirname != "" and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        with open(href, "w", encoding="utf-8") as f:
+            for line in lines:
+                f.write(line)
+                f.write("\n")
+
+
+@dataclass
+class ConnectionPoolStats:
+    """Counters kept by :class:`PooledStacIO`."""
+
+    requests: int = 0
+    """Number of HTTP requests sent, including failed and retried ones."""
+
+    bytes: int = 0
+    """Number of (possibly compressed) response body bytes received."""
+
+    new_connections: int = 0
+    """Number of connections opened."""
+
+    reused_connections: int = 0
+    """Number of requests sent over a kept-alive connection."""
+
+    retries: int = 0
+    """Number of requests that were retried after a backoff."""
+
+
+class PooledStacIO(DefaultStacIO):
+    """A :class:`DefaultStacIO` that reads ``http(s)`` URLs over persistent
+    connections, using only the standard library.
+
+    Up to ``pool_size`` idle connections are kept alive per scheme, host and port,
+    responses are requested with ``Accept-Encoding: gzip``, and failed requests are
+    retried with exponential backoff. A request that fails on a kept-alive
+    connection, which the server may have closed, is first sent again at once over
+    a new connection. ``headers`` are not sent after a redirect to another scheme,
+    host or port. Counters are available in :attr:`stats`. The instance is
+    thread-safe, so it can be shared by concurrent readers (see the ``prefetch``
+    option of :meth:`Catalog.get_items <pystac.Catalog.get_items>`).
+
+    Args:
+        headers : Headers sent with every request to the server of the URL read.
+        pool_size : Maximum number of idle connections kept per host.
+        retries : Number of times a request is retried after a connection error or
+            a response with a status in ``retry_statuses``.
+        backoff_factor : Retry ``n`` (starting at 1) waits
+            ``backoff_factor * 2 ** (n - 1)`` seconds before being sent.
+        timeout : Optional timeout in seconds for connecting and reading.
+        retry_statuses : HTTP statuses that are retried.
+    """
+
+    def __init__(
+        self,
+        headers: dict[str, str] | None = None,
+        pool_size: int = 10,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float | None = None,
+        retry_statuses: Collection[int] = (429, 500, 502, 503, 504),
+    ):
+        super().__init__(headers)
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.retry_statuses = retry_statuses
+
+        self.stats = ConnectionPoolStats()
+        """Counters of the requests sent by this instance."""
+
+        self._pools: dict[tuple[str, str, int | None], list[HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def read_text_from_href(self, href: str) -> str:
+        """Reads file as a UTF-8 string, using a pooled connection if ``href`` is a
+        URL.
+
+        Args:
+            href : The URI of the file to open.
+        """
+        if _is_url(href):
+            return self._get(href).decode("utf-8")
+        else:
+            return super().read_text_from_href(href)
+
+    def close(self) -> None:
+        """Closes all idle connections."""
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for connections in pools.values():
+            for connection in connections:
+                connection.close()
+
+    def _get(self, href: str) -> bytes:
+        url = href
+        attempt = 0
+        redirects = 0
+        origin = None
+        headers = {"Accept-Encoding": "gzip", **self.headers}
+        fresh = False
+        while True:
+            parsed = urlsplit(url)
+            if parsed.scheme not in ("http", "https") or parsed.hostname is None:
+                raise Exception(f"Could not read uri {href}")
+            key = (parsed.scheme, parsed.hostname, parsed.port)
+            path = urlunsplit(("", "", parsed.path or "/", parsed.query, ""))
+            if origin is None:
+                origin = key
+            elif key != origin:
+                # The headers may hold credentials for the original server only
+                headers = {"Accept-Encoding": "gzip"}
+
+            connection, reused = self._acquire(key, fresh)
+            fresh = False
+            try:
+                logger.debug(f"GET {url} Headers: {headers}")
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, HTTPException) as e:
+                connection.close()
+                self._count(reused, 0)
+                if reused:
+                    fresh = True
+                    continue
+                if attempt >= self.retries:
+                    raise Exception(f"Could not read uri {href}") from e
+                attempt += 1
+                self._backoff(attempt)
+                continue
+
+            self._count(reused, len(data))
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+
+            status = response.status
+            location = response.getheader("Location")
+            if status in (301, 302, 303, 307, 308) and location and redirects < 10:
+                redirects += 1
+                url = urljoin(url, location)
+                continue
+            if status in self.retry_statuses and attempt < self.retries:
+                attempt += 1
+                self._backoff(attempt)
+                continue
+            if status >= 400:
+                raise Exception(f"Could not read uri {href}") from HTTPError(
+                    url, status, response.reason, response.headers, None
+                )
+
+            if response.getheader("Content-Encoding", "").lower() == "gzip":
+                data = gzip.decompress(data)
+            return data
+
+    def _acquire(
+        self, key: tuple[str, str, int | None], fresh: bool = False
+    ) -> tuple[HTTPConnection, bool]:
+        with self._lock:
+            connections = self._pools.get(key)
+            if connections and not fresh:
+                return connections.pop(), True
+            self.stats.new_connections += 1
+        scheme, host, port = key
+        if scheme == "https":
+            return HTTPSConnection(host, port, timeout=self.timeout), False
+        else:
+            return HTTPConnection(host, port, timeout=self.timeout), False
+
+    def _release(
+        self, key: tuple[str, str, int | None], connection: HTTPConnection
+    ) -> None:
+        with self._lock:
+            connections = self._pools.setdefault(key, [])
+            if len(connections) < self.pool_size:
+                connections.append(connection)
+                return
+        connection.close()
+
+    def _count(self, reused: bool, size: int) -> None:
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.bytes += size
+            if reused:
+                self.stats.reused_connections += 1
+
+    def _backoff(self, attempt: int) -> None:
+        with self._lock:
+            self.stats.retries += 1
+        if self.backoff_factor > 0:
+            time.sleep(self.backoff_factor * 2 ** (attempt - 1))
+
 
 class DuplicateKeyReportingMixin(StacIO):
     """A mixin for :class:`pystac.StacIO` implementations that will report
@@ -391,9 +864,225 @@ class DuplicateKeyReportingMixin(StacIO):
         return result
 
 
-if HAS_URLLIB3:
-    from typing import cast
+class AsyncStacIO(ABC):
+    """Asynchronous counterpart of :class:`StacIO`, used by the ``*_async`` methods
+    of :class:`~pystac.Catalog` and :class:`~pystac.Link` to read many STAC objects
+    concurrently from an :mod:`asyncio` event loop.
+
+    Sub-classes implement :meth:`read_text` and :meth:`write_text` as coroutines;
+    (de)serialization of JSON and STAC objects happens synchronously, like in
+    :class:`StacIO`.
+    """
+
+    _default_io: Callable[[], AsyncStacIO] | None = None
+
+    def __init__(self, headers: dict[str, str] | None = None):
+        self.headers = headers or {}
 
+    @abstractmethod
+    async def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+        """Read text from the given URI.
+
+        See :meth:`StacIO.read_text <pystac.StacIO.read_text>`.
+
+        Args:
+            source : The source to read from.
+            *args : Arbitrary positional arguments that may be utilized by the concrete
+                implementation.
+            **kwargs : Arbitrary keyword arguments that may be utilized by the concrete
+                implementation.
+
+        Returns:
+            str: The text contained in the file at the location specified by the uri.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def write_text(
+        self,
+        dest: HREF,
+        txt: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Write the given text to a file at the given URI.
+
+        See :meth:`StacIO.write_text <pystac.StacIO.write_text>`.
+
+        Args:
+            dest : The destination to write to.
+            txt : The text to write.
+        """
+        raise NotImplementedError
+
+    def json_loads(self, txt: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Deserializes a dictionary from a JSON string. See
+        :meth:`StacIO.json_loads <pystac.StacIO.json_loads>`."""
+        result: dict[str, Any]
+        if orjson is not None:
+            result = orjson.loads(txt)
+        else:
+            result = json.loads(txt, *args, **kwargs)
+        return result
+
+    def json_dumps(self, json_dict: dict[str, Any], *args: Any, **kwargs: Any) -> str:
+        """Serializes a dictionary to a JSON string. See
+        :meth:`StacIO.json_dumps <pystac.StacIO.json_dumps>`."""
+        if orjson is not None:
+            return orjson.dumps(json_dict, option=orjson.OPT_INDENT_2, **kwargs).decode(
+                "utf-8"
+            )
+        else:
+            return json.dumps(json_dict, *args, indent=2, **kwargs)
+
+    def stac_object_from_dict(
+        self,
+        d: dict[str, Any],
+        href: HREF | None = None,
+        root: Catalog | None = None,
+        preserve_dict: bool = True,
+        lazy: bool = False,
+    ) -> STACObject:
+        """Deserializes a :class:`~pystac.STACObject` sub-class instance from a
+        dictionary. See :meth:`StacIO.stac_object_from_dict
+        <pystac.StacIO.stac_object_from_dict>`."""
+        result = _stac_object_from_dict(
+            d, href=href, root=root, preserve_dict=preserve_dict, lazy=lazy
+        )
+        if result.STAC_OBJECT_TYPE == pystac.STACObjectType.CATALOG:
+            cast(pystac.Catalog, result)._async_stac_io = self
+        return result
+
+    async def read_json(
+        self, source: HREF, *args: Any, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Read a dict from the given source.
+
+        Args:
+            source : The source from which to read.
+            *args : Additional positional arguments to be passed to
+                :meth:`AsyncStacIO.read_text`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`AsyncStacIO.read_text`.
+
+        Returns:
+            dict: A dict representation of the JSON contained in the file at the
+            given source.
+        """
+        txt = await self.read_text(source, *args, **kwargs)
+        return self.json_loads(txt)
+
+    async def read_stac_object(
+        self,
+        source: HREF,
+        root: Catalog | None = None,
+        *args: Any,
+        lazy: bool = False,
+        **kwargs: Any,
+    ) -> STACObject:
+        """Read a STACObject from a JSON file at the given source.
+
+        Args:
+            source : The source from which to read.
+            root : Optional root of the catalog for this object.
+                If provided, the root's resolved object cache can be used to search for
+                previously resolved instances of the STAC object.
+            *args : Additional positional arguments to be passed to
+                :meth:`AsyncStacIO.read_json`.
+            lazy : If True, an :class:`~pystac.Item` is parsed with ``lazy=True``,
+                see :meth:`Item.from_dict <pystac.Item.from_dict>`. Defaults to
+                False.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`AsyncStacIO.read_json`.
+
+        Returns:
+            STACObject: The deserialized STACObject from the serialized JSON
+            contained in the file at the given uri.
+        """
+        d = await self.read_json(source, *args, **kwargs)
+        return self.stac_object_from_dict(
+            d, href=source, root=root, preserve_dict=False, lazy=lazy
+        )
+
+    async def save_json(
+        self,
+        dest: HREF,
+        json_dict: dict[str, Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Write a dict to the given URI as JSON.
+
+        Args:
+            dest : The destination file to write the text to.
+            json_dict : The JSON dict to write.
+            *args : Additional positional arguments to be passed to
+                :meth:`AsyncStacIO.json_dumps`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`AsyncStacIO.json_dumps`.
+        """
+        txt = self.json_dumps(json_dict, *args, **kwargs)
+        await self.write_text(dest, txt)
+
+    @classmethod
+    def set_default(cls, stac_io_class: Callable[[], AsyncStacIO]) -> None:
+        """Set the default AsyncStacIO instance to use."""
+        cls._default_io = stac_io_class
+
+    @classmethod
+    def default(cls) -> AsyncStacIO:
+        if cls._default_io is None:
+            cls._default_io = DefaultAsyncStacIO
+
+        return cls._default_io()
+
+
+class DefaultAsyncStacIO(AsyncStacIO):
+    """An :class:`AsyncStacIO` that runs the blocking reads and writes of a
+    synchronous :class:`StacIO` in an executor, so that local files and
+    ``http(s)`` URLs can be read concurrently without any extra dependencies.
+
+    Args:
+        headers : Headers used by the default wrapped :class:`DefaultStacIO`.
+        stac_io : The synchronous :class:`StacIO` used to read and write text.
+            Defaults to a :class:`DefaultStacIO` with the given ``headers``.
+        executor : The :class:`~concurrent.futures.Executor` the blocking calls run
+            in. Defaults to the event loop's default executor; pass a larger
+            :class:`~concurrent.futures.ThreadPoolExecutor` to allow more concurrent
+            reads.
+    """
+
+    def __init__(
+        self,
+        headers: dict[str, str] | None = None,
+        stac_io: StacIO | None = None,
+        executor: Executor | None = None,
+    ):
+        super().__init__(headers)
+        self.stac_io = stac_io or DefaultStacIO(headers=self.headers)
+        self.executor = executor
+
+    async def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+        """A concrete implementation of :meth:`AsyncStacIO.read_text
+        <pystac.stac_io.AsyncStacIO.read_text>` that calls ``read_text`` of the
+        wrapped :class:`StacIO` in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(self.stac_io.read_text, source, *args, **kwargs)
+        )
+
+    async def write_text(self, dest: HREF, txt: str, *args: Any, **kwargs: Any) -> None:
+        """A concrete implementation of :meth:`AsyncStacIO.write_text
+        <pystac.stac_io.AsyncStacIO.write_text>` that calls ``write_text`` of the
+        wrapped :class:`StacIO` in the executor."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self.executor,
+            partial(self.stac_io.write_text, dest, txt, *args, **kwargs),
+        )
+
+
+if HAS_URLLIB3:
     from urllib3 import PoolManager
     from urllib3.util import Retry
 
@@ -423,6 +1112,10 @@ if HAS_URLLIB3:
             """The :py:class:`urllib3.util.retry.Retry` to use with all reading network
             requests."""
 
+            self.pool_manager = PoolManager()
+            """The :py:class:`urllib3.PoolManager` whose connections are reused by all
+            reading network requests."""
+
         def read_text_from_href(self, href: str) -> str:
             """Reads file as a UTF-8 string, with retry support.
 
@@ -430,11 +1123,8 @@ if HAS_URLLIB3:
                 href : The URI of the file to open.
             """
             if _is_url(href):
-                # TODO provide a pooled StacIO to enable more efficient network
-                # access (probably named `PooledStacIO`).
-                http = PoolManager()
                 try:
-                    response = http.request(
+                    response = self.pool_manager.request(
                         "GET",
                         href,
                         retries=self.retry,  # type: ignore
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from html import escape
 from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, cast
 
@@ -53,10 +56,63 @@ class STACObject(ABC):
     _allow_parent_to_override_href: bool = True
     """Private attribute for whether parent objects should override on normalization"""
 
+    _dirty: bool = True
+    """Private attribute for whether this object changed since it was last read from
+    or saved to its self HREF"""
+
+    _untracked_attributes: frozenset[str] = frozenset()
+    """Private attribute listing public attributes that are not serialized, so that
+    setting them does not mark the object as dirty"""
+
     def __init__(self, stac_extensions: list[str]) -> None:
         self.links = []
         self.stac_extensions = stac_extensions
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name[0] != "_" and name not in self._untracked_attributes:
+            object.__setattr__(self, "_dirty", True)
+
+    def is_dirty(self) -> bool:
+        """Whether this object may differ from the file at its self HREF.
+
+        Objects are clean after being read from a file (e.g. with :meth:`from_file`
+        or by resolving a link) or written with :meth:`save_object` or
+        :meth:`Catalog.save <pystac.Catalog.save>`, and become dirty when an
+        attribute is set or when they are changed through PySTAC methods, e.g. by
+        adding or removing links or assets, changing the self HREF or setting
+        properties through extensions. Objects created in memory are dirty.
+
+        Setting an attribute of an :class:`~pystac.Asset` marks its owner as
+        dirty. Changes made directly to dictionaries or lists, e.g.
+        ``item.properties["key"] = value`` or ``item.assets["key"] = asset``, or
+        to a :class:`~pystac.Link` are not tracked, since checking for them would
+        slow down every read and write: call :meth:`mark_dirty` after making them.
+
+        Returns:
+            bool: True if this object needs to be written.
+        """
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Marks this object as changed, so that it is written by an incremental
+        :meth:`Catalog.save <pystac.Catalog.save>`. See :meth:`is_dirty`."""
+        self._dirty = True
+
+    def _mark_clean(self) -> None:
+        self._dirty = False
+
+    def _links_to(self, rel: str | pystac.RelType, target: STACObject | None) -> bool:
+        """Returns whether the link of this object with ``rel`` already points to
+        ``target``, or if there is no such link and ``target`` is None."""
+        link = self.get_single_link(rel)
+        if link is None or target is None:
+            return link is None and target is None
+        if link.is_resolved():
+            return link.target is target
+        target_href = target.get_self_href()
+        return target_href is not None and link.get_absolute_href() == target_href
+
     def validate(
         self,
         validator: pystac.validation.stac_validator.STACValidator | None = None,
@@ -87,6 +143,7 @@ class STACObject(ABC):
         """
         link.set_owner(self)
         self.links.append(link)
+        self._dirty = True
 
     def add_links(self, links: list[Link]) -> None:
         """Add links to this object's set of links.
@@ -304,6 +361,9 @@ class STACObject(ABC):
                 HREF based on the current working directory. If this is None
                 the call will clear the self HREF link.
         """
+        prev_href = self.get_self_href()
+        dirty = self._dirty
+
         root_link = self.get_root_link()
         if root_link is not None and root_link.is_resolved():
             cast(pystac.Catalog, root_link.target)._resolved_objects.remove(self)
@@ -315,6 +375,14 @@ class STACObject(ABC):
         if root_link is not None and root_link.is_resolved():
             cast(pystac.Catalog, root_link.target)._resolved_objects.cache(self)
 
+        if self.get_self_href() == prev_href:
+            self._dirty = dirty
+        else:
+            # The parent links to this object with a relative or absolute HREF
+            parent_link = self.get_single_link(pystac.RelType.PARENT)
+            if parent_link is not None and parent_link.is_resolved():
+                cast(STACObject, parent_link.target).mark_dirty()
+
     def get_root(self) -> Catalog | None:
         """Get the :class:`~pystac.Catalog` or :class:`~pystac.Collection` to
         the root for this object. The root is represented by a
@@ -342,6 +410,9 @@ class STACObject(ABC):
             root : The root
                 object to set. Passing in None will clear the root.
         """
+        unchanged = self._links_to(pystac.RelType.ROOT, root)
+        dirty = self._dirty
+
         root_link_index = next(
             iter(
                 [
@@ -370,6 +441,8 @@ class STACObject(ABC):
                 self.add_link(new_root_link)
             root._resolved_objects.cache(self)
 
+        self._dirty = dirty if unchanged else True
+
     def get_parent(self) -> Catalog | None:
         """Get the :class:`~pystac.Catalog` or :class:`~pystac.Collection` to
         the parent for this object. The root is represented by a
@@ -395,15 +468,23 @@ class STACObject(ABC):
                 object to set. Passing in None will clear the parent.
         """
 
+        unchanged = self._links_to(pystac.RelType.PARENT, parent)
+        dirty = self._dirty
+
         self.remove_links(pystac.RelType.PARENT)
         if parent is not None:
             self.add_link(Link.parent(parent))
 
+        self._dirty = dirty if unchanged else True
+
     def get_stac_objects(
         self,
         rel: str | pystac.RelType,
         typ: type[STACObject] | None = None,
         modify_links: Callable[[list[Link]], list[Link]] | None = None,
+        prefetch: int = 0,
+        release: bool = False,
+        lazy: bool = False,
     ) -> Iterable[STACObject]:
         """Gets the :class:`STACObject` instances that are linked to
         by links with their ``rel`` property matching the passed in argument.
@@ -416,6 +497,19 @@ class STACObject(ABC):
             modify_links : A function that modifies the list of links before they are
                 iterated over. For instance, this option can be used to sort the list
                 so that links matching a particular pattern are earlier in the iterator.
+            prefetch : If greater than zero, the JSON of up to this many of the
+                upcoming unresolved links is read concurrently in a thread pool while
+                earlier objects are being consumed. Objects are still deserialized,
+                cached and yielded in link order in the calling thread. Defaults to 0,
+                which reads each object only when it is reached.
+            release : If True, links that were not resolved before are set back to
+                their target HREF once the iteration moves past the object they
+                point to, and the object is dropped from the root's resolved object
+                cache, so that it can be garbage collected. Changes made to released
+                objects are not kept by this object. Defaults to False.
+            lazy : If True, :class:`~pystac.Item` objects that are read are parsed
+                with ``lazy=True``, see :meth:`Item.from_dict
+                <pystac.Item.from_dict>`. Defaults to False.
 
         Returns:
             Iterable[STACObject]: A possibly empty iterable of STACObjects that are
@@ -426,12 +520,28 @@ class STACObject(ABC):
         if modify_links:
             links = modify_links(links)
 
-        for i in range(0, len(links)):
-            link = links[i]
-            if link.rel == rel:
-                link.resolve_stac_object(root=self.get_root())
-                if typ is None or isinstance(link.target, typ):
-                    yield cast(STACObject, link.target)
+        prefetcher = None
+        if prefetch > 0:
+            prefetcher = _LinkPrefetcher(
+                links, rel, self.get_root(), prefetch, lazy=lazy
+            )
+
+        try:
+            for i in range(0, len(links)):
+                link = links[i]
+                if link.rel == rel:
+                    was_resolved = link.is_resolved()
+                    if prefetcher is not None:
+                        prefetcher.resolve(i)
+                    root = self.get_root()
+                    link.resolve_stac_object(root=root, lazy=lazy)
+                    if typ is None or isinstance(link.target, typ):
+                        yield cast(STACObject, link.target)
+                    if release and not was_resolved:
+                        link._release_target(root)
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
 
     def save_object(
         self,
@@ -459,6 +569,15 @@ class STACObject(ABC):
             section of the STAC best practices document
             <best-practices.md#use-of-links>`
         """
+        dest_href, stac_io = self._get_save_target(dest_href, stac_io)
+        stac_io.save_json(dest_href, self.to_dict(include_self_link=include_self_link))
+        if dest_href == self.get_self_href():
+            self._mark_clean()
+
+    def _get_save_target(
+        self, dest_href: str | None, stac_io: pystac.StacIO | None
+    ) -> tuple[str, pystac.StacIO]:
+        """Determines the HREF and StacIO that :meth:`save_object` writes with."""
         if stac_io is None:
             root = self.get_root()
             if root is not None:
@@ -477,7 +596,7 @@ class STACObject(ABC):
                 )
             dest_href = self_href
 
-        stac_io.save_json(dest_href, self.to_dict(include_self_link=include_self_link))
+        return dest_href, stac_io
 
     def full_copy(
         self,
@@ -630,6 +749,12 @@ class STACObject(ABC):
             href = make_absolute_href(href)
 
         d = stac_io.read_json(href)
+        return cls._from_file_dict(d, href)
+
+    @classmethod
+    def _from_file_dict(cls: type[S], d: dict[str, Any], href: str) -> S:
+        """Builds the object :meth:`from_file` returns from the dict read from the
+        absolute ``href``."""
         o = cls.from_dict(d, href=href, migrate=True, preserve_dict=False)
 
         # If this is a root catalog, set the root to the catalog instance.
@@ -638,6 +763,7 @@ class STACObject(ABC):
             if not root_link.is_resolved():
                 if root_link.get_absolute_href() == href:
                     o.set_root(cast(pystac.Catalog, o))
+        o._mark_clean()
         return o
 
     @classmethod
@@ -683,3 +809,127 @@ class STACObject(ABC):
             d : A dictionary to identify
         """
         raise NotImplementedError
+
+
+class _SharedExecutor:
+    """A thread pool shared by the :class:`_LinkPrefetcher` instances that are open
+    at the same time.
+
+    Traversals such as a recursive :meth:`Catalog.get_items
+    <pystac.Catalog.get_items>` or :meth:`Catalog.walk <pystac.Catalog.walk>`
+    :meth:`hold` the pool while they run, so that the prefetchers of all their
+    catalogs use the same pool. It is created with as many threads as the first
+    user prefetches links, and shut down once the last user releases it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._users = 0
+
+    def acquire(self, max_workers: int) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max_workers)
+            self._users += 1
+            return self._executor
+
+    @contextmanager
+    def hold(self, max_workers: int) -> Iterator[None]:
+        """Keeps the pool alive while in the context. Does nothing if
+        ``max_workers`` is not positive."""
+        if max_workers <= 0:
+            yield
+            return
+        self.acquire(max_workers)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            if self._users > 0 or self._executor is None:
+                return
+            executor, self._executor = self._executor, None
+        executor.shutdown(wait=False)
+
+
+_prefetch_executor = _SharedExecutor()
+
+
+class _LinkPrefetcher:
+    """Reads the targets of upcoming unresolved links in a thread pool, for
+    :meth:`STACObject.get_stac_objects`.
+
+    The targets are read with :meth:`StacIO.read_stac_object
+    <pystac.StacIO.read_stac_object>` without a root, so that the pool does not
+    touch the (not thread-safe) object graph; setting their HREF and root and
+    caching them happens in :meth:`resolve`, in link order.
+    """
+
+    def __init__(
+        self,
+        links: list[Link],
+        rel: str | pystac.RelType,
+        root: Catalog | None,
+        size: int,
+        lazy: bool = False,
+    ) -> None:
+        self.links = links
+        self.rel = rel
+        self.root = root
+        self.size = size
+        self.lazy = lazy
+        self.executor = _prefetch_executor.acquire(size)
+        self.pending: dict[int, tuple[Future[STACObject], str]] = {}
+        self.next_index = 0
+
+    def resolve(self, index: int) -> None:
+        """Resolves ``links[index]`` from its prefetched target, if it was
+        prefetched, and starts reading the following links."""
+        self.next_index = max(self.next_index, index)
+        self._submit()
+        entry = self.pending.pop(index, None)
+        self._submit()
+        if entry is None:
+            return
+        future, target_href = entry
+        link = self.links[index]
+        if link.is_resolved():
+            return
+        try:
+            obj = future.result()
+        except Exception:
+            # Let the regular resolution raise the error.
+            return
+        link._resolve_from_object(obj, target_href, self.root)
+
+    def close(self) -> None:
+        for future, _ in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        _prefetch_executor.release()
+
+    def _submit(self) -> None:
+        while len(self.pending) < self.size and self.next_index < len(self.links):
+            index = self.next_index
+            self.next_index += 1
+            link = self.links[index]
+            if link.rel != self.rel or link.is_resolved():
+                continue
+            try:
+                target_href = link._get_absolute_target_href()
+            except STACError:
+                continue
+            if (
+                self.root is not None
+                and self.root._resolved_objects._peek(target_href) is not None
+            ):
+                continue
+            stac_io = link._get_stac_io(self.root)
+            future = self.executor.submit(
+                stac_io.read_stac_object, target_href, lazy=self.lazy
+            )
+            self.pending[index] = (future, target_href)
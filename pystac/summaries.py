@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.resources
 import json
+import math
 import numbers
 from abc import abstractmethod
 from collections.abc import Iterable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from copy import deepcopy
 from enum import Enum
 from functools import lru_cache
@@ -14,13 +17,14 @@ from typing import (
     Generic,
     Protocol,
     TypeVar,
+    cast,
 )
 
 import pystac
 from pystac.utils import get_required
 
 if TYPE_CHECKING:
-    from pystac.collection import Collection
+    from pystac.catalog import Catalog
     from pystac.item import Item
 
 
@@ -70,6 +74,8 @@ class RangeSummary(Generic[T]):
     minimum: T
     maximum: T
 
+    __slots__ = ("minimum", "maximum")
+
     def __init__(self, minimum: T, maximum: T):
         self.minimum = minimum
         self.maximum = maximum
@@ -119,6 +125,220 @@ class SummaryStrategy(Enum):
     DEFAULT = True
 
 
+DEFAULT_MAXCOUNT = 25
+
+
+class HyperLogLog:
+    """Estimates the number of distinct values added to it, using a fixed amount of
+    memory.
+
+    Values are hashed from their JSON representation, so estimates computed in
+    different processes can be combined with :meth:`merge`. The relative error of
+    the estimate is about ``1.04 / sqrt(2 ** precision)``, 1.6% with the default
+    precision.
+
+    Args:
+        precision : Number of bits of the hashes used to select a register, between
+            4 and 16. Uses ``2 ** precision`` bytes of memory.
+    """
+
+    precision: int
+    registers: bytearray
+
+    def __init__(self, precision: int = 12):
+        if not 4 <= precision <= 16:
+            raise ValueError(f"precision must be between 4 and 16, got {precision}")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: Any) -> None:
+        """Adds a JSON-serializable value."""
+        data = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+        h = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+        bits = 64 - self.precision
+        index = h >> bits
+        rank = bits - (h & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: HyperLogLog) -> None:
+        """Adds the values added to ``other``.
+
+        Raises:
+            ValueError: If ``other`` has a different precision.
+        """
+        if other.precision != self.precision:
+            raise ValueError(
+                "Cannot merge HyperLogLogs of precision "
+                f"{self.precision} and {other.precision}"
+            )
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> int:
+        """Returns the estimated number of distinct values added."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+
+class SummaryAccumulator:
+    """Partial summaries of items, which can be combined with :meth:`merge`.
+
+    Accumulators are created by :meth:`Summarizer.accumulate`, for example by
+    workers each summarizing part of the items, and turned into
+    :class:`Summaries` with :meth:`to_summaries`. They can be pickled.
+
+    The distinct values of each field are kept in a dictionary. If
+    ``max_distinct`` is set, a field with more distinct values is instead counted
+    with a :class:`HyperLogLog`, and left out of the summaries.
+
+    Args:
+        summaryfields : The fields to summarize, with their strategy.
+        max_distinct : Optional maximum number of distinct values kept per field.
+    """
+
+    summaryfields: dict[str, SummaryStrategy]
+    max_distinct: int | None
+
+    ranges: dict[str, RangeSummary[Any]]
+    """Ranges of the fields summarized as ranges."""
+
+    values: dict[str, dict[Any, Any]]
+    """Distinct values of the fields summarized as lists, in the order they were
+    first added, keyed by a hashable version of each value."""
+
+    sketches: dict[str, HyperLogLog]
+    """Distinct value counters of the fields with more than :attr:`max_distinct`
+    distinct values."""
+
+    def __init__(
+        self,
+        summaryfields: dict[str, SummaryStrategy],
+        max_distinct: int | None = None,
+    ):
+        self.summaryfields = summaryfields
+        self.max_distinct = max_distinct
+        self.ranges = {}
+        self.values = {}
+        self.sketches = {}
+
+    def add_item(self, item: Item) -> None:
+        """Adds the properties of ``item``."""
+        for k, v in item.properties.items():
+            strategy = self.summaryfields.get(k)
+            if strategy is None:
+                continue
+            if strategy == SummaryStrategy.RANGE or (
+                strategy == SummaryStrategy.DEFAULT
+                and isinstance(v, numbers.Number)
+                and not isinstance(v, bool)
+            ):
+                rangesummary = self.ranges.get(k)
+                if rangesummary is None:
+                    self.ranges[k] = RangeSummary(v, v)
+                else:
+                    rangesummary.update_with_value(v)
+            elif strategy == SummaryStrategy.ARRAY or (
+                strategy == SummaryStrategy.DEFAULT and isinstance(v, list)
+            ):
+                if k not in self.values and k not in self.sketches:
+                    self.values[k] = {}
+                for element in v if isinstance(v, list) else [v]:
+                    self._add_value(k, element)
+            else:
+                self._add_value(k, v)
+
+    def update(self, items: Iterable[Item]) -> SummaryAccumulator:
+        """Adds all ``items`` and returns this accumulator."""
+        for item in items:
+            self.add_item(item)
+        return self
+
+    def _add_value(self, k: str, v: Any) -> None:
+        sketch = self.sketches.get(k)
+        if sketch is not None:
+            sketch.add(v)
+            return
+        values = self.values.get(k)
+        if values is None:
+            values = self.values[k] = {}
+        key = _hashable(v)
+        if key not in values:
+            values[key] = v
+            if self.max_distinct is not None and len(values) > self.max_distinct:
+                self._to_sketch(k)
+
+    def _to_sketch(self, k: str) -> HyperLogLog:
+        sketch = HyperLogLog()
+        for v in self.values.pop(k, {}).values():
+            sketch.add(v)
+        self.sketches[k] = sketch
+        return sketch
+
+    def merge(self, other: SummaryAccumulator) -> SummaryAccumulator:
+        """Adds the items added to ``other``, and returns this accumulator. Values
+        first added to this accumulator come first in the summaries."""
+        for k, rangesummary in other.ranges.items():
+            mine = self.ranges.get(k)
+            if mine is None:
+                self.ranges[k] = RangeSummary(
+                    rangesummary.minimum, rangesummary.maximum
+                )
+            else:
+                mine.update_with_value(rangesummary.minimum)
+                mine.update_with_value(rangesummary.maximum)
+        for k, values in other.values.items():
+            if k not in self.values and k not in self.sketches:
+                self.values[k] = {}
+            for v in values.values():
+                self._add_value(k, v)
+        for k, sketch in other.sketches.items():
+            mine_sketch = self.sketches.get(k) or self._to_sketch(k)
+            mine_sketch.merge(sketch)
+        return self
+
+    def cardinality(self, k: str) -> int | None:
+        """Returns the number of distinct values of the field ``k``, estimated if it
+        has more than :attr:`max_distinct`, or None if it is not summarized as a
+        list."""
+        if k in self.sketches:
+            return self.sketches[k].estimate()
+        if k in self.values:
+            return len(self.values[k])
+        return None
+
+    def to_summaries(self, maxcount: int = DEFAULT_MAXCOUNT) -> Summaries:
+        """Returns the :class:`Summaries` of the items added."""
+        summaries = Summaries({}, maxcount=maxcount)
+        for k, values in self.values.items():
+            summaries.add(k, list(values.values()))
+        for k, rangesummary in self.ranges.items():
+            summaries.add(k, RangeSummary(rangesummary.minimum, rangesummary.maximum))
+        return summaries
+
+
+def _hashable(v: Any) -> Any:
+    try:
+        hash(v)
+    except TypeError:
+        return _freeze(v)
+    return v
+
+
+def _freeze(v: Any) -> Any:
+    # Hashable versions of lists and dicts that compare like the originals
+    if isinstance(v, dict):
+        return frozenset((k, _freeze(x)) for k, x in v.items())
+    if isinstance(v, list):
+        return tuple(_freeze(x) for x in v)
+    return v
+
+
 class Summarizer:
     """The Summarizer computes summaries from values, following the definition of fields
     to summarize.
@@ -142,16 +362,28 @@ class Summarizer:
             Alternatively, a dict with the field names as keys and SummaryStrategys
             as values.
             If nothing is passed, a default file with field descriptions will be used.
+        max_distinct: Optional maximum number of distinct values kept for a field
+            summarized as a list. Fields with more are only counted, with a
+            :class:`HyperLogLog`, and left out of the summaries. Since
+            :meth:`Summaries.to_dict` leaves out lists of :attr:`Summaries.maxcount`
+            values or more, a ``max_distinct`` of at least that does not change the
+            serialized summaries.
     """
 
     summaryfields: dict[str, SummaryStrategy]
+    max_distinct: int | None
 
-    def __init__(self, fields: str | dict[str, SummaryStrategy] | None = None):
+    def __init__(
+        self,
+        fields: str | dict[str, SummaryStrategy] | None = None,
+        max_distinct: int | None = None,
+    ):
         if isinstance(fields, dict):
             self._set_field_definitions(fields)
         else:
             jsonfields = _get_fields_json(fields)
             self._set_field_definitions(jsonfields["metadata"])
+        self.max_distinct = max_distinct
 
     def _set_field_definitions(self, fields: dict[str, Any]) -> None:
         self.summaryfields = {}
@@ -169,50 +401,92 @@ class Summarizer:
             if strategy != SummaryStrategy.DONT_SUMMARIZE:
                 self.summaryfields[name] = strategy
 
-    def _update_with_item(self, summaries: Summaries, item: Item) -> None:
-        for k, v in item.properties.items():
-            if k in self.summaryfields:
-                strategy = self.summaryfields[k]
-                if strategy == SummaryStrategy.RANGE or (
-                    strategy == SummaryStrategy.DEFAULT
-                    and isinstance(v, numbers.Number)
-                    and not isinstance(v, bool)
-                ):
-                    rangesummary: RangeSummary[Any] | None = summaries.get_range(k)
-                    if rangesummary is None:
-                        summaries.add(k, RangeSummary(v, v))
-                    else:
-                        rangesummary.update_with_value(v)
-                elif strategy == SummaryStrategy.ARRAY or (
-                    strategy == SummaryStrategy.DEFAULT and isinstance(v, list)
-                ):
-                    listsummary: list[Any] = summaries.get_list(k) or []
-                    if not isinstance(v, list):
-                        v = [v]
-                    for element in v:
-                        if element not in listsummary:
-                            listsummary.append(element)
-                    summaries.add(k, listsummary)
-                else:
-                    summary: list[Any] = summaries.get_list(k) or []
-                    if v not in summary:
-                        summary.append(v)
-                    summaries.add(k, summary)
-
-    def summarize(self, source: Collection | Iterable[Item]) -> Summaries:
-        """Creates summaries from items"""
-        summaries = Summaries.empty()
-        if isinstance(source, pystac.Collection):
-            for item in source.get_items(recursive=True):
-                self._update_with_item(summaries, item)
-        else:
-            for item in source:
-                self._update_with_item(summaries, item)
+    def accumulate(
+        self,
+        source: Catalog | Iterable[Item],
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+    ) -> SummaryAccumulator:
+        """Summarizes items into a :class:`SummaryAccumulator`, which can be merged
+        with the accumulators of other items.
+
+        See :meth:`summarize` for the arguments.
+        """
+        if not isinstance(source, pystac.Catalog):
+            return self._accumulator().update(source)
+        if max_workers is None and executor is None:
+            return self._accumulator().update(source.get_items(recursive=True))
+
+        own_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            accumulator = self._accumulator()
+            for part in self._fan_out(source, executor):
+                accumulator.merge(part.result() if isinstance(part, Future) else part)
+            return accumulator
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+    def _accumulator(self) -> SummaryAccumulator:
+        return SummaryAccumulator(self.summaryfields, self.max_distinct)
+
+    def _fan_out(
+        self, catalog: Catalog, executor: Executor
+    ) -> list[SummaryAccumulator | Future[SummaryAccumulator]]:
+        """Summarizes the items of ``catalog`` and of the children already read, and
+        submits the children not read yet to ``executor``, in the order of
+        :meth:`Catalog.get_items <pystac.Catalog.get_items>`."""
+        parts: list[SummaryAccumulator | Future[SummaryAccumulator]] = [
+            self._accumulator().update(catalog.get_items())
+        ]
+        root = catalog.get_root()
+        for link in catalog.get_links(pystac.RelType.CHILD):
+            href = link.get_absolute_href()
+            if not link.is_resolved() and href is not None:
+                stac_io = link._get_stac_io(root)
+                parts.append(executor.submit(_accumulate_file, self, href, stac_io))
+            else:
+                link.resolve_stac_object(root=root)
+                parts.extend(self._fan_out(cast(pystac.Catalog, link.target), executor))
+        return parts
 
-        return summaries
+    def summarize(
+        self,
+        source: Catalog | Iterable[Item],
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+    ) -> Summaries:
+        """Creates summaries from items.
+
+        If ``source`` is a collection or catalog, all of its items are summarized.
+        If ``max_workers`` or ``executor`` is given, each child catalog that has not
+        been read yet is read and summarized separately in the executor, and the
+        partial summaries are merged in order, giving the same summaries as without
+        workers. Children that were already read are summarized in the calling
+        thread, so that changes made to them are included.
+
+        Args:
+            source : The items, or a catalog or collection whose items to summarize.
+            max_workers : Number of children that may be summarized concurrently.
+                If ``executor`` is not provided, a
+                :class:`~concurrent.futures.ThreadPoolExecutor` with this many
+                workers is used.
+            executor : Optional :class:`~concurrent.futures.Executor`, such as a
+                :class:`~concurrent.futures.ProcessPoolExecutor`, used to summarize
+                the children. The summarizer and the :class:`~pystac.StacIO` of the
+                catalog are passed to it, and must then be picklable. The executor is
+                not shut down.
+        """
+        return self.accumulate(source, max_workers, executor).to_summaries()
 
 
-DEFAULT_MAXCOUNT = 25
+def _accumulate_file(
+    summarizer: Summarizer, href: str, stac_io: pystac.StacIO
+) -> SummaryAccumulator:
+    catalog = cast(pystac.Catalog, stac_io.read_stac_object(href))
+    return summarizer._accumulator().update(catalog.get_items(recursive=True))
 
 
 class Summaries:
@@ -6,6 +6,7 @@ import warnings
 from collections.abc import Callable
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
     TypeAlias,
@@ -22,6 +23,36 @@ from pystac.errors import RequiredPropertyMissing
 #: HREF string or path-like object.
 HREF: TypeAlias = str | os.PathLike[str]
 
+#: Number of results kept by each of the caches of :func:`safe_urlparse`,
+#: :func:`make_relative_href`, :func:`make_absolute_href`,
+#: :func:`is_absolute_href` and :func:`is_file_path`.
+HREF_CACHE_SIZE = 2**16
+
+
+def _getcwd() -> str | None:
+    # Relative file paths are resolved against the working directory, which is
+    # part of the cache keys of the HREF functions.
+    try:
+        return os.getcwd()
+    except OSError:
+        return None
+
+
+def clear_href_caches() -> None:
+    """Clears the caches of :func:`safe_urlparse`, :func:`make_relative_href`,
+    :func:`make_absolute_href`, :func:`is_absolute_href` and
+    :func:`is_file_path`."""
+    for cached in (
+        _safe_urlparse,
+        _make_relative_href,
+        _make_absolute_href,
+        _is_absolute_href,
+        _is_file_path,
+        _posix_abspath,
+        _split_abspath,
+    ):
+        cached.cache_clear()
+
 
 def make_posix_style(href: HREF) -> str:
     """Converts double back slashes and single back slashes to single forward
@@ -51,6 +82,19 @@ def safe_urlparse(href: str) -> URLParseResult:
     Returns:
         urllib.parse.ParseResult : The named tuple representing the parsed HREF.
     """
+    return _safe_urlparse(href)
+
+
+@lru_cache(maxsize=HREF_CACHE_SIZE)
+def _safe_urlparse(href: str) -> URLParseResult:
+    if (
+        href[:1] == "/"
+        and href[1:2] != "/"
+        and href.isprintable()
+        and not any(c in href for c in "?#;")
+    ):
+        # An absolute POSIX path, which urlparse would return as is in ``path``
+        return URLParseResult("", "", href, "", "", "")
     parsed = urlparse(href)
     if parsed.scheme != "" and (
         href.lower().startswith(f"{parsed.scheme}:\\")
@@ -207,10 +251,37 @@ def _make_relative_href_url(
     return rel_url
 
 
+@lru_cache(maxsize=HREF_CACHE_SIZE)
+def _posix_abspath(path: str, cwd: str | None) -> str:
+    return make_posix_style(os.path.abspath(path))
+
+
+@lru_cache(maxsize=HREF_CACHE_SIZE)
+def _split_abspath(path: str, cwd: str | None) -> tuple[str, ...]:
+    return tuple(part for part in os.path.abspath(path).split(os.sep) if part)
+
+
+def _relpath(path: str, start: str, cwd: str | None) -> str:
+    # os.path.relpath, reusing the components of paths seen before, such as the
+    # directory of a catalog all of whose children are made relative to it.
+    if os.name == "nt" or not path:
+        return os.path.relpath(path, start)
+    path_parts = _split_abspath(path, cwd)
+    start_parts = _split_abspath(start, cwd)
+    common = 0
+    for path_part, start_part in zip(path_parts, start_parts):
+        if path_part != start_part:
+            break
+        common += 1
+    parts = [os.pardir] * (len(start_parts) - common) + list(path_parts[common:])
+    return os.path.join(*parts) if parts else os.curdir
+
+
 def _make_relative_href_path(
     parsed_source: URLParseResult,
     parsed_start: URLParseResult,
     start_is_dir: bool = False,
+    cwd: str | None = None,
 ) -> str:
     # If the start path is not a directory, get the parent directory
     start_dir = (
@@ -224,7 +295,7 @@ def _make_relative_href_path(
     # posixpath doesn't play well with windows drive letters, so we have to use
     # the os-specific path library for the relpath function. This means we can
     # only handle windows paths on windows machines.
-    relpath = make_posix_style(os.path.relpath(source_path, start_dir))
+    relpath = make_posix_style(_relpath(source_path, start_dir, cwd or _getcwd()))
 
     # Ensure we retain a trailing slash from the original source path
     if parsed_source.path.endswith("/"):
@@ -255,11 +326,18 @@ def make_relative_href(
     Returns:
         str: The relative HREF.
     """
+    return _make_relative_href(source_href, start_href, start_is_dir, _getcwd())
+
+
+@lru_cache(maxsize=HREF_CACHE_SIZE)
+def _make_relative_href(
+    source_href: str, start_href: str, start_is_dir: bool, cwd: str | None
+) -> str:
     source_href = make_posix_style(source_href)
     start_href = make_posix_style(start_href)
 
-    parsed_source = safe_urlparse(source_href)
-    parsed_start = safe_urlparse(start_href)
+    parsed_source = _safe_urlparse(source_href)
+    parsed_start = _safe_urlparse(start_href)
     if not (
         parsed_source.scheme == parsed_start.scheme
         and parsed_source.netloc == parsed_start.netloc
@@ -267,7 +345,7 @@ def make_relative_href(
         return source_href
 
     if parsed_start.scheme in ["", "file"]:
-        return _make_relative_href_path(parsed_source, parsed_start, start_is_dir)
+        return _make_relative_href_path(parsed_source, parsed_start, start_is_dir, cwd)
     else:
         return _make_relative_href_url(parsed_source, parsed_start, start_is_dir)
 
@@ -308,6 +386,7 @@ def _make_absolute_href_path(
     parsed_source: URLParseResult,
     parsed_start: URLParseResult,
     start_is_dir: bool = False,
+    cwd: str | None = None,
 ) -> str:
     # If the source is already absolute, just return it
     if os.path.isabs(parsed_source.path):
@@ -326,10 +405,9 @@ def _make_absolute_href_path(
     # Account for the normalization of abspath for
     # things like /vsitar// prefixes by replacing the
     # original start_dir text when abspath modifies the start_dir.
-    if not start_dir == make_posix_style(os.path.abspath(start_dir)):
-        abs_path = abs_path.replace(
-            make_posix_style(os.path.abspath(start_dir)), start_dir
-        )
+    abs_start_dir = _posix_abspath(start_dir, cwd or _getcwd())
+    if not start_dir == abs_start_dir:
+        abs_path = abs_path.replace(abs_start_dir, start_dir)
 
     if parsed_source.scheme or parsed_start.scheme:
         abs_path = f"file://{abs_path}"
@@ -362,12 +440,18 @@ def make_absolute_href(
     if start_href is None:
         start_href = os.getcwd()
         start_is_dir = True
+    return _make_absolute_href(source_href, start_href, start_is_dir, _getcwd())
+
 
+@lru_cache(maxsize=HREF_CACHE_SIZE)
+def _make_absolute_href(
+    source_href: str, start_href: str, start_is_dir: bool, cwd: str | None
+) -> str:
     source_href = make_posix_style(source_href)
     start_href = make_posix_style(start_href)
 
-    parsed_start = safe_urlparse(start_href)
-    parsed_source = safe_urlparse(source_href)
+    parsed_start = _safe_urlparse(start_href)
+    parsed_source = _safe_urlparse(source_href)
 
     if parsed_source.scheme not in ["", "file"] or parsed_start.scheme not in [
         "",
@@ -375,7 +459,7 @@ def make_absolute_href(
     ]:
         return _make_absolute_href_url(parsed_source, parsed_start, start_is_dir)
     else:
-        return _make_absolute_href_path(parsed_source, parsed_start, start_is_dir)
+        return _make_absolute_href_path(parsed_source, parsed_start, start_is_dir, cwd)
 
 
 def is_absolute_href(href: str) -> bool:
@@ -389,7 +473,12 @@ def is_absolute_href(href: str) -> bool:
     Returns:
         bool: ``True`` if the given HREF is absolute, ``False`` if it is relative.
     """
-    parsed = safe_urlparse(href)
+    return _is_absolute_href(href)
+
+
+@lru_cache(maxsize=HREF_CACHE_SIZE)
+def _is_absolute_href(href: str) -> bool:
+    parsed = _safe_urlparse(href)
     return parsed.scheme not in ["", "file"] or os.path.isabs(parsed.path)
 
 
@@ -604,6 +693,11 @@ def is_file_path(href: str) -> bool:
         bool: ``True`` if the given HREF resembles a file path,
             ``False`` if it does not.
     """
+    return _is_file_path(href)
+
+
+@lru_cache(maxsize=HREF_CACHE_SIZE)
+def _is_file_path(href: str) -> bool:
     parsed = urlparse(href)
     return bool(os.path.splitext(parsed.path)[1])
 
@@ -150,6 +150,9 @@ class JsonSchemaSTACValidator(STACValidator):
     schema_uri_map: SchemaUriMap
     schema_cache: dict[str, dict[str, Any]]
 
+    _registry: tuple[int, Any] | None
+    _validators: dict[str, Any]
+
     def __init__(self, schema_uri_map: SchemaUriMap | None = None) -> None:
         if not HAS_JSONSCHEMA:
             raise ImportError("Cannot instantiate, requires jsonschema package")
@@ -160,6 +163,8 @@ class JsonSchemaSTACValidator(STACValidator):
             self.schema_uri_map = DefaultSchemaUriMap()
 
         self.schema_cache = get_local_schema_cache()
+        self._registry = None
+        self._validators = {}
 
     def _get_schema(self, schema_uri: str) -> dict[str, Any]:
         if schema_uri not in self.schema_cache:
@@ -175,12 +180,34 @@ class JsonSchemaSTACValidator(STACValidator):
 
     @property
     def registry(self) -> Any:
+        """The :class:`referencing.Registry` of the schemas in :attr:`schema_cache`,
+        which retrieves other schemas when they are referenced. It is built again
+        only when schemas are added to the cache."""
+        if self._registry is not None and self._registry[0] == len(self.schema_cache):
+            return self._registry[1]
+
         def retrieve(schema_uri: str) -> Resource[dict[str, Any]]:
             return Resource.from_contents(self._get_schema(schema_uri))
 
-        return Registry(retrieve=retrieve).with_resources(  # type: ignore
+        registry = Registry(retrieve=retrieve).with_resources(  # type: ignore
             [(k, Resource.from_contents(v)) for k, v in self.schema_cache.items()]  # type: ignore
         )
+        self._registry = (len(self.schema_cache), registry)
+        return registry
+
+    def _get_validator(self, schema_uri: str) -> Any:
+        """Returns the validator of the schema at ``schema_uri``, which is checked
+        and compiled on first use and then kept."""
+        validator = self._validators.get(schema_uri)
+        if validator is None:
+            schema = self._get_schema(schema_uri)
+            # This block is cribbed (w/ change in error handling) from
+            # jsonschema.validate
+            cls = jsonschema.validators.validator_for(schema)
+            cls.check_schema(schema)
+            validator = cls(schema, registry=self.registry)
+            self._validators[schema_uri] = validator
+        return validator
 
     def get_schema_from_uri(self, schema_uri: str) -> tuple[dict[str, Any], Any]:
         """DEPRECATED"""
@@ -198,12 +225,7 @@ class JsonSchemaSTACValidator(STACValidator):
         href: str | None = None,
     ) -> None:
         try:
-            schema = self._get_schema(schema_uri)
-            # This block is cribbed (w/ change in error handling) from
-            # jsonschema.validate
-            cls = jsonschema.validators.validator_for(schema)
-            cls.check_schema(schema)
-            validator = cls(schema, registry=self.registry)
+            validator = self._get_validator(schema_uri)
             errors = list(validator.iter_errors(stac_dict))
         except Exception as e:
             logger.error(f"Exception while validating {stac_object_type} href: {href}")
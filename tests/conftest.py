@@ -9,7 +9,17 @@ from typing import Any
 
 import pytest
 
-from pystac import Asset, Catalog, Collection, Item, ItemCollection, Link
+from pystac import (
+    Asset,
+    Catalog,
+    Collection,
+    Extent,
+    Item,
+    ItemCollection,
+    Link,
+    SpatialExtent,
+    TemporalExtent,
+)
 
 from .utils import ARBITRARY_BBOX, ARBITRARY_EXTENT, ARBITRARY_GEOM, TestCases
 
@@ -56,6 +66,49 @@ def test_case_1_catalog() -> Catalog:
     return TestCases.case_1()
 
 
+def grid_item(
+    id: str, west: float, south: float, dt: datetime, size: float = 1
+) -> Item:
+    """An item covering the square with lower-left corner (west, south)."""
+    east, north = west + size, south + size
+    geometry = {
+        "type": "Polygon",
+        "coordinates": [
+            [[west, south], [east, south], [east, north], [west, north], [west, south]]
+        ],
+    }
+    return Item(id, geometry, [west, south, east, north], dt, {})
+
+
+@pytest.fixture
+def grid_catalog() -> Catalog:
+    """A catalog with a collection of 1 degree items on each side of the prime
+    meridian, 5 by 5 between -5 and 0 and between 0 and 5.
+
+    The items of row ``y`` of the west collection are from January ``y + 1``, 2019,
+    and the items of the east collection cover January ``y + 1`` to ``y + 2``,
+    2020."""
+    catalog = Catalog("grid", "A grid of items")
+    for name, x0, year in (("west", -5, 2019), ("east", 0, 2020)):
+        collection = Collection(
+            name,
+            f"The {name} half of the grid",
+            Extent(
+                SpatialExtent([[x0, 0, x0 + 5, 5]]),
+                TemporalExtent([[datetime(year, 1, 1), datetime(year, 1, 6)]]),
+            ),
+        )
+        for x in range(x0, x0 + 5):
+            for y in range(5):
+                item = grid_item(f"{x}_{y}", x, y, datetime(year, 1, y + 1))
+                if name == "east":
+                    item.common_metadata.start_datetime = item.datetime
+                    item.common_metadata.end_datetime = datetime(year, 1, y + 2)
+                collection.add_item(item)
+        catalog.add_child(collection)
+    return catalog
+
+
 @pytest.fixture
 def test_case_8_collection() -> Collection:
     return TestCases.case_8()
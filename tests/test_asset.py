@@ -1,4 +1,5 @@
 import os
+import pickle
 from pathlib import Path
 
 import pytest
@@ -102,3 +103,15 @@ def test_delete_asset_relative_no_owner_fails(tmp_asset: pystac.Asset) -> None:
 
     assert asset.href in str(e.value)
     assert os.path.exists(href)
+
+
+def test_slots() -> None:
+    asset = pystac.Asset("./data.tif", roles=["data"])
+    assert not hasattr(asset, "__dict__")
+    assert asset._extra_fields is None
+    assert asset.clone()._extra_fields is None
+    assert asset.to_dict() == {"href": "./data.tif", "roles": ["data"]}
+
+    asset.extra_fields["foo"] = "bar"
+    assert asset.to_dict()["foo"] == "bar"
+    assert pickle.loads(pickle.dumps(asset)).to_dict() == asset.to_dict()
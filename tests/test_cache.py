@@ -1,5 +1,7 @@
 from typing import Any
 
+import pytest
+
 import pystac
 from pystac.cache import ResolvedObjectCache, ResolvedObjectCollectionCache
 from pystac.utils import get_opt
@@ -77,3 +79,110 @@ def test_ResolvedObjectCollectionCache_cache() -> None:
     cached = cache.get_by_id(collection.id)
     assert isinstance(cached, dict)
     assert cached["id"] == collection.id
+
+
+def test_ResolvedObjectCache_evicts_least_recently_used_items() -> None:
+    catalog = pystac.Catalog.from_file(
+        TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    )
+    catalog.set_cache_limits(max_objects=2)
+
+    items = list(catalog.get_items(recursive=True))
+    assert len(items) == 8
+
+    stats = catalog.get_cache_stats()
+    assert stats.objects == 2
+    assert stats.evictions == 6
+    assert stats.bytes > 0
+
+    resolved = [
+        link
+        for child in catalog.get_children()
+        for sub in [child, *child.get_children()]
+        for link in sub.get_item_links()
+        if link.is_resolved()
+    ]
+    assert len(resolved) == 2
+
+    # Evicted items are read again from their HREF.
+    assert [item.id for item in catalog.get_items(recursive=True)] == [
+        item.id for item in items
+    ]
+    assert catalog.get_cache_stats().evictions == 14
+
+
+def test_ResolvedObjectCache_does_not_evict_modified_items() -> None:
+    catalog = pystac.Catalog.from_file(
+        TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    )
+    catalog.set_cache_limits(max_objects=1)
+
+    modified = next(catalog.get_items(recursive=True))
+    modified.properties["modified"] = True
+    modified.mark_dirty()
+    for _ in catalog.get_items(recursive=True):
+        pass
+
+    item = next(catalog.get_items(modified.id, recursive=True))
+    assert item is modified
+    assert item.properties["modified"]
+
+
+def test_ResolvedObjectCache_does_not_materialize_lazy_items() -> None:
+    path = TestCases.get_path("data-files/item/sample-item.json")
+    d = pystac.StacIO.default().read_json(path)
+    cache = ResolvedObjectCache(max_objects=1)
+    hrefs = [f"/catalog/item-{i}.json" for i in range(2)]
+    items = [pystac.Item.from_dict(d, href=href, lazy=True) for href in hrefs]
+    for item, href in zip(items, hrefs):
+        item._mark_clean()
+        cache.get_or_cache(item)
+        cache.track(item, pystac.Link.item(href))
+
+    assert cache.stats.evictions == 1
+    assert cache.stats.bytes > 0
+    assert all("_lazy_assets" in item.__dict__ for item in items)
+
+
+def test_ResolvedObjectCache_max_bytes() -> None:
+    catalog = pystac.Catalog.from_file(
+        TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    )
+    catalog.set_cache_limits(max_bytes=1)
+    for _ in catalog.get_items(recursive=True):
+        pass
+
+    stats = catalog.get_cache_stats()
+    assert stats.objects == 1
+    assert stats.evictions == 7
+
+
+def test_ResolvedObjectCache_counts_hits_and_misses() -> None:
+    catalog = pystac.Catalog.from_file(
+        TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    )
+    cache = catalog._resolved_objects
+    href = get_opt(catalog.get_self_href())
+    assert cache.get_by_href(href) is catalog
+    assert cache.get_by_href(href + ".missing") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_ResolvedObjectCache_counts_one_lookup_per_resolved_link(
+    prefetch: int,
+) -> None:
+    catalog = pystac.Catalog.from_file(
+        TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    )
+    assert len(list(catalog.get_items(recursive=True, prefetch=prefetch))) == 8
+    stats = catalog.get_cache_stats()
+    # 6 sub-catalogs and collections, 8 items
+    assert (stats.hits, stats.misses) == (0, 14)
+
+
+def test_ResolvedObjectCache_merge_keeps_limits() -> None:
+    first = ResolvedObjectCache(max_objects=10, max_bytes=100)
+    merged = ResolvedObjectCache.merge(first, ResolvedObjectCache())
+    assert merged.max_objects == 10
+    assert merged.max_bytes == 100
@@ -4,8 +4,10 @@ import json
 import os
 import posixpath
 import tempfile
+import threading
 from collections import defaultdict
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
@@ -31,6 +33,7 @@ from pystac.layout import (
     TemplateLayoutStrategy,
 )
 from pystac.utils import (
+    HREF,
     is_absolute_href,
     make_absolute_href,
     make_posix_style,
@@ -653,6 +656,38 @@ class TestCatalog:
             elif link.rel == "child" or link.rel == "item":
                 assert not link.is_resolved()
 
+    def test_normalize_hrefs_deep_catalog(self) -> None:
+        catalog = Catalog("0", "a description")
+        parent = catalog
+        for i in range(1, 1100):
+            child = Catalog(str(i), "a description")
+            parent.add_child(child)
+            parent = child
+        parent.add_item(Item("an-id", None, None, datetime.now(), {}))
+        catalog.normalize_hrefs("http://example.com")
+        item = next(parent.get_items())
+        assert item.self_href.startswith("http://example.com/1/2/3/")
+        assert item.self_href.endswith("/1099/an-id/an-id.json")
+
+    def test_normalize_hrefs_with_executor(self) -> None:
+        expected = TestCases.case_1()
+        expected.normalize_hrefs("http://example.com")
+        hrefs = [obj.self_href for obj in expected.get_items(recursive=True)]
+
+        catalog = TestCases.case_1()
+        catalog.normalize_hrefs("http://example.com", max_workers=2)
+        assert [obj.self_href for obj in catalog.get_items(recursive=True)] == hrefs
+
+        catalog = TestCases.case_1()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            catalog.normalize_hrefs("http://example.com", executor=executor)
+        assert [obj.self_href for obj in catalog.get_items(recursive=True)] == hrefs
+
+        catalog = TestCases.case_1()
+        with ProcessPoolExecutor(max_workers=2) as process_executor:
+            catalog.normalize_hrefs("http://example.com", executor=process_executor)
+        assert [obj.self_href for obj in catalog.get_items(recursive=True)] == hrefs
+
     def test_save_unresolved(self) -> None:
         catalog = Catalog("an-id", "a description")
         item = Item(
@@ -845,6 +880,38 @@ class TestCatalog:
 
             assert len(subcats) == 2, f" for item '{item.id}'"
 
+    def test_generate_subcatalogs_reuses_children_and_keeps_item_order(
+        self,
+    ) -> None:
+        catalog = Catalog(id="test", description="Test")
+        existing = Catalog(id="A", description="Existing")
+        catalog.add_child(existing)
+        for ni, property1 in enumerate("ABAB"):
+            catalog.add_item(
+                Item(
+                    id=f"item{ni}",
+                    geometry=ARBITRARY_GEOM,
+                    bbox=ARBITRARY_BBOX,
+                    datetime=datetime.now(timezone.utc),
+                    properties=dict(property1=property1, property2=ni % 2),
+                )
+            )
+
+        result = catalog.generate_subcatalogs("${property1}/${property2}")
+        assert [cat.id for cat in result] == ["0", "B", "1"]
+        assert [child.id for child in catalog.get_children()] == ["A", "B"]
+        assert [item.id for item in existing.get_items(recursive=True)] == [
+            "item0",
+            "item2",
+        ]
+        subcat = catalog.get_child("B")
+        assert subcat is not None
+        assert [item.id for item in subcat.get_items(recursive=True)] == [
+            "item1",
+            "item3",
+        ]
+        assert list(catalog.get_items()) == []
+
     def test_map_items(self) -> None:
         def item_mapper(item: pystac.Item) -> pystac.Item:
             item.properties["ITEM_MAPPER"] = "YEP"
@@ -1615,6 +1682,345 @@ def test_fully_resolve(tmp_path: Path, test_case_1_catalog: Catalog) -> None:
     assert len(list((tmp_path / "after").glob("**/*.json"))) == 15
 
 
+@pytest.mark.parametrize("catalog_type", list(CatalogType))
+def test_concurrent_save_matches_serial_save(
+    tmp_path: Path, test_case_1_catalog: Catalog, catalog_type: CatalogType
+) -> None:
+    test_case_1_catalog.fully_resolve()
+    test_case_1_catalog.save(catalog_type, dest_href=str(tmp_path / "serial"))
+    test_case_1_catalog.save(
+        catalog_type, dest_href=str(tmp_path / "concurrent"), max_workers=4
+    )
+
+    serial = sorted(
+        p.relative_to(tmp_path / "serial")
+        for p in (tmp_path / "serial").glob("**/*.json")
+    )
+    concurrent = sorted(
+        p.relative_to(tmp_path / "concurrent")
+        for p in (tmp_path / "concurrent").glob("**/*.json")
+    )
+    assert serial == concurrent
+    assert len(serial) == 15
+    for path in serial:
+        assert (tmp_path / "serial" / path).read_text() == (
+            tmp_path / "concurrent" / path
+        ).read_text()
+
+
+def test_concurrent_save_writes_children_before_parents(
+    tmp_path: Path, test_case_1_catalog: Catalog
+) -> None:
+    written: list[str] = []
+
+    class RecordingStacIO(pystac.stac_io.DefaultStacIO):
+        def write_text(self, dest: HREF, txt: str, *_: Any, **__: Any) -> None:
+            super().write_text(dest, txt)
+            written.append(str(dest))
+
+    test_case_1_catalog.fully_resolve()
+    test_case_1_catalog.normalize_hrefs(str(tmp_path))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        test_case_1_catalog.save(stac_io=RecordingStacIO(), executor=executor)
+
+    assert len(written) == 15
+    for root, children, items in test_case_1_catalog.walk():
+        position = written.index(root.self_href)
+        for child in children:
+            assert written.index(child.self_href) < position
+        for item in items:
+            assert written.index(item.self_href) < position
+
+
+def test_concurrent_save_bounds_pending_writes_by_max_workers(
+    tmp_path: Path, test_case_1_catalog: Catalog
+) -> None:
+    pending = 0
+    most_pending = 0
+    lock = threading.Lock()
+
+    class RecordingStacIO(pystac.stac_io.DefaultStacIO):
+        def write_text(self, dest: HREF, txt: str, *_: Any, **__: Any) -> None:
+            nonlocal pending
+            super().write_text(dest, txt)
+            with lock:
+                pending -= 1
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def submit(self, *args: Any, **kwargs: Any) -> Any:
+            nonlocal pending, most_pending
+            with lock:
+                pending += 1
+                most_pending = max(most_pending, pending)
+            return super().submit(*args, **kwargs)
+
+    test_case_1_catalog.fully_resolve()
+    test_case_1_catalog.normalize_hrefs(str(tmp_path))
+    with CountingExecutor(max_workers=1) as executor:
+        written = test_case_1_catalog.save(
+            stac_io=RecordingStacIO(), executor=executor, max_workers=1
+        )
+    assert len(written) == 15
+    assert most_pending <= 2
+
+
+def test_concurrent_save_reports_all_failures(
+    tmp_path: Path, test_case_1_catalog: Catalog
+) -> None:
+    class FailingStacIO(pystac.stac_io.DefaultStacIO):
+        def write_text(self, dest: HREF, txt: str, *_: Any, **__: Any) -> None:
+            if "labels" in str(dest):
+                raise OSError(f"Cannot write {dest}")
+            super().write_text(dest, txt)
+
+    test_case_1_catalog.fully_resolve()
+    test_case_1_catalog.normalize_hrefs(str(tmp_path))
+    with pytest.raises(pystac.STACSaveError) as excinfo:
+        test_case_1_catalog.save(stac_io=FailingStacIO(), max_workers=2)
+
+    assert len(excinfo.value.errors) == 4
+    assert all(isinstance(e, OSError) for e in excinfo.value.errors.values())
+    assert len(list(tmp_path.glob("**/*.json"))) == 11
+
+
+@pytest.fixture
+def saved_catalog(tmp_path: Path, test_case_1_catalog: Catalog) -> Catalog:
+    test_case_1_catalog.fully_resolve()
+    test_case_1_catalog.normalize_and_save(
+        str(tmp_path), CatalogType.ABSOLUTE_PUBLISHED
+    )
+    return Catalog.from_file(str(tmp_path / "catalog.json"))
+
+
+def test_read_objects_are_clean(saved_catalog: Catalog) -> None:
+    assert not saved_catalog.is_dirty()
+    for root, children, items in saved_catalog.walk():
+        assert not root.is_dirty()
+        assert not any(child.is_dirty() for child in children)
+        assert not any(item.is_dirty() for item in items)
+    assert saved_catalog.save(incremental=True) == []
+
+
+def test_incremental_save_writes_changed_item(saved_catalog: Catalog) -> None:
+    item = next(saved_catalog.get_items(recursive=True))
+    item.common_metadata.title = "Changed"
+    assert item.is_dirty()
+
+    assert saved_catalog.save(incremental=True) == [item.self_href]
+    assert not item.is_dirty()
+    assert pystac.Item.from_file(item.self_href).common_metadata.title == "Changed"
+    assert saved_catalog.save(incremental=True) == []
+
+
+def test_incremental_save_writes_new_item_and_parent(saved_catalog: Catalog) -> None:
+    child = next(saved_catalog.get_children())
+    item = next(saved_catalog.get_items(recursive=True)).clone()
+    item.id = "new-item"
+    child.add_item(item)
+    saved_catalog.normalize_hrefs(os.path.dirname(saved_catalog.self_href))
+
+    written = saved_catalog.save(incremental=True)
+    assert written == [item.self_href, child.self_href]
+    assert os.path.exists(item.self_href)
+
+
+def test_incremental_save_after_nested_edits(saved_catalog: Catalog) -> None:
+    items = list(saved_catalog.get_items(recursive=True))[:2]
+    assert items[1].assets
+    items[0].properties["edited"] = True
+    assert not items[0].is_dirty()
+    items[0].mark_dirty()
+    key = next(iter(items[1].assets))
+    items[1].assets[key].href = "./edited.tif"
+    assert all(item.is_dirty() for item in items)
+
+    expected = sorted(item.self_href for item in items)
+    assert sorted(saved_catalog.save(incremental=True, dry_run=True)) == expected
+    assert sorted(saved_catalog.save(incremental=True)) == expected
+    assert pystac.Item.from_file(items[0].self_href).properties["edited"]
+    written = pystac.Item.from_file(items[1].self_href)
+    assert written.assets[key].href == "./edited.tif"
+    assert saved_catalog.save(incremental=True) == []
+
+
+def test_incremental_save_writes_everything_to_new_href(
+    tmp_path: Path, saved_catalog: Catalog
+) -> None:
+    saved_catalog.fully_resolve()
+    written = saved_catalog.save(dest_href=str(tmp_path / "copy"), incremental=True)
+    assert len(written) == 15
+    assert len(list((tmp_path / "copy").glob("**/*.json"))) == 15
+
+
+def test_concurrent_incremental_save(saved_catalog: Catalog) -> None:
+    items = list(saved_catalog.get_items(recursive=True))[:3]
+    for item in items:
+        item.common_metadata.title = "Changed"
+    written = saved_catalog.save(incremental=True, max_workers=2)
+    assert sorted(written) == sorted(item.self_href for item in items)
+    assert not any(item.is_dirty() for item in items)
+
+
+def test_save_dry_run(tmp_path: Path, test_case_1_catalog: Catalog) -> None:
+    test_case_1_catalog.fully_resolve()
+    test_case_1_catalog.normalize_hrefs(str(tmp_path))
+    catalog_type = test_case_1_catalog.catalog_type
+
+    written = test_case_1_catalog.save(
+        CatalogType.SELF_CONTAINED, dry_run=True, incremental=True
+    )
+
+    assert len(written) == 15
+    assert written[-1] == test_case_1_catalog.self_href
+    assert test_case_1_catalog.catalog_type == catalog_type
+    assert test_case_1_catalog.is_dirty()
+    assert list(tmp_path.glob("**/*.json")) == []
+    assert test_case_1_catalog.save() == written
+
+
+@pytest.mark.parametrize("prefetch", [1, 3, 100])
+def test_get_items_prefetch_preserves_order(prefetch: int) -> None:
+    href = TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    expected = [item.id for item in Catalog.from_file(href).get_items(recursive=True)]
+
+    read_threads: set[int] = set()
+
+    class RecordingStacIO(pystac.stac_io.DefaultStacIO):
+        def read_text(self, source: HREF, *_: Any, **__: Any) -> str:
+            read_threads.add(threading.get_ident())
+            return super().read_text(source)
+
+    catalog = Catalog.from_file(href, stac_io=RecordingStacIO())
+    items = list(catalog.get_items(recursive=True, prefetch=prefetch))
+
+    assert [item.id for item in items] == expected
+    assert read_threads - {threading.get_ident()}
+    for item in items:
+        assert item.get_root() is catalog
+        assert catalog._resolved_objects.get_by_href(item.self_href) is item
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_get_items_lazy(prefetch: int) -> None:
+    href = TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    expected = [
+        item.to_dict() for item in Catalog.from_file(href).get_items(recursive=True)
+    ]
+
+    catalog = Catalog.from_file(href)
+    items = list(catalog.get_items(recursive=True, prefetch=prefetch, lazy=True))
+    assert all("_lazy_assets" in item.__dict__ for item in items)
+    assert all("_lazy_links" in item.__dict__ for item in items)
+    assert all(item.get_root() is catalog for item in items)
+    assert all(item.get_parent() is not None for item in items)
+    assert not any(item.is_dirty() for item in items)
+    assert all("_lazy_links" in item.__dict__ for item in items)
+    assert [item.to_dict() for item in items] == expected
+
+
+def test_walk_prefetch_matches_walk() -> None:
+    href = TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+
+    def describe(catalog: Catalog, prefetch: int) -> list[Any]:
+        return [
+            (root.id, [c.id for c in children], [i.id for i in items])
+            for root, children, items in catalog.walk(prefetch=prefetch)
+        ]
+
+    assert describe(Catalog.from_file(href), 4) == describe(Catalog.from_file(href), 0)
+
+
+def test_prefetch_shares_one_pool_and_reads_stac_objects(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    href = TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    pools: list[ThreadPoolExecutor] = []
+    read: list[str] = []
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    class RecordingStacIO(pystac.stac_io.DefaultStacIO):
+        def read_stac_object(self, source: HREF, *args: Any, **kwargs: Any) -> Any:
+            read.append(str(source))
+            return super().read_stac_object(source, *args, **kwargs)
+
+    monkeypatch.setattr(pystac.stac_object, "ThreadPoolExecutor", CountingExecutor)
+    catalog = Catalog.from_file(href, stac_io=RecordingStacIO())
+    read.clear()
+    items = list(catalog.get_items(recursive=True, prefetch=3))
+    assert len(items) == 8
+    assert len(pools) == 1
+    # 6 sub-catalogs and collections, 8 items
+    assert len(read) == 14
+    assert pystac.stac_object._prefetch_executor._executor is None
+
+
+def test_get_items_prefetch_raises_for_missing_item(catalog: Catalog) -> None:
+    catalog.set_self_href(TestCases.get_path("data-files/catalogs/catalog.json"))
+    catalog.add_link(pystac.Link(pystac.RelType.ITEM, "./does-not-exist.json"))
+    with pytest.raises(STACError, match="does-not-exist.json"):
+        list(catalog.get_items(prefetch=2))
+
+
+def test_get_items_release_unresolves_items() -> None:
+    catalog = Catalog.from_file(
+        TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    )
+    expected = [item.id for item in catalog.get_items(recursive=True)]
+    catalog = Catalog.from_file(catalog.self_href)
+
+    ids = []
+    for item in catalog.get_items(recursive=True, release=True):
+        ids.append(item.id)
+        assert item.get_self_href() in catalog._resolved_objects.hrefs_to_objects
+    assert ids == expected
+
+    assert not any(link.is_resolved() for link in catalog.get_child_links())
+    assert not any(
+        isinstance(obj, Item)
+        for obj in catalog._resolved_objects.hrefs_to_objects.values()
+    )
+    assert [item.id for item in catalog.get_items(recursive=True)] == expected
+
+
+def test_get_items_release_keeps_previously_resolved_items() -> None:
+    catalog = Catalog.from_file(
+        TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    )
+    child = next(catalog.get_children())
+    items = list(child.get_items(recursive=True))
+    assert items
+
+    released = list(catalog.get_items(recursive=True, release=True))
+    assert all(any(item is r for r in released) for item in items)
+    assert catalog.get_child_links()[0].is_resolved()
+    assert all(
+        a is b for a, b in zip(items, child.get_items(recursive=True), strict=True)
+    )
+
+
+def test_walk_release_matches_walk() -> None:
+    href = TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+
+    def describe(catalog: Catalog, release: bool) -> list[Any]:
+        return [
+            (root.id, [c.id for c in children], [i.id for i in items])
+            for root, children, items in catalog.walk(release=release)
+        ]
+
+    catalog = Catalog.from_file(href)
+    assert describe(catalog, True) == describe(Catalog.from_file(href), False)
+    assert not any(link.is_resolved() for link in catalog.get_child_links())
+
+    catalog = Catalog.from_file(href)
+    _, children, _ = next(iter(catalog.walk(release=True)))
+    assert [child.id for child in children]
+    assert not any(link.is_resolved() for link in catalog.get_child_links())
+
+
 def test_get_items_with_multiple_ids(test_case_1_catalog: Catalog) -> None:
     cat = test_case_1_catalog
     items = cat.get_items("area-2-1-imagery", "area-1-1-labels", recursive=True)
@@ -2024,3 +2430,158 @@ def test_get_root_link_cares_about_media_type(catalog: pystac.Catalog) -> None:
     )
     root_link = catalog.get_root_link()
     assert root_link and root_link.target != "./self.json"
+
+
+@pytest.fixture
+def large_catalog_href(tmp_path: Path) -> str:
+    catalog = Catalog("large", "A catalog with many items")
+    for i in range(20):
+        catalog.add_item(
+            pystac.Item(
+                f"item-{i}", ARBITRARY_GEOM, ARBITRARY_BBOX, datetime(2020, 1, 1), {}
+            )
+        )
+    catalog.add_child(Catalog("child", "A child catalog"))
+    catalog.normalize_and_save(str(tmp_path), CatalogType.SELF_CONTAINED)
+    return str(tmp_path / "catalog.json")
+
+
+class ReadRecordingStacIO(pystac.stac_io.DefaultStacIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.read: list[str] = []
+
+    def read_text(self, source: HREF, *_: Any, **__: Any) -> str:
+        self.read.append(str(source))
+        return super().read_text(source)
+
+
+def test_link_index_reads_only_matching_links(large_catalog_href: str) -> None:
+    stac_io = ReadRecordingStacIO()
+    catalog = Catalog.from_file(large_catalog_href, stac_io=stac_io)
+    catalog.enable_link_index()
+    stac_io.read.clear()
+
+    items = list(catalog.get_items("item-12", "item-3"))
+    assert [item.id for item in items] == ["item-12", "item-3"]
+    assert len(stac_io.read) == 2
+    # Each link is read at most once to learn its ID
+    assert list(catalog.get_items("missing")) == []
+    assert len(stac_io.read) == 20
+
+    stac_io.read.clear()
+    assert [item.id for item in catalog.get_items("item-7", "item-12")] == [
+        "item-7",
+        "item-12",
+    ]
+    child = catalog.get_child("child")
+    assert child is not None and child.id == "child"
+    assert len(stac_io.read) == 1
+
+
+def test_link_index_reads_links_by_href_segment(large_catalog_href: str) -> None:
+    stac_io = ReadRecordingStacIO()
+    catalog = Catalog.from_file(large_catalog_href, stac_io=stac_io)
+    catalog.enable_link_index()
+    stac_io.read.clear()
+
+    for i in reversed(range(1, 20, 3)):
+        assert [item.id for item in catalog.get_items(f"item-{i}")] == [f"item-{i}"]
+        assert stac_io.read[-1].endswith(f"/item-{i}/item-{i}.json")
+    assert len(stac_io.read) == 7
+
+
+def test_link_index_release(large_catalog_href: str) -> None:
+    catalog = Catalog.from_file(large_catalog_href)
+    catalog.enable_link_index()
+    assert [item.id for item in catalog.get_items("item-4", release=True)] == ["item-4"]
+    assert not any(link.is_resolved() for link in catalog.get_item_links())
+    assert next(catalog.get_items("item-4")).id == "item-4"
+
+
+def test_link_index_remove_does_not_read_known_links(
+    large_catalog_href: str,
+) -> None:
+    stac_io = ReadRecordingStacIO()
+    catalog = Catalog.from_file(large_catalog_href, stac_io=stac_io)
+    catalog.enable_link_index()
+    list(catalog.get_items("item-5", release=True))
+    stac_io.read.clear()
+
+    catalog.remove_item("item-5")
+    assert stac_io.read == []
+    assert len(catalog.get_item_links()) == 19
+    assert list(catalog.get_items("item-5")) == []
+
+
+def test_link_index_is_maintained(catalog: Catalog) -> None:
+    catalog.enable_link_index()
+    item = pystac.Item("item", ARBITRARY_GEOM, ARBITRARY_BBOX, datetime.now(), {})
+    child = Catalog("child", "A child catalog")
+    catalog.add_item(item)
+    catalog.add_child(child)
+    assert next(catalog.get_items("item")) is item
+    assert catalog.get_child("child") is child
+
+    catalog.remove_item("item")
+    assert list(catalog.get_items("item")) == []
+    assert item.get_parent() is None
+
+    catalog.add_item(item)
+    catalog.remove_links(pystac.RelType.ITEM)
+    assert list(catalog.get_items("item")) == []
+    catalog.add_link(pystac.Link.item(item))
+    assert next(catalog.get_items("item")) is item
+
+    item.id = "renamed"
+    catalog.enable_link_index()
+    assert next(catalog.get_items("renamed")) is item
+
+    catalog.clear_children()
+    assert catalog.get_child("child") is None
+    assert child.get_root() is None
+
+
+def test_clear_children_does_not_read_children(large_catalog_href: str) -> None:
+    stac_io = ReadRecordingStacIO()
+    catalog = Catalog.from_file(large_catalog_href, stac_io=stac_io)
+    stac_io.read.clear()
+    catalog.clear_children()
+    assert stac_io.read == []
+    assert catalog.get_child_links() == []
+
+
+def test_search(grid_catalog: Catalog) -> None:
+    found = grid_catalog.search(bbox=[-1.5, 1.5, 0.5, 2.5])
+    assert sorted(item.id for item in found) == [
+        "-1_1",
+        "-1_2",
+        "-2_1",
+        "-2_2",
+        "0_1",
+        "0_2",
+    ]
+    point = {"type": "Point", "coordinates": [2.5, 3.5]}
+    assert [item.id for item in grid_catalog.search(intersects=point)] == ["2_3"]
+    assert len(list(grid_catalog.search())) == 50
+
+
+def test_search_skips_collections_outside_query(
+    tmp_path: Path, grid_catalog: Catalog
+) -> None:
+    grid_catalog.normalize_and_save(str(tmp_path), CatalogType.SELF_CONTAINED)
+    stac_io = ReadRecordingStacIO()
+    catalog = Catalog.from_file(str(tmp_path / "catalog.json"), stac_io=stac_io)
+    stac_io.read.clear()
+
+    assert [item.id for item in catalog.search(bbox=[2.5, 2.5, 2.5, 2.5])] == ["2_2"]
+    # The west collection is read for its extent, but none of its items
+    assert [href for href in stac_io.read if "west" in href] == [
+        str(tmp_path / "west" / "collection.json")
+    ]
+    stac_io.read.clear()
+
+    found = catalog.search(datetime="2019-01-05T00:00:00Z/2019-06-01T00:00:00Z")
+    assert {item.id for item in found} == {f"{x}_4" for x in range(-5, 0)}
+    # The east collection was read by the previous search, and its items are skipped
+    assert not any("east" in href for href in stac_io.read)
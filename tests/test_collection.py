@@ -24,6 +24,7 @@ from pystac import (
     SpatialExtent,
     TemporalExtent,
 )
+from pystac.collection import ExtentAccumulator
 from pystac.extensions.eo import EOExtension
 from pystac.utils import datetime_to_str, get_required, str_to_datetime
 from pystac.validation import validate_dict
@@ -497,6 +498,84 @@ def test_extent_from_items() -> None:
     assert interval[1] == datetime(2001, 1, 1, 12, 0, 0, 0, tzinfo=tz.UTC)
 
 
+def test_extent_from_items_across_antimeridian() -> None:
+    def item(id: str, bbox: list[float]) -> Item:
+        return Item(id, ARBITRARY_GEOM, bbox, datetime(2000, 1, 1), {})
+
+    extent = Extent.from_items(
+        [item("a", [170, -10, -175, 0]), item("b", [-170, 5, -160, 10])]
+    )
+    assert extent.spatial.bboxes == [
+        [170, -10, -160, 10],
+        [170, -10, 180, 0],
+        [-180, -10, -160, 10],
+    ]
+
+    extent = Extent.from_items(
+        [item("a", [170, -10, -175, 0]), item("b", [-10, 5, 10, 10])]
+    )
+    assert extent.spatial.bboxes == [[-180, -10, 180, 10]]
+
+
+def test_extent_accumulator_merge() -> None:
+    bboxes = [[170, -10, -175, 0], [-170, 5, -160, 10], [10, 1, 0, 20, 2, 5]]
+    dates = [datetime(2001, 1, 1), datetime(2000, 1, 1, tzinfo=tz.UTC), None]
+    expected = ExtentAccumulator()
+    for bbox, date in zip(bboxes, dates):
+        expected.add_bbox(bbox)
+        expected.add_interval(date, date)
+
+    parts = [ExtentAccumulator(), ExtentAccumulator()]
+    for i, (bbox, date) in enumerate(zip(bboxes, dates)):
+        parts[i % 2].add_bbox(bbox)
+        parts[i % 2].add_interval(date, date)
+    merged = ExtentAccumulator().merge(parts[1]).merge(parts[0])
+
+    assert merged.to_extent().to_dict() == expected.to_extent().to_dict()
+    assert merged.count == 3
+    assert merged.start == datetime(2000, 1, 1, tzinfo=tz.UTC)
+    assert merged.end == datetime(2001, 1, 1, tzinfo=tz.UTC)
+    assert merged.bboxes()[0] == [10, -10, -160, 10]
+
+
+@pytest.mark.parametrize(
+    "bboxes",
+    [
+        [[-10, -20, 0, -10], [0, -9, 10, 1]],
+        [[170, -10, -175, 0], [-170, 5, -160, 10], [175, -1, 176, 1]],
+        [[170, -10, -175, 0], [-10, 5, 10, 10]],
+    ],
+)
+def test_extent_accumulator_add_bboxes(bboxes: list[list[float]]) -> None:
+    expected = ExtentAccumulator()
+    for bbox in bboxes:
+        expected.add_bbox(bbox)
+    accumulator = ExtentAccumulator()
+    accumulator.add_bboxes(bboxes + [[float("nan")] * 4])
+    assert accumulator.bboxes() == expected.bboxes()
+    assert accumulator.count == len(bboxes)
+
+
+@pytest.mark.parametrize("numpy", [False, True])
+def test_extent_accumulator_keeps_longitudes_across_antimeridian(
+    numpy: bool,
+) -> None:
+    # -0.1 + 360 - 360 is not -0.1
+    bboxes = [[170.1, -10, -0.1, 0], [-33.333333333333336, 5, -0.30000000000000004, 10]]
+    accumulator = ExtentAccumulator()
+    if numpy:
+        pytest.importorskip("numpy")
+        accumulator.add_bboxes(bboxes)
+    else:
+        for bbox in bboxes:
+            accumulator.add_bbox(bbox)
+    assert accumulator.bboxes() == [
+        [170.1, -10, -0.1, 10],
+        [170.1, -10, 180, 0],
+        [-180, -10, -0.1, 10],
+    ]
+
+
 def test_extent_to_from_dict() -> None:
     spatial_dict = {
         "bbox": [
@@ -0,0 +1,129 @@
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+import pystac
+from pystac import ItemCollection
+from pystac.errors import STACTypeError
+
+np = pytest.importorskip("numpy")
+
+from pystac.columnar import ColumnarItemCollection  # noqa: E402
+
+
+@pytest.fixture
+def grid_items(grid_catalog: pystac.Catalog) -> ItemCollection:
+    items = ItemCollection(grid_catalog.get_items(recursive=True))
+    for i, item in enumerate(items):
+        # The catalog is not saved, so the links to it have no HREF
+        item.clear_links()
+        if i % 7:
+            item.properties["eo:cloud_cover"] = float(i % 10)
+        item.properties["platform"] = "west" if item.id.startswith("-") else "east"
+    return items
+
+
+@pytest.fixture
+def columnar(grid_items: ItemCollection) -> ColumnarItemCollection:
+    return grid_items.to_columnar(["eo:cloud_cover", "platform"])
+
+
+def test_columns(columnar: ColumnarItemCollection) -> None:
+    assert len(columnar) == 50
+    assert columnar.ids[0] == "-5_0"
+    assert columnar.bboxes.shape == (50, 4)
+    assert list(columnar.bboxes[0]) == [-5, 0, -4, 1]
+    assert columnar.start_datetimes[0] == np.datetime64("2019-01-01")
+    # East items have a start and end datetime
+    assert columnar.end_datetimes[-1] == np.datetime64("2020-01-06")
+    assert columnar.properties["eo:cloud_cover"].dtype == float
+    assert np.isnan(columnar.properties["eo:cloud_cover"][0])
+    assert columnar.properties["platform"][0] == "west"
+
+
+def test_3d_bbox() -> None:
+    item = pystac.Item(
+        "3d",
+        {"type": "Point", "coordinates": [10, 20, 0]},
+        [10, 20, 0, 11, 21, 100],
+        datetime(2020, 1, 1),
+        {},
+    ).to_dict()
+    columnar = ColumnarItemCollection([item])
+    assert list(columnar.bboxes[0]) == [10, 20, 11, 21]
+    assert len(columnar.search(bbox=[15, 50, 16, 60])) == 0
+    assert len(columnar.search(bbox=[10.5, 20.5, 16, 60])) == 1
+
+
+def test_items_are_created_on_access(columnar: ColumnarItemCollection) -> None:
+    assert all(item is None for item in columnar._items)
+    item = columnar[3]
+    assert isinstance(item, pystac.Item)
+    assert item.id == columnar.ids[3]
+    assert columnar[3] is item
+    assert item in columnar
+    assert sum(item is not None for item in columnar._items) == 1
+
+
+def test_select_and_sort(columnar: ColumnarItemCollection) -> None:
+    item = columnar[10]
+    cloudless = columnar.select(columnar.properties["eo:cloud_cover"] < 1)
+    assert list(cloudless.ids) == ["-3_0", "-1_0", "1_0", "3_0"]
+    assert all(
+        item.properties["eo:cloud_cover"] == 0
+        for item in cloudless.to_item_collection()
+    )
+    assert columnar.select([10])[0] is item
+
+    by_cloud_cover = columnar.sort("eo:cloud_cover", reverse=True)
+    cloud_cover = by_cloud_cover.properties["eo:cloud_cover"]
+    assert cloud_cover[0] == 9
+    # Items without cloud cover come last
+    assert np.isnan(cloud_cover[-8:]).all()
+    assert not np.isnan(cloud_cover[:-8]).any()
+
+    by_datetime = columnar.sort()
+    assert (np.diff(by_datetime.start_datetimes) >= np.timedelta64(0)).all()
+    assert list(columnar.sort("id").ids) == sorted(columnar.ids)
+
+
+def test_search_matches_item_collection(
+    grid_items: ItemCollection, columnar: ColumnarItemCollection
+) -> None:
+    queries: list[dict[str, Any]] = [
+        {"bbox": [-1.5, 1.5, 0.5, 2.5]},
+        {"bbox": [4.5, 0, -4.5, 1]},
+        {"intersects": {"type": "Point", "coordinates": [2.5, 3.5]}},
+        {"datetime": "2020-01-03T12:00:00Z/.."},
+        {"bbox": [-3, -3, 3, 3], "datetime": "../2019-01-02"},
+    ]
+    for query in queries:
+        expected = [item.id for item in grid_items.search(**query)]
+        assert list(columnar.search(**query).ids) == expected
+
+
+def test_to_dict_round_trip(grid_items: ItemCollection) -> None:
+    d = grid_items.to_dict()
+    d["foo"] = "bar"
+    columnar = ColumnarItemCollection.from_dict(d, properties=["platform"])
+    assert columnar.extra_fields == {"foo": "bar"}
+    assert columnar.to_dict() == d
+
+    columnar[0].properties["platform"] = "changed"
+    assert columnar.to_dict()["features"][0]["properties"]["platform"] == "changed"
+    assert d["features"][0]["properties"]["platform"] == "west"
+    assert ItemCollection.from_dict(columnar.to_dict()).to_dict() == {
+        **d,
+        "features": columnar.to_dict()["features"],
+    }
+
+
+def test_from_dict_rejects_other_types() -> None:
+    with pytest.raises(STACTypeError):
+        ColumnarItemCollection.from_dict({"type": "Feature"})
+
+
+def test_get_extent(grid_items: ItemCollection) -> None:
+    extent = grid_items.to_columnar().get_extent()
+    assert extent.to_dict() == pystac.Extent.from_items(grid_items).to_dict()
@@ -0,0 +1,232 @@
+import os
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import pystac
+from pystac import Asset, Catalog, ItemCollection
+from pystac.errors import STACError
+from pystac.geoparquet import (
+    HAS_PYARROW,
+    geojson_from_wkb,
+    read_parquet,
+    wkb_from_geojson,
+    write_parquet,
+)
+
+requires_pyarrow = pytest.mark.skipif(not HAS_PYARROW, reason="requires pyarrow")
+
+
+@pytest.fixture
+def grid_items(grid_catalog: Catalog) -> ItemCollection:
+    items = ItemCollection(grid_catalog.get_items(recursive=True))
+    for i, item in enumerate(items):
+        # The catalog is not saved, so the links to it have no HREF
+        item.clear_links()
+        item.add_link(pystac.Link("license", "https://example.com/license"))
+        item.add_asset("data", Asset(f"https://example.com/{item.id}.tif"))
+        if i % 2:
+            item.assets["data"].roles = ["data"]
+            item.properties["eo:cloud_cover"] = i
+    return items
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        {"type": "Point", "coordinates": [1.5, 2.5]},
+        {"type": "Point", "coordinates": [1.5, 2.5, 3.5]},
+        {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+        {
+            "type": "Polygon",
+            "coordinates": [
+                [[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 0.0]],
+                [[1.0, 1.0], [2.0, 1.0], [2.0, 2.0], [1.0, 1.0]],
+            ],
+        },
+        {"type": "MultiPoint", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+        {
+            "type": "MultiPolygon",
+            "coordinates": [[[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]]],
+        },
+        {
+            "type": "GeometryCollection",
+            "geometries": [
+                {"type": "Point", "coordinates": [1.0, 2.0]},
+                {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]]},
+            ],
+        },
+    ],
+)
+def test_wkb_round_trip(geometry: dict[str, Any]) -> None:
+    assert geojson_from_wkb(wkb_from_geojson(geometry)) == geometry
+
+
+def test_wkb_point() -> None:
+    assert wkb_from_geojson({"type": "Point", "coordinates": [1, 2]}).hex() == (
+        "0101000000000000000000f03f0000000000000040"
+    )
+
+
+@requires_pyarrow
+def test_round_trip(tmp_path: Path, grid_items: ItemCollection) -> None:
+    import pyarrow.parquet as pq
+
+    path = str(tmp_path / "items.parquet")
+    grid_items.to_parquet(path, chunk_size=8)
+    assert pq.ParquetFile(path).metadata.num_row_groups == 7
+
+    read = ItemCollection.from_parquet(path)
+    assert [item.id for item in read] == [item.id for item in grid_items]
+    for expected, actual in zip(grid_items, read):
+        assert actual.to_dict() == expected.to_dict()
+
+
+@requires_pyarrow
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"bbox": [-1.5, 1.5, 0.5, 2.5]},
+        {"bbox": [4.5, 0, -4.5, 1]},
+        {"datetime": "2020-01-03T12:00:00Z/.."},
+        {"bbox": [-3, -3, 3, 3], "datetime": "../2019-01-02"},
+    ],
+)
+def test_filters_match_search(
+    tmp_path: Path, grid_items: ItemCollection, query: dict[str, Any]
+) -> None:
+    path = str(tmp_path / "items.parquet")
+    grid_items.to_parquet(path, chunk_size=8)
+    expected = [item.id for item in grid_items.search(**query)]
+    assert [item.id for item in read_parquet(path, **query)] == expected
+
+
+@requires_pyarrow
+def test_filters_skip_row_groups(tmp_path: Path, grid_items: ItemCollection) -> None:
+    import pyarrow.dataset as ds
+
+    from pystac.geoparquet import _bbox_filter
+
+    path = str(tmp_path / "items.parquet")
+    grid_items.to_parquet(path, chunk_size=5)
+    fragment = next(ds.dataset(path, format="parquet").get_fragments())
+    matching = fragment.subset(_bbox_filter([2.5, 2.5, 2.5, 2.5], False))
+    assert len(fragment.row_groups) == 10
+    assert len(matching.row_groups) == 1
+
+
+@requires_pyarrow
+def test_antimeridian(tmp_path: Path, grid_items: ItemCollection) -> None:
+    item = grid_items[0].clone()
+    item.id = "crossing"
+    item.bbox = [179, 0, -179, 1]
+    path = str(tmp_path / "items.parquet")
+    ItemCollection([*grid_items, item]).to_parquet(path)
+    assert [i.id for i in read_parquet(path, bbox=[-179.5, 0, -179.5, 1])] == [
+        "crossing"
+    ]
+
+
+@requires_pyarrow
+def test_column_projection(tmp_path: Path, grid_items: ItemCollection) -> None:
+    path = str(tmp_path / "items.parquet")
+    grid_items.to_parquet(path)
+    item = next(read_parquet(path, columns=["id", "datetime", "eo:cloud_cover"]))
+    assert item.id == "-5_0"
+    assert item.geometry is None
+    assert item.assets == {}
+    assert item.datetime == datetime.fromisoformat("2019-01-01T00:00:00+00:00")
+
+
+@requires_pyarrow
+def test_streaming_write_promotes_schema(
+    tmp_path: Path, grid_items: ItemCollection
+) -> None:
+    import pyarrow.parquet as pq
+
+    path = str(tmp_path / "items.parquet")
+    west = grid_items.items[:25]
+    write_parquet(iter(west), path, chunk_size=10)
+    assert len(list(read_parquet(path))) == 25
+
+    # The east items have a start and end datetime
+    schema = pq.read_schema(path).remove_metadata()
+    with pytest.raises(STACError, match="do not fit the schema"):
+        write_parquet(iter(grid_items), path, chunk_size=10, schema=schema)
+    write_parquet(iter(grid_items), path, chunk_size=10)
+    assert len(list(read_parquet(path))) == 50
+    assert "start_datetime" in pq.read_schema(path).names
+    assert pq.ParquetFile(path).num_row_groups == 5
+    assert os.listdir(tmp_path) == ["items.parquet"]
+
+
+@requires_pyarrow
+def test_write_streams_lists(
+    tmp_path: Path, grid_items: ItemCollection, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import pyarrow.parquet as pq
+
+    read = 0
+    read_when_written: list[int] = []
+
+    class CountingList(list[pystac.Item]):
+        def __iter__(self) -> Iterator[pystac.Item]:
+            nonlocal read
+            for item in super().__iter__():
+                read += 1
+                yield item
+
+    conform = pystac.geoparquet._conform
+
+    def recording_conform(table: Any, schema: Any) -> Any:
+        read_when_written.append(read)
+        return conform(table, schema)
+
+    monkeypatch.setattr(pystac.geoparquet, "_conform", recording_conform)
+    path = str(tmp_path / "items.parquet")
+    write_parquet(CountingList(grid_items.items[:25]), path, chunk_size=10)
+    assert read_when_written == [10, 20, 25]
+
+    # The east items do not fit the schema of the first chunk, so the row groups
+    # written before them are rewritten, without reading the items again.
+    read_when_written.clear()
+    read = 0
+    write_parquet(CountingList(grid_items.items), path, chunk_size=10)
+    assert read_when_written[:5] == [10, 20, 30, 40, 50]
+    assert read == 50
+    assert len(list(read_parquet(path))) == 50
+    assert "start_datetime" in pq.read_schema(path).names
+
+
+@requires_pyarrow
+def test_catalog_to_parquet(tmp_path: Path, grid_catalog: Catalog) -> None:
+    grid_catalog.normalize_hrefs(str(tmp_path / "stac"))
+    grid_catalog.add_item(
+        pystac.Item("loose", None, None, datetime(2020, 1, 1), {}),
+    )
+    written = grid_catalog.to_parquet(str(tmp_path / "parquet"))
+    assert sorted(Path(path).name for path in written) == [
+        "east.parquet",
+        "grid.parquet",
+        "west.parquet",
+    ]
+    west = ItemCollection.from_parquet(str(tmp_path / "parquet" / "west.parquet"))
+    assert len(west) == 25
+    assert all(item.collection_id == "west" for item in west)
+
+
+@requires_pyarrow
+def test_catalog_to_parquet_releases_items(
+    tmp_path: Path, grid_catalog: Catalog
+) -> None:
+    grid_catalog.normalize_and_save(
+        str(tmp_path / "stac"), pystac.CatalogType.SELF_CONTAINED
+    )
+    catalog = Catalog.from_file(str(tmp_path / "stac" / "catalog.json"))
+    written = catalog.to_parquet(str(tmp_path / "parquet"))
+    assert [Path(path).name for path in written] == ["west.parquet", "east.parquet"]
+    assert len(list(read_parquet(written[1]))) == 25
+    assert not any(link.is_resolved() for link in catalog.get_child_links())
@@ -0,0 +1,172 @@
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from pystac.index import (
+    Interval,
+    SpatialIndex,
+    TemporalIndex,
+    bbox_intersects,
+    geometry_intersects,
+    intervals_overlap,
+    parse_interval,
+)
+
+
+def random_bboxes(n: int, seed: int = 0) -> list[list[float]]:
+    rng = random.Random(seed)
+    bboxes = []
+    for _ in range(n):
+        west, south = rng.uniform(-180, 175), rng.uniform(-90, 85)
+        bboxes.append(
+            [west, south, west + rng.uniform(0, 5), south + rng.uniform(0, 5)]
+        )
+    return bboxes
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        [-10, -10, 10, 10],
+        [170, -20, -170, 20],
+        [0, 0, -100, 1000, 1, 100],
+        [-180, -90, 180, 90],
+        [200, 0, 210, 10],
+    ],
+)
+def test_search_matches_scan(query: list[float]) -> None:
+    bboxes = random_bboxes(2000) + [[178, -5, -178, 5]]
+    index = SpatialIndex((bbox, i) for i, bbox in enumerate(bboxes))
+    expected = [i for i, bbox in enumerate(bboxes) if bbox_intersects(bbox, query)]
+    assert index.search(query) == expected
+
+
+def test_entries_without_bbox_are_not_indexed() -> None:
+    index = SpatialIndex([(None, "a"), ([0, 0, 1, 1], "b")])
+    assert len(index) == 2
+    assert index.search([-180, -90, 180, 90]) == ["b"]
+
+
+def test_to_dict_round_trip() -> None:
+    bboxes = random_bboxes(500, seed=1)
+    index = SpatialIndex((bbox, i) for i, bbox in enumerate(bboxes))
+    loaded = SpatialIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+    for query in random_bboxes(20, seed=2):
+        assert loaded.search(query) == index.search(query)
+
+
+SQUARE = {
+    "type": "Polygon",
+    "coordinates": [[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]],
+}
+SQUARE_WITH_HOLE = {
+    "type": "Polygon",
+    "coordinates": [
+        [[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]],
+        [[2, 2], [8, 2], [8, 8], [2, 8], [2, 2]],
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        (SQUARE, {"type": "Point", "coordinates": [5, 5]}, True),
+        (SQUARE, {"type": "Point", "coordinates": [10, 5]}, True),
+        (SQUARE, {"type": "Point", "coordinates": [11, 5]}, False),
+        (SQUARE, {"type": "LineString", "coordinates": [[-1, 5], [11, 5]]}, True),
+        (
+            SQUARE,
+            {"type": "Polygon", "coordinates": [[[11, 0], [20, 0], [11, 9], [11, 0]]]},
+            False,
+        ),
+        (
+            SQUARE,
+            {"type": "Polygon", "coordinates": [[[2, 2], [3, 2], [3, 3], [2, 2]]]},
+            True,
+        ),
+        (
+            {"type": "Polygon", "coordinates": [[[9, 9], [11, 9], [11, 11], [9, 9]]]},
+            SQUARE,
+            True,
+        ),
+        (SQUARE_WITH_HOLE, {"type": "Point", "coordinates": [5, 5]}, False),
+        (
+            SQUARE_WITH_HOLE,
+            {"type": "MultiPoint", "coordinates": [[5, 5], [1, 1]]},
+            True,
+        ),
+        (
+            {
+                "type": "GeometryCollection",
+                "geometries": [{"type": "Point", "coordinates": [20, 20]}, SQUARE],
+            },
+            {"type": "Point", "coordinates": [1, 1]},
+            True,
+        ),
+    ],
+)
+def test_geometry_intersects(
+    a: dict[str, Any], b: dict[str, Any], expected: bool
+) -> None:
+    assert geometry_intersects(a, b) is expected
+    assert geometry_intersects(b, a) is expected
+
+
+def random_intervals(n: int, seed: int = 0) -> list[Interval | None]:
+    rng = random.Random(seed)
+    base = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    intervals: list[Interval | None] = []
+    for _ in range(n):
+        start = base + timedelta(days=rng.uniform(0, 365))
+        if rng.random() < 0.8:
+            intervals.append((start, start))
+        else:
+            intervals.append((start, start + timedelta(days=rng.uniform(0, 60))))
+    return intervals + [None, (None, base), (base + timedelta(days=200), None)]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "2020-03-01/2020-04-01",
+        "2020-03-01T00:00:00Z/..",
+        "../2020-01-10",
+        "/2019-12-31",
+        "2020-06-01T12:00:00Z",
+        "2021-06-01/2021-07-01",
+    ],
+)
+def test_temporal_search_matches_scan(query: str) -> None:
+    intervals = random_intervals(2000)
+    index = TemporalIndex((interval, i) for i, interval in enumerate(intervals))
+    query_interval = parse_interval(query)
+    expected = [
+        i
+        for i, interval in enumerate(intervals)
+        if interval is not None and intervals_overlap(interval, query_interval)
+    ]
+    assert index.search(query) == expected
+
+
+def test_temporal_search_treats_naive_datetimes_as_utc() -> None:
+    index = TemporalIndex([((datetime(2020, 1, 1, 12), None), "a")])
+    assert index.search("2020-01-01T12:00:00Z") == ["a"]
+    assert index.search("../2020-01-01T11:59:59Z") == []
+
+
+def test_parse_interval() -> None:
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    assert parse_interval("2020-01-01T00:00:00Z") == (start, start)
+    assert parse_interval("2020-01-01T00:00:00Z/2021-01-01T00:00:00Z") == (start, end)
+    assert parse_interval("../2021-01-01T00:00:00Z") == (None, end)
+    assert parse_interval(start) == (start, start)
+    assert parse_interval((start, None)) == (start, None)
+    with pytest.raises(ValueError, match="ends before it starts"):
+        parse_interval((end, start))
+    with pytest.raises(ValueError, match="Invalid"):
+        parse_interval("2020/2021/2022")
@@ -48,6 +48,149 @@ def test_to_from_dict(sample_item_dict: dict[str, Any]) -> None:
     assert param_dict == sample_item_dict
 
 
+def test_from_dict_copies_at_most_once(
+    sample_item_dict: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    copies = []
+    original_deepcopy = pystac.serialization.migrate.deepcopy
+
+    def counting_deepcopy(x: Any) -> Any:
+        copies.append(x)
+        return original_deepcopy(x)
+
+    monkeypatch.setattr(pystac.serialization.migrate, "deepcopy", counting_deepcopy)
+    monkeypatch.setattr(pystac.item, "deepcopy", counting_deepcopy)
+
+    item = Item.from_dict(sample_item_dict)
+    assert len(copies) == 1
+    assert item.properties is not sample_item_dict["properties"]
+
+    d = deepcopy(sample_item_dict)
+    item = Item.from_dict(d, preserve_dict=False)
+    assert len(copies) == 1
+    assert item.properties is d["properties"]
+
+    Item.from_dict(sample_item_dict, migrate=False)
+    assert len(copies) == 2
+
+
+def test_from_dict_lazy_matches_eager(sample_item_dict: dict[str, Any]) -> None:
+    href = "http://example.com/item.json"
+    eager = Item.from_dict(sample_item_dict, href=href)
+    lazy = Item.from_dict(sample_item_dict, href=href, lazy=True)
+
+    assert "assets" not in lazy.__dict__
+    assert "links" not in lazy.__dict__
+    assert lazy.id == eager.id
+    assert lazy.datetime == eager.datetime
+
+    assert lazy.get_self_href() == href
+    assert "links" not in lazy.__dict__
+    assert lazy.get_links()
+    assert "links" in lazy.__dict__
+    assert "assets" not in lazy.__dict__
+
+    assert lazy.assets["analytic"].owner is lazy
+    assert lazy.to_dict() == eager.to_dict()
+    assert [link.rel for link in lazy.links] == [link.rel for link in eager.links]
+
+
+def test_from_dict_lazy_set_root(sample_item_dict: dict[str, Any]) -> None:
+    catalog = pystac.Catalog(id="test", description="test desc")
+    item = Item.from_dict(sample_item_dict, root=catalog, lazy=True)
+    assert item.get_root() is catalog
+    assert "assets" not in item.__dict__
+
+
+def test_from_dict_lazy_keeps_links_lazy_with_root_and_parent(
+    sample_item_dict: dict[str, Any],
+) -> None:
+    href = "http://example.com/item.json"
+    catalog = pystac.Catalog(id="test", description="test desc")
+    catalog.set_self_href("http://example.com/catalog.json")
+    eager = Item.from_dict(sample_item_dict, href=href, root=catalog)
+    eager.set_parent(catalog)
+    item = Item.from_dict(sample_item_dict, href=href, root=catalog, lazy=True)
+    item.set_parent(catalog)
+    assert item.get_root() is catalog
+    assert item.get_parent() is catalog
+    assert catalog._resolved_objects.get_by_href(href) is item
+    assert "links" not in item.__dict__
+
+    assert item.to_dict() == eager.to_dict()
+    assert [link.rel for link in item.links] == [link.rel for link in eager.links]
+    assert item.get_single_link("root").target is catalog  # type: ignore
+    assert item.get_single_link("parent").target is catalog  # type: ignore
+    assert item.is_dirty() == eager.is_dirty()
+
+
+def test_from_dict_lazy_pickles(sample_item_dict: dict[str, Any]) -> None:
+    item = Item.from_dict(sample_item_dict, lazy=True)
+    unpickled = pickle.loads(pickle.dumps(item))
+    assert unpickled.to_dict() == Item.from_dict(sample_item_dict).to_dict()
+
+
+def test_from_dict_lazy_assignment_replaces_raw_data(
+    sample_item_dict: dict[str, Any],
+) -> None:
+    item = Item.from_dict(sample_item_dict, lazy=True)
+    item.assets = {"new": Asset("new.tif")}
+    item.links = [Link.root(item)]
+    assert "_lazy_assets" not in item.__dict__
+    assert "_lazy_links" not in item.__dict__
+
+    unpickled = pickle.loads(pickle.dumps(item))
+    assert list(unpickled.assets) == ["new"]
+    assert [link.rel for link in unpickled.links] == ["root"]
+
+
+def test_from_dict_lazy_unknown_attribute(sample_item_dict: dict[str, Any]) -> None:
+    item = Item.from_dict(sample_item_dict, lazy=True)
+    with pytest.raises(AttributeError, match="no attribute 'foo'"):
+        getattr(item, "foo")
+
+
+def test_dirty_tracking(sample_item_dict: dict[str, Any]) -> None:
+    assert Item.from_dict(sample_item_dict).is_dirty()
+
+    item = Item.from_file(TestCases.get_path("data-files/item/sample-item.json"))
+    assert not item.is_dirty()
+    item.set_self_href(item.get_self_href())
+    assert not item.is_dirty()
+
+    item.add_asset("new", pystac.Asset(href="new.tif"))
+    assert item.is_dirty()
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_dirty_tracking_ignores_lazy_materialization(
+    sample_item_dict: dict[str, Any], lazy: bool
+) -> None:
+    item = Item.from_dict(sample_item_dict, lazy=lazy)
+    item._mark_clean()
+    assert item.assets and item.links
+    assert not item.is_dirty()
+    item.ext.add("eo")
+    assert item.is_dirty()
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_dirty_tracking_of_asset_edits(
+    sample_item_dict: dict[str, Any], lazy: bool
+) -> None:
+    item = Item.from_dict(sample_item_dict, lazy=lazy)
+    item._mark_clean()
+    asset = next(iter(item.assets.values()))
+    asset.title = "Edited"
+    assert item.is_dirty()
+    item._mark_clean()
+    asset.extra_fields["edited"] = True
+    item.properties["edited"] = True
+    assert not item.is_dirty()
+    item.mark_dirty()
+    assert item.is_dirty()
+
+
 def test_from_dict_set_root(sample_item_dict: dict[str, Any]) -> None:
     catalog = pystac.Catalog(id="test", description="test desc")
     item = Item.from_dict(sample_item_dict, root=catalog)
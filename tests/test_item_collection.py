@@ -185,10 +185,12 @@ def test_from_dict_preserves_dict(item_collection_dict: dict[str, Any]) -> None:
     _ = ItemCollection.from_dict(param_dict)
     assert param_dict == item_collection_dict
 
-    # assert that the parameter is preserved regardless of
-    # preserve_dict
-    _ = ItemCollection.from_dict(param_dict, preserve_dict=False)
-    assert param_dict == item_collection_dict
+    # the features are reused without copying them with preserve_dict=False
+    item_collection = ItemCollection.from_dict(param_dict, preserve_dict=False)
+    assert all(
+        item.geometry is feature["geometry"]
+        for item, feature in zip(item_collection, param_dict["features"])
+    )
 
 
 def test_from_dict_sets_root(item_collection_dict: dict[str, Any]) -> None:
@@ -206,3 +208,97 @@ def test_to_dict_does_not_read_root_link_of_items() -> None:
         item_collection.to_dict()
 
         assert mock_stac_io.mock.read_text.call_count == 1
+
+
+def test_search(grid_catalog: pystac.Catalog) -> None:
+    item_collection = ItemCollection(
+        grid_catalog.get_items(recursive=True), extra_fields={"foo": "bar"}
+    )
+    found = item_collection.search(bbox=[-0.5, 3.5, 0.5, 10])
+    assert [item.id for item in found] == ["-1_3", "-1_4", "0_3", "0_4"]
+    assert found.extra_fields == {"foo": "bar"}
+    assert found[0] is item_collection[4 * 5 + 3]
+
+    triangle = {
+        "type": "Polygon",
+        "coordinates": [[[0.5, 0.5], [2.3, 0.5], [0.5, 2.3], [0.5, 0.5]]],
+    }
+    found = item_collection.search(intersects=triangle)
+    assert [item.id for item in found] == ["0_0", "0_1", "0_2", "1_0", "1_1", "2_0"]
+
+    assert len(item_collection.search()) == 50
+
+
+def test_search_index_follows_items(grid_catalog: pystac.Catalog) -> None:
+    item_collection = ItemCollection(grid_catalog.get_items(recursive=True))
+    assert len(item_collection.search(bbox=[10.5, 0.5, 10.5, 0.5])) == 0
+
+    item = item_collection[0].clone()
+    item.id = "moved"
+    item.bbox = [10, 0, 11, 1]
+    item_collection.items.append(item)
+    assert [i.id for i in item_collection.search(bbox=[10.5, 0.5, 10.5, 0.5])] == [
+        "moved"
+    ]
+
+    item.bbox = [20, 0, 21, 1]
+    item_collection.clear_search_index()
+    assert len(item_collection.search(bbox=[10.5, 0.5, 10.5, 0.5])) == 0
+
+
+def test_search_by_datetime(grid_catalog: pystac.Catalog) -> None:
+    item_collection = ItemCollection(grid_catalog.get_items(recursive=True))
+    found = item_collection.search(datetime="2019-01-02/2019-01-03")
+    assert {item.id.split("_")[1] for item in found} == {"1", "2"}
+    assert all(item.id.startswith("-") for item in found)
+    assert len(found) == 10
+
+    # East items cover a day from their start to their end datetime
+    found = item_collection.search(
+        bbox=[0.5, 0, 1.5, 5], datetime="2020-01-03T12:00:00Z"
+    )
+    assert [item.id for item in found] == ["0_2", "1_2"]
+    found = item_collection.search(bbox=[0.5, 0, 0.5, 5], datetime="2020-01-03/..")
+    assert [item.id for item in found] == ["0_1", "0_2", "0_3", "0_4"]
+
+
+def test_iter_file(items: list[Item]) -> None:
+    read = ItemCollection.iter_file(ITEM_COLLECTION)
+    assert [i.to_dict(transform_hrefs=False) for i in read] == [
+        i.to_dict(transform_hrefs=False) for i in items
+    ]
+
+
+def test_lazy_items(
+    tmp_path: Any, item_collection_dict: dict[str, Any], items: list[Item]
+) -> None:
+    href = str(tmp_path / "items.ndjson")
+    ItemCollection.write_ndjson(href, items)
+    for read in (
+        ItemCollection.from_dict(item_collection_dict, lazy=True),
+        ItemCollection.iter_file(ITEM_COLLECTION, lazy=True),
+        ItemCollection.iter_ndjson(href, lazy=True),
+    ):
+        read_items = list(read)
+        assert all("_lazy_assets" in item.__dict__ for item in read_items)
+        assert [i.to_dict(transform_hrefs=False) for i in read_items] == [
+            i.to_dict(transform_hrefs=False) for i in items
+        ]
+
+
+def test_write_and_iter_ndjson(tmp_path: Any, items: list[Item]) -> None:
+    href = str(tmp_path / "items.ndjson")
+    dicts = [items[1].to_dict(transform_hrefs=False)]
+    ItemCollection.write_ndjson(href, [items[0], *dicts])
+    with open(href) as f:
+        assert len(f.readlines()) == 2
+
+    read = list(ItemCollection.iter_ndjson(href))
+    assert [i.to_dict(transform_hrefs=False) for i in read] == [
+        i.to_dict(transform_hrefs=False) for i in items[:2]
+    ]
+
+    copy = str(tmp_path / "copy.ndjson")
+    ItemCollection.write_ndjson(copy, ItemCollection.iter_ndjson(href))
+    with open(href) as a, open(copy) as b:
+        assert a.read() == b.read()
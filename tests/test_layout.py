@@ -1,3 +1,4 @@
+import pickle
 import posixpath
 from collections.abc import Callable
 from datetime import datetime, timedelta
@@ -189,6 +190,28 @@ class TestLayoutTemplate:
         path3 = template3.substitute(item)
         assert path3 == "landsat-8-l1/CC-BY-3.0"
 
+    def test_substitute_repeated_variables_and_literal_braces(self) -> None:
+        template = LayoutTemplate("{{x}}/${year}/${id}-${year}")
+        item = pystac.Item("an-id", None, None, datetime(2020, 1, 2), {})
+        assert template.substitute(item) == "{{x}}/2020/an-id-2020"
+
+    def test_template_can_be_changed_and_pickled(self) -> None:
+        item = pystac.Item("an-id", None, None, datetime(2020, 1, 2), {})
+        template = LayoutTemplate("${year}/${id}")
+        assert template.substitute(item) == "2020/an-id"
+
+        template.template = "${day}/${id}"
+        template.template_vars = ["day", "id"]
+        assert template.substitute(item) == "2/an-id"
+
+        copied = pickle.loads(pickle.dumps(template))
+        assert copied.substitute(item) == "2/an-id"
+
+    def test_non_item_variable_error_ignores_defaults(self) -> None:
+        template = LayoutTemplate("${year}/catalog.json", defaults={"year": "2020"})
+        with pytest.raises(pystac.TemplateError, match="non-Item"):
+            template.substitute(pystac.Catalog("an-id", "a description"))
+
 
 class TestCustomLayoutStrategy:
     def get_custom_catalog_func(self) -> Callable[[pystac.Catalog, str, bool], str]:
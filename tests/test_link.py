@@ -1,5 +1,6 @@
 import json
 import os
+import pickle
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -10,8 +11,9 @@ import pytest
 import pystac
 from pystac import Collection, Item, Link
 from pystac.errors import STACError
-from pystac.link import HIERARCHICAL_LINKS
+from pystac.link import HIERARCHICAL_LINKS, _caching_hrefs
 from pystac.utils import make_posix_style
+from tests.utils import TestCases
 from tests.utils.test_cases import ARBITRARY_EXTENT
 
 TEST_DATETIME: datetime = datetime(2020, 3, 14, 16, 32)
@@ -21,9 +23,23 @@ def test_path_like() -> None:
     rel = "some-rel"
     target = os.path.abspath("../elsewhere")
     link = pystac.Link(rel, target)
+    assert isinstance(link, os.PathLike)
     assert os.fspath(link) == make_posix_style(target)
 
 
+def test_slots() -> None:
+    link = pystac.Link("child", "./child.json")
+    assert not hasattr(link, "__dict__")
+    assert link._extra_fields is None
+    assert link.to_dict() == {"rel": "child", "href": "./child.json"}
+
+    link.extra_fields["foo"] = "bar"
+    assert link.to_dict()["foo"] == "bar"
+
+    roundtripped = pickle.loads(pickle.dumps(link))
+    assert roundtripped.to_dict() == link.to_dict()
+
+
 def test_minimal(item: pystac.Item) -> None:
     rel = "my rel"
     target = "https://example.com/a/b"
@@ -90,6 +106,39 @@ def test_resolve_stac_object_no_root_and_target_is_item(item: pystac.Item) -> No
     link.resolve_stac_object()
 
 
+def test_resolve_stac_object_copies_and_migrates_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    copies: list[Any] = []
+    migrations: list[dict[str, Any]] = []
+    original_deepcopy = pystac.stac_io.deepcopy
+    original_migrate = pystac.stac_io.migrate_to_latest
+
+    def counting_deepcopy(x: Any) -> Any:
+        copies.append(x)
+        return original_deepcopy(x)
+
+    def counting_migrate(d: dict[str, Any], *args: Any, **kwargs: Any) -> Any:
+        migrations.append(d)
+        return original_migrate(d, *args, **kwargs)
+
+    for module in (pystac.stac_io, pystac.serialization.migrate, pystac.item):
+        monkeypatch.setattr(module, "deepcopy", counting_deepcopy)
+    for module in (pystac.stac_io, pystac.item):
+        monkeypatch.setattr(module, "migrate_to_latest", counting_migrate)
+
+    href = TestCases.get_path("data-files/item/sample-item.json")
+    link = pystac.Link("item", href)
+    assert isinstance(link.resolve_stac_object().target, Item)
+    assert copies == []
+    assert len(migrations) == 1
+
+    d = pystac.StacIO.default().read_json(href)
+    pystac.StacIO.default().stac_object_from_dict(d, href=href)
+    assert copies == [d]
+    assert len(migrations) == 2
+
+
 @pytest.mark.skipif(os.name == "nt", reason="Non-windows test")
 def test_resolve_stac_object_throws_informative_error() -> None:
     link = pystac.Link("root", target="/a/b/foo.json")
@@ -277,6 +326,12 @@ def test_inheritance_from_dict() -> None:
     assert isinstance(link, CustomLink)
 
 
+def test_inheritance_allows_new_attributes() -> None:
+    link = CustomLink("r", "t")
+    link.custom = "value"  # type: ignore[attr-defined]
+    assert pickle.loads(pickle.dumps(link)).custom == "value"
+
+
 def test_inheritance_collection(collection: Collection) -> None:
     link = CustomLink.collection(collection)
     assert isinstance(link, CustomLink)
@@ -343,3 +398,35 @@ def test_item_link_type(item: Item) -> None:
     # https://github.com/stac-utils/pystac/issues/1494
     link = Link.item(item)
     assert link.media_type == "application/geo+json"
+
+
+def test_caching_hrefs_matches_uncached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    catalog = pystac.Catalog("root", "a catalog")
+    items = [Item(f"item-{i}", None, None, datetime(2020, 1, 1), {}) for i in range(3)]
+    for item in items:
+        catalog.add_item(item)
+    catalog.normalize_hrefs(str(tmp_path), skip_unresolved=True)
+    items[1].add_link(Link("derived_from", items[0]))
+    items[2].add_link(Link("derived_from", items[0].self_href))
+    items[2].add_link(Link("license", "https://example.com/license"))
+    catalog.catalog_type = pystac.CatalogType.SELF_CONTAINED
+
+    expected = [item.to_dict() for item in items]
+    with _caching_hrefs():
+        assert [item.to_dict() for item in items] == expected
+    assert expected[1]["links"][-1]["href"] == "../item-0/item-0.json"
+    # Only objects in the hierarchy match, not their HREFs
+    assert expected[2]["links"][-2]["href"] == items[0].self_href
+    assert expected[2]["links"][-1]["href"] == "https://example.com/license"
+
+    expected_saved = items[2].to_dict(include_self_link=False)
+
+    def fail(*_: Any) -> bool:
+        raise AssertionError("target_in_hierarchy should not be called")
+
+    monkeypatch.setattr(pystac.Catalog, "target_in_hierarchy", fail)
+    catalog.save()
+    with open(items[2].self_href) as f:
+        assert json.load(f) == expected_saved
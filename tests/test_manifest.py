@@ -0,0 +1,135 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import pystac
+from pystac import Catalog, CatalogType
+from pystac.errors import STACError
+from pystac.manifest import MANIFEST_FILE_NAME, CatalogManifest
+from pystac.utils import HREF
+
+
+class ReadRecordingStacIO(pystac.stac_io.DefaultStacIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.read: list[str] = []
+
+    def read_text(self, source: HREF, *_: Any, **__: Any) -> str:
+        self.read.append(str(source))
+        return super().read_text(source)
+
+
+@pytest.fixture
+def catalog_href(tmp_path: Path, test_case_1_catalog: Catalog) -> str:
+    test_case_1_catalog.normalize_and_save(str(tmp_path), CatalogType.SELF_CONTAINED)
+    written = test_case_1_catalog.save(manifest=True)
+    assert written[-1] == str(tmp_path / MANIFEST_FILE_NAME)
+    return str(tmp_path / "catalog.json")
+
+
+def test_manifest_lists_all_children_and_items(
+    tmp_path: Path, catalog_href: str, test_case_1_catalog: Catalog
+) -> None:
+    with open(tmp_path / MANIFEST_FILE_NAME) as f:
+        manifest = CatalogManifest.from_dict(json.load(f))
+
+    expected_items = {item.id for item in test_case_1_catalog.get_items(recursive=True)}
+    assert set(manifest.items) == expected_items
+    expected_children = {c.id for c in test_case_1_catalog.get_all_collections()}
+    assert expected_children <= set(manifest.children)
+
+    for entries in manifest.items.values():
+        for entry in entries:
+            assert (tmp_path / entry.href).is_file()
+            for parent in entry.parents:
+                assert (tmp_path / parent).is_file()
+
+
+def test_get_items_reads_only_path(catalog_href: str) -> None:
+    expected = list(Catalog.from_file(catalog_href).get_items(recursive=True))[-1]
+
+    stac_io = ReadRecordingStacIO()
+    catalog = Catalog.from_file(catalog_href, stac_io=stac_io, manifest=True)
+    stac_io.read.clear()
+
+    item = next(catalog.get_items(expected.id, recursive=True))
+    assert item.id == expected.id
+    assert item.get_root() is catalog
+    # The item and each catalog between it and the root
+    assert stac_io.read[-1] == item.self_href
+    assert len(stac_io.read) == len(item.self_href.split("/")) - len(
+        catalog.self_href.split("/")
+    )
+
+
+def test_get_child_uses_manifest(catalog_href: str) -> None:
+    stac_io = ReadRecordingStacIO()
+    catalog = Catalog.from_file(catalog_href, stac_io=stac_io, manifest=True)
+    stac_io.read.clear()
+
+    child = catalog.get_child("area-2-2", recursive=True)
+    assert child is not None and child.id == "area-2-2"
+    assert len(stac_io.read) == 2
+
+
+def test_lookup_falls_back_to_walk(catalog_href: str) -> None:
+    catalog = Catalog.from_file(catalog_href, manifest=True)
+    assert catalog._manifest is not None
+    entries = catalog._manifest.items.pop("area-1-1-imagery")
+    catalog._manifest.items["moved"] = entries
+
+    assert [i.id for i in catalog.get_items("area-1-1-imagery", recursive=True)] == [
+        "area-1-1-imagery"
+    ]
+    assert list(catalog.get_items("moved", recursive=True)) == []
+
+
+def test_incremental_save_keeps_manifest_without_reading(
+    tmp_path: Path, catalog_href: str
+) -> None:
+    stac_io = ReadRecordingStacIO()
+    catalog = Catalog.from_file(catalog_href, stac_io=stac_io, manifest=True)
+    item = next(catalog.get_items("area-1-1-imagery", recursive=True))
+    item.common_metadata.title = "Changed"
+    stac_io.read.clear()
+
+    written = catalog.save(incremental=True)
+    assert written == [item.self_href, str(tmp_path / MANIFEST_FILE_NAME)]
+    assert stac_io.read == []
+
+    with open(tmp_path / MANIFEST_FILE_NAME) as f:
+        assert CatalogManifest.from_dict(json.load(f)) == catalog._manifest
+
+
+def test_from_dict_rejects_other_files() -> None:
+    with pytest.raises(STACError, match="catalog manifest"):
+        CatalogManifest.from_dict({"type": "Catalog"})
+
+
+def test_search_reads_only_matching_items(
+    tmp_path: Path, grid_catalog: Catalog
+) -> None:
+    grid_catalog.normalize_and_save(str(tmp_path), CatalogType.SELF_CONTAINED)
+    grid_catalog.save(manifest=True)
+    with open(tmp_path / MANIFEST_FILE_NAME) as f:
+        assert "spatial_index" in json.load(f)
+
+    stac_io = ReadRecordingStacIO()
+    catalog = Catalog.from_file(
+        str(tmp_path / "catalog.json"), stac_io=stac_io, manifest=True
+    )
+    stac_io.read.clear()
+
+    found = catalog.search(bbox=[-0.5, 2.5, 0.5, 2.5])
+    assert sorted(item.id for item in found) == ["-1_2", "0_2"]
+    assert sorted(stac_io.read) == [
+        str(tmp_path / "east" / "0_2" / "0_2.json"),
+        str(tmp_path / "east" / "collection.json"),
+        str(tmp_path / "west" / "-1_2" / "-1_2.json"),
+        str(tmp_path / "west" / "collection.json"),
+    ]
+
+    point = {"type": "Point", "coordinates": [0.5, 2.5]}
+    assert [item.id for item in catalog.search(intersects=point)] == ["0_2"]
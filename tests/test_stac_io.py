@@ -1,13 +1,27 @@
+import asyncio
+import gzip
 import json
 import os
 import tempfile
+import threading
 import unittest
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 import pystac
-from pystac.stac_io import DefaultStacIO, DuplicateKeyReportingMixin, StacIO
+from pystac.stac_io import (
+    AsyncStacIO,
+    DefaultAsyncStacIO,
+    DefaultStacIO,
+    DuplicateKeyReportingMixin,
+    PooledStacIO,
+    StacIO,
+)
+from pystac.utils import HREF
 from tests.utils import TestCases
 
 
@@ -163,3 +177,280 @@ def test_save_http_href_errors(tmp_path: Path) -> None:
     catalog.set_self_href("http://pystac.test/catalog.json")
     with pytest.raises(NotImplementedError):
         catalog.save_object()
+
+
+def test_default_async_stac_io_reads_and_writes(tmp_path: Path) -> None:
+    stac_io = AsyncStacIO.default()
+    assert isinstance(stac_io, DefaultAsyncStacIO)
+    src = TestCases.get_path("data-files/item/sample-item.json")
+    dest = str(tmp_path / "item.json")
+
+    async def copy() -> pystac.STACObject:
+        d = await stac_io.read_json(src)
+        await stac_io.save_json(dest, d)
+        return await stac_io.read_stac_object(dest)
+
+    item = asyncio.run(copy())
+    assert isinstance(item, pystac.Item)
+    assert item.get_self_href() == dest
+
+
+def test_async_catalog_walk_matches_walk() -> None:
+    href = TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+
+    async def walk() -> list[tuple[str, list[str], list[str]]]:
+        catalog = await pystac.Catalog.from_file_async(href)
+        return [
+            (root.id, [c.id for c in children], [i.id for i in items])
+            async for root, children, items in catalog.walk_async()
+        ]
+
+    expected = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in pystac.Catalog.from_file(href).walk()
+    ]
+    assert asyncio.run(walk()) == expected
+
+
+def test_async_get_items_uses_catalog_stac_io() -> None:
+    href = TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    sources: list[str] = []
+
+    class RecordingAsyncStacIO(DefaultAsyncStacIO):
+        async def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+            sources.append(str(source))
+            return await super().read_text(source, *args, **kwargs)
+
+    async def get_items() -> list[pystac.Item]:
+        catalog = await pystac.Catalog.from_file_async(
+            href, stac_io=RecordingAsyncStacIO()
+        )
+        return [item async for item in catalog.get_items_async(recursive=True)]
+
+    items = asyncio.run(get_items())
+    assert len(items) == 8
+    # 1 root catalog, 6 sub-catalogs and collections, 8 items
+    assert len(sources) == 15
+    assert all(item.get_root() is items[0].get_root() for item in items)
+
+
+def test_async_get_items_filters_ids() -> None:
+    catalog = pystac.Catalog.from_file(
+        TestCases.get_path("data-files/catalogs/test-case-1/catalog.json")
+    )
+
+    async def get_items() -> list[str]:
+        return [
+            item.id
+            async for item in catalog.get_items_async(
+                "area-2-1-imagery", "area-1-1-labels", recursive=True
+            )
+        ]
+
+    assert asyncio.run(get_items()) == ["area-1-1-labels", "area-2-1-imagery"]
+
+
+class _CatalogRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures: dict[str, int] = {}
+
+    def do_GET(self) -> None:
+        if self.path in ("/redirect", "/redirect-away"):
+            port = self.server.server_address[1]
+            self.send_response(302)
+            if self.path == "/redirect":
+                self.send_header("Location", "/catalog.json")
+            else:
+                self.send_header("Location", f"http://localhost:{port}/auth")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.failures.get(self.path, 0) > 0:
+            self.failures[self.path] -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path not in ("/catalog.json", "/auth", "/close"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        id = "test"
+        if self.path == "/auth":
+            id = self.headers.get("Authorization", "anonymous")
+        elif self.path == "/close":
+            # Close the connection without telling the client
+            self.close_connection = True
+        body = json.dumps(pystac.Catalog(id, "test").to_dict()).encode()
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def http_server() -> Iterator[str]:
+    _CatalogRequestHandler.failures = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CatalogRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_pooled_stac_io_reuses_connections(http_server: str) -> None:
+    stac_io = PooledStacIO()
+    for _ in range(3):
+        catalog = pystac.Catalog.from_file(
+            f"{http_server}/catalog.json", stac_io=stac_io
+        )
+        assert catalog.id == "test"
+    stac_io.close()
+
+    assert stac_io.stats.requests == 3
+    assert stac_io.stats.new_connections == 1
+    assert stac_io.stats.reused_connections == 2
+    assert stac_io.stats.bytes > 0
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_pooled_stac_io_retries(http_server: str) -> None:
+    _CatalogRequestHandler.failures["/catalog.json"] = 2
+    stac_io = PooledStacIO(backoff_factor=0)
+    assert stac_io.read_json(f"{http_server}/catalog.json")["id"] == "test"
+    stac_io.close()
+    assert stac_io.stats.retries == 2
+    assert stac_io.stats.requests == 3
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_pooled_stac_io_follows_redirects(http_server: str) -> None:
+    stac_io = PooledStacIO()
+    assert stac_io.read_json(f"{http_server}/redirect")["id"] == "test"
+    stac_io.close()
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1", "localhost"])
+def test_pooled_stac_io_drops_headers_on_redirect_to_other_host(
+    http_server: str,
+) -> None:
+    stac_io = PooledStacIO(headers={"Authorization": "secret"})
+    assert stac_io.read_json(f"{http_server}/auth")["id"] == "secret"
+    assert stac_io.read_json(f"{http_server}/redirect-away")["id"] == "anonymous"
+    stac_io.close()
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_pooled_stac_io_resends_on_closed_connection(http_server: str) -> None:
+    stac_io = PooledStacIO(retries=0)
+    for _ in range(3):
+        assert stac_io.read_json(f"{http_server}/close")["id"] == "test"
+    stac_io.close()
+    # The second and third requests fail on the connection closed by the server,
+    # and are sent again over a new one.
+    assert stac_io.stats.requests == 5
+    assert stac_io.stats.new_connections == 3
+    assert stac_io.stats.retries == 0
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_pooled_stac_io_raises_for_error_status(http_server: str) -> None:
+    _CatalogRequestHandler.failures["/catalog.json"] = 2
+    stac_io = PooledStacIO(retries=1, backoff_factor=0)
+    with pytest.raises(Exception, match="Could not read uri"):
+        stac_io.read_text(f"{http_server}/catalog.json")
+    with pytest.raises(Exception, match="Could not read uri"):
+        stac_io.read_text(f"{http_server}/missing.json")
+    stac_io.close()
+
+
+def _chunked(text: str, size: int) -> Iterator[str]:
+    for i in range(0, len(text), size):
+        yield text[i : i + size]
+
+
+class ChunkedStacIO(DefaultStacIO):
+    def __init__(self, text: str, size: int) -> None:
+        super().__init__()
+        self.text = text
+        self.size = size
+
+    def read_text_chunks(self, source: HREF) -> Iterator[str]:
+        return _chunked(self.text, self.size)
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1000])
+def test_read_features_across_chunks(size: int) -> None:
+    features = [
+        {"id": "a", "n": 12345, "s": 'é \\" ,]}', "x": [1.5, None, True]},
+        {"id": "b", "nested": {"features": []}},
+    ]
+    text = json.dumps(
+        {"type": "FeatureCollection", "meta": {"a": [1]}, "features": features, "n": 3},
+        indent=1,
+    )
+    assert list(ChunkedStacIO(text, size).read_features("x")) == features
+
+
+def test_read_features_empty_and_invalid() -> None:
+    assert list(ChunkedStacIO('{"features": [] }', 3).read_features("x")) == []
+    assert list(ChunkedStacIO("{}", 3).read_features("x")) == []
+    with pytest.raises(json.JSONDecodeError):
+        list(ChunkedStacIO('{"features": [{"id": 1}', 3).read_features("x"))
+    with pytest.raises(json.JSONDecodeError):
+        list(ChunkedStacIO("[]", 3).read_features("x"))
+
+
+@pytest.mark.parametrize("size", [1, 4, 1000])
+def test_read_ndjson_across_chunks(size: int) -> None:
+    text = '{"id": "a"}\r\n\n{"id": "bb"}\n{"id": 3}'
+    assert list(ChunkedStacIO(text, size).read_ndjson("x")) == [
+        {"id": "a"},
+        {"id": "bb"},
+        {"id": 3},
+    ]
+
+
+def test_save_and_read_ndjson(tmp_path: Path) -> None:
+    dest = tmp_path / "sub" / "items.ndjson"
+    dicts = [{"id": str(i), "properties": {"v": [i, "\n"]}} for i in range(3)]
+    DefaultStacIO().save_ndjson(dest, iter(dicts))
+    assert len(dest.read_text().splitlines()) == 3
+    assert list(DefaultStacIO().read_ndjson(dest)) == dicts
+
+
+def test_streaming_uses_overridden_read_and_write(tmp_path: Path) -> None:
+    class RecordingStacIO(DefaultStacIO):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls: list[str] = []
+
+        def read_text_from_href(self, href: str) -> str:
+            self.calls.append("read")
+            return super().read_text_from_href(href)
+
+        def write_text_to_href(self, href: str, txt: str) -> None:
+            self.calls.append("write")
+            super().write_text_to_href(href, txt)
+
+    stac_io = RecordingStacIO()
+    dest = str(tmp_path / "items.ndjson")
+    stac_io.save_ndjson(dest, [{"id": "a"}, {"id": "b"}])
+    assert list(stac_io.read_ndjson(dest)) == [{"id": "a"}, {"id": "b"}]
+    assert stac_io.calls == ["write", "read"]
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_read_text_lines_from_url(http_server: str) -> None:
+    stac_io = DefaultStacIO()
+    href = f"{http_server}/catalog.json"
+    assert list(stac_io.read_text_lines(href)) == stac_io.read_text(href).splitlines()
@@ -1,9 +1,20 @@
+import pickle
 import socket
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 import pytest
 
-from pystac.summaries import RangeSummary, Summaries, Summarizer, SummaryStrategy
+from pystac import Catalog, CatalogType, Item
+from pystac.summaries import (
+    HyperLogLog,
+    RangeSummary,
+    Summaries,
+    Summarizer,
+    SummaryStrategy,
+)
 from tests.utils import TestCases
 
 
@@ -104,3 +115,76 @@ def test_RangeSummary_equality() -> None:
     assert rs_1 == rs_2
     assert rs_1 != rs_3
     assert rs_1 != (5, 10)
+
+
+def test_range_summary_slots() -> None:
+    summary = RangeSummary(minimum=1, maximum=2)
+    assert not hasattr(summary, "__dict__")
+    assert pickle.loads(pickle.dumps(summary)) == summary
+
+
+def test_summarize_with_workers(tmp_path: Path) -> None:
+    catalog = TestCases.case_5()
+    catalog.normalize_and_save(str(tmp_path), CatalogType.SELF_CONTAINED)
+    expected = Summarizer().summarize(catalog).to_dict()
+
+    read = Catalog.from_file(str(tmp_path / "catalog.json"))
+    assert Summarizer().summarize(read, max_workers=2).to_dict() == expected
+
+    # Children already read are summarized in the calling thread
+    next(read.get_children())
+    with ThreadPoolExecutor(1) as executor:
+        summaries = Summarizer().summarize(read, executor=executor)
+    assert summaries.to_dict() == expected
+
+
+def test_accumulator_merge_and_pickle() -> None:
+    items = list(TestCases.case_5().get_items(recursive=True))
+    summarizer = Summarizer()
+    expected = summarizer.summarize(items).to_dict()
+
+    first = summarizer.accumulate(items[: len(items) // 2])
+    second = pickle.loads(pickle.dumps(summarizer.accumulate(items[len(items) // 2 :])))
+    assert first.merge(second).to_summaries().to_dict() == expected
+
+
+def test_max_distinct() -> None:
+    items = [
+        Item(str(i), None, None, datetime(2020, 1, 1), {"platform": f"p{i}"})
+        for i in range(100)
+    ]
+    summarizer = Summarizer({"platform": SummaryStrategy.ARRAY}, max_distinct=10)
+    accumulator = summarizer.accumulate(items[:50])
+    assert accumulator.cardinality("platform") == 50
+    assert "platform" in accumulator.sketches
+    assert summarizer.summarize(items).to_dict() == {}
+
+    small = summarizer.accumulate(items[50:55])
+    assert small.to_summaries().to_dict() == {
+        "platform": ["p50", "p51", "p52", "p53", "p54"]
+    }
+    assert accumulator.merge(small).merge(
+        summarizer.accumulate(items[45:])
+    ).cardinality("platform") == pytest.approx(100, abs=5)
+
+
+def test_unhashable_values() -> None:
+    bands = [[{"name": "red"}], [{"name": "red"}], [{"name": "nir"}]]
+    items = [
+        Item(str(i), None, None, datetime(2020, 1, 1), {"bands": b})
+        for i, b in enumerate(bands)
+    ]
+    summaries = Summarizer({"bands": SummaryStrategy.ARRAY}).summarize(items)
+    assert summaries.to_dict() == {"bands": [{"name": "red"}, {"name": "nir"}]}
+
+
+def test_hyperloglog() -> None:
+    a, b = HyperLogLog(), HyperLogLog()
+    for i in range(20000):
+        a.add(i)
+        b.add(i + 10000)
+    assert a.estimate() == pytest.approx(20000, rel=0.05)
+    a.merge(b)
+    assert a.estimate() == pytest.approx(30000, rel=0.05)
+    with pytest.raises(ValueError):
+        a.merge(HyperLogLog(precision=10))
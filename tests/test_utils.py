@@ -2,6 +2,8 @@ import json
 import os
 import time
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import urlparse
 
 import pytest
 from dateutil import tz
@@ -14,6 +16,7 @@ from pystac.utils import (
     is_file_path,
     join_path_or_url,
     make_absolute_href,
+    make_posix_style,
     make_relative_href,
     now_in_utc,
     now_to_rfc3339_str,
@@ -153,6 +156,27 @@ def test_make_absolute_href_on_vsitar() -> None:
     assert expected == make_absolute_href(rel_path, cat_path)
 
 
+def test_make_absolute_href_follows_working_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        monkeypatch.chdir(tmp_path / name)
+        expected = make_posix_style(str(tmp_path / name / "item.json"))
+        _, expected = os.path.splitdrive(expected)
+        _, actual = os.path.splitdrive(make_absolute_href("item.json"))
+        assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "href",
+    ["/a/b.json", "/a b/é.json", "/a/b;c", "/a/b?c#d", "/a\tb", "//a/b", "/"],
+)
+def test_safe_urlparse_of_absolute_path(href: str) -> None:
+    utils.clear_href_caches()
+    assert safe_urlparse(href) == urlparse(href)
+
+
 @pytest.mark.skipif(os.name != "nt", reason="Windows only test")
 @pytest.mark.parametrize(
     "source_href, start_href, expected",
@@ -261,3 +261,30 @@ def test_404_schema_url(requests_mock: Mocker, item: pystac.Item) -> None:
         GetSchemaError, match="http://pystac-extensions.test/a-fake.schema.json"
     ):
         item.validate()
+
+
+@pytest.mark.block_network
+def test_validators_and_registry_are_reused(item: pystac.Item) -> None:
+    validator = JsonSchemaSTACValidator()
+    d = item.to_dict(include_self_link=False, transform_hrefs=False)
+    schema_uri = validator.validate_core(
+        d, pystac.STACObjectType.ITEM, pystac.get_stac_version()
+    )
+    assert schema_uri is not None
+    compiled = validator._validators[schema_uri]
+    registry = validator.registry
+
+    validator.validate_core(d, pystac.STACObjectType.ITEM, pystac.get_stac_version())
+    assert validator._validators[schema_uri] is compiled
+    assert validator.registry is registry
+
+    validator.schema_cache["https://example.com/schema.json"] = {
+        "$schema": "http://json-schema.org/draft-07/schema#"
+    }
+    assert validator.registry is not registry
+
+    d["type"] = "Collection"
+    with pytest.raises(pystac.STACValidationError):
+        validator.validate_core(
+            d, pystac.STACObjectType.ITEM, pystac.get_stac_version()
+        )